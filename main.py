@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI
 import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,11 +20,32 @@ from src.api.v1.routes.user import routers as user_routers
 from src.api.v1.routes.project import routers as project_routers
 from src.api.v1.routes.community import routers as community_routers
 from src.api.v1.routes.mentoring import routers as mentoring_routers
+from src.api.v1.routes.internal import routers as internal_routers
+
+from src.core.utils.chat_writer import chat_writer
+from src.core.utils.chat_websocket import broadcast_backend
+from src.core.utils.sse_manager import sse_hub
+from src.core.utils.project_events import project_event_publisher
+from src.core.utils.view_counter import view_counter
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  # 스레드 풀에서 커밋된 프로젝트 변경 이벤트를 이 루프에서 발행
+  project_event_publisher.bind_loop(asyncio.get_running_loop())
+  # 조회수 버퍼를 주기적으로 반영
+  view_counter.start()
+  yield
+  # 종료 전 쓰기 대기 중인 채팅 메시지와 조회수 저장
+  await chat_writer.close()
+  await view_counter.close()
+  await broadcast_backend.close()
+  await sse_hub.close()
 
 app = FastAPI(
   title=setting.TITLE,
   description=setting.SUMMARY,
-  version=setting.VERSION
+  version=setting.VERSION,
+  lifespan=lifespan
 )
 
 app.add_middleware(
@@ -31,6 +54,7 @@ app.add_middleware(
   allow_credentials=True,
   allow_methods=["*"],
   allow_headers=["*"],  # Authorization 포함됨
+  expose_headers=["X-Next-Cursor", "X-Recommendations-Computed-At"],  # 브라우저에서 읽을 수 있도록 노출 (다음 페이지 커서, 추천 계산 시각)
 )
 
 app.add_middleware(ErrorHandlingMiddleware)
@@ -53,6 +77,10 @@ for router in community_routers:
 for router in mentoring_routers:
     app.include_router(router)
 
+# Include internal routers (운영 지표)
+for router in internal_routers:
+    app.include_router(router)
+
 @app.get("/")
 async def root():
   """API 루트 엔드포인트"""
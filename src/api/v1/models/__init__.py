@@ -11,6 +11,7 @@ from src.api.v1.models.user.interest import UserInterest
 from src.api.v1.models.user.social_link import UserSocialLink
 from src.api.v1.models.user.session import UserSession
 from src.api.v1.models.project.milestone import Milestone
+from src.api.v1.models.project.project_stat import ProjectStat, MilestoneStat
 from src.api.v1.models.project.participation_request import ParticipationRequest
 from src.api.v1.models.project.schedule import Schedule
 from src.api.v1.models.project.channel import Channel
@@ -19,6 +20,8 @@ from src.api.v1.models.mentoring.mentor import Mentor
 from src.api.v1.models.mentoring.mentor_review import MentorReview
 from src.api.v1.models.mentoring.mentor_session import MentorSession
 from src.api.v1.models.community.post import Post, PostReaction, PostComment
+from src.api.v1.models.community.post_stat import PostStat
+from src.api.v1.models.community.post_tag import PostTag
 
 __all__ = [
     'User',
@@ -32,6 +35,8 @@ __all__ = [
     'UserSocialLink',
     'UserSession',
     'Milestone',
+    'ProjectStat',
+    'MilestoneStat',
     'ParticipationRequest',
     'Schedule',
     'Channel',
@@ -42,6 +47,8 @@ __all__ = [
     'Post',
     'PostReaction',
     'PostComment',
+    'PostStat',
+    'PostTag',
     'BaseModel',
     # Add other models here
 ]
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from src.core.database.database import Base
+from src.api.v1.models.base import BaseModel
+
+class PostStat(Base, BaseModel):
+  """게시글 반응 카운터 모델"""
+  __tablename__ = "post_stats"
+  
+  post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+  
+  # 반응 종류별 카운터 (reaction_type + "_count")
+  like_count = Column(Integer, default=0, nullable=False)
+  dislike_count = Column(Integer, default=0, nullable=False)
+  view_count = Column(Integer, default=0, nullable=False)
+  share_count = Column(Integer, default=0, nullable=False)
+  comment_count = Column(Integer, default=0, nullable=False)
+  
+  def __repr__(self):
+    return f"<PostStat(post_id={self.post_id}, likes={self.like_count}, views={self.view_count})>"
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Index, Integer, String, ForeignKey
+from src.core.database.database import Base
+from src.api.v1.models.base import BaseModel
+
+class PostTag(Base, BaseModel):
+  """게시글 태그 모델 (posts.tags JSON을 정규화한 색인 테이블)"""
+  __tablename__ = "post_tags"
+  
+  post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+  tag = Column(String(100), primary_key=True)
+  
+  # created_at은 태그가 게시글에 붙은 시각 (기간별 인기 태그 집계 기준)
+  __table_args__ = (
+    Index("idx_post_tags_tag_post", "tag", "post_id"),
+    Index("idx_post_tags_created_tag", "created_at", "tag"),
+  )
+  
+  def __repr__(self):
+    return f"<PostTag(post_id={self.post_id}, tag={self.tag})>"
@@ -5,4 +5,5 @@ from src.api.v1.models.project.participation_request import *
 from src.api.v1.models.project.schedule import *
 from src.api.v1.models.project.channel import *
 from src.api.v1.models.project.chat import *
-from src.api.v1.models.project.whiteboard import *
\ No newline at end of file
+from src.api.v1.models.project.whiteboard import *
+from src.api.v1.models.project.project_stat import *
\ No newline at end of file
@@ -29,6 +29,9 @@ class Project(Base, BaseModel):
     location = Column(String(255), nullable=True)
     github_url = Column(String(255), nullable=True)
     
+    # 변경 이벤트 버전 (SSE 클라이언트의 누락 감지용)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # 관계 정의
     owner = relationship(
         "User", 
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from src.core.database.database import Base
+from src.api.v1.models.base import BaseModel
+
+class ProjectStat(Base, BaseModel):
+  """프로젝트 통계 카운터 모델"""
+  __tablename__ = "project_stats"
+  
+  project_id = Column(String(6), ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+  
+  # 업무 카운터
+  total_tasks = Column(Integer, default=0, nullable=False)
+  completed_tasks = Column(Integer, default=0, nullable=False)
+  
+  # 마일스톤 카운터
+  total_milestones = Column(Integer, default=0, nullable=False)
+  completed_milestones = Column(Integer, default=0, nullable=False)
+  
+  # 하위 업무 카운터
+  total_subtasks = Column(Integer, default=0, nullable=False)
+  completed_subtasks = Column(Integer, default=0, nullable=False)
+  
+  def __repr__(self):
+    return f"<ProjectStat(project_id='{self.project_id}', completed_tasks={self.completed_tasks}/{self.total_tasks})>"
+    
+class MilestoneStat(Base, BaseModel):
+  """마일스톤 통계 카운터 모델"""
+  __tablename__ = "milestone_stats"
+  
+  milestone_id = Column(Integer, ForeignKey("milestones.id", ondelete="CASCADE"), primary_key=True)
+  project_id = Column(String(6), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
+  
+  # 업무 카운터
+  total_tasks = Column(Integer, default=0, nullable=False)
+  completed_tasks = Column(Integer, default=0, nullable=False)
+  
+  def __repr__(self):
+    return f"<MilestoneStat(milestone_id={self.milestone_id}, completed_tasks={self.completed_tasks}/{self.total_tasks})>"
@@ -1,33 +1,67 @@
+import json
 from typing import Dict, Any, List
-from collections import Counter
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from src.api.v1.repositories.community.post_repository import PostRepository
+from src.api.v1.repositories.community.post_repository import PostRepository, POSTS_TAG, POST_REACTIONS_TAG
+from src.api.v1.repositories.community.post_tag_repository import PostTagRepository
 from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
-from src.api.v1.models.community.post import Post
+from src.api.v1.schemas.community.post_schema import PostDetail
+from src.core.config import setting
+from src.core.utils.fragment_cache import fragment_cache
+
+_POST_LIST = TypeAdapter(List[PostDetail])
+
+def _dump_json(value: Any) -> bytes:
+  """FastAPI 기본 JSONResponse와 같은 형식으로 직렬화"""
+  return json.dumps(jsonable_encoder(value), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
 
 class CommunityRepository:
   def __init__(self, db: Session):
     self.db = db
     
-  def get_info(self, user_id: int) -> Dict[str, Any]:
-    hot_topic = self.get_all_tags(self.db, limit=3)
-    posts = PostRepository(self.db).get_all(skip=0, limit=10)
-    recommended_follow = RecommendationRepository(self.db).get_follow_recommendations(user_id=user_id, limit=3)
+  HOT_TOPIC_KEY = "community:hot_topic"
+  POSTS_KEY = "community:posts"
+  
+  def get_info(self, user_id: int) -> bytes:
+    """
+    커뮤니티 홈 응답 (JSON bytes)
+    사용자와 무관한 인기 태그/최신 게시글은 fragment_cache의 직렬화된 조각을 쓰고(미스면 스레드 풀에서 렌더링),
+    그동안 요청 세션으로 사용자별 팔로우 추천을 계산해 이어 붙입니다. 캐시된 조각은 다시 검증하지 않습니다.
+    """
+    hot_topic = fragment_cache.render_async(
+      self.HOT_TOPIC_KEY,
+      lambda db: _dump_json(CommunityRepository(db).get_hot_topic(limit=3)),
+      ttl=setting.COMMUNITY_HOT_TOPIC_TTL,
+      tags=(POSTS_TAG,)
+    )
+    posts = fragment_cache.render_async(
+      self.POSTS_KEY,
+      lambda db: _POST_LIST.dump_json(PostRepository(db).get_all(skip=0, limit=10)),
+      ttl=setting.COMMUNITY_POSTS_TTL,
+      tags=(POSTS_TAG, POST_REACTIONS_TAG)
+    )
+    
+    recommended_follow, recommended_follow_computed_at = RecommendationRepository(self.db).get_cached_follow_recommendations(user_id=user_id, limit=3)
     
-    return {
-      "hot_topic": hot_topic,
-      "posts": posts,
-      "recommended_follow": recommended_follow
-    }
+    return b"".join([
+      b'{"hot_topic":', hot_topic.result(),
+      b',"posts":', posts.result(),
+      b',"recommended_follow":', _dump_json(recommended_follow),
+      b',"recommended_follow_computed_at":', _dump_json(recommended_follow_computed_at),
+      b"}"
+    ])
     
-  def get_all_tags(self, db: Session, limit: int = None) -> List[Dict[str, int]]:
-    all_tags = [tag for tags in db.query(Post.tags).filter(Post.tags.isnot(None)).all() for tag in (tags[0] or [])]
-    tag_counts = Counter(all_tags)
+  def get_hot_topic(self, limit: int = 3) -> List[Dict[str, int]]:
+    """
+    인기 태그 (HOT_TOPIC_WINDOW 기간 기준)
+    기간 내 태그가 없으면 전체 기간으로 집계합니다.
+    """
+    hot_topic = self.get_all_tags(limit=limit, window=setting.HOT_TOPIC_WINDOW)
+    if not hot_topic and setting.HOT_TOPIC_WINDOW != "all":
+      hot_topic = self.get_all_tags(limit=limit)
+    return hot_topic
     
+  def get_all_tags(self, limit: int = None, window: str = "all") -> List[Dict[str, int]]:
     # limit이 None이면 모든 태그 반환, 아니면 limit만큼만 반환
-    most_common = tag_counts.most_common()
-    if limit is not None:
-      most_common = most_common[:limit]
-      
-    return [{"tag": tag, "count": count} for tag, count in most_common]
-    
\ No newline at end of file
+    return PostTagRepository(self.db).get_hot_tags(limit=limit, window=window)
@@ -1,12 +1,22 @@
+from sqlalchemy import exists, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
-from src.api.v1.schemas.community.post_schema import PostCreate, PostUpdate, PostDetail, CommentCreate
+from src.api.v1.schemas.community.post_schema import PostCreate, PostUpdate, PostDetail, CommentCreate, PostReactionAck
 from src.api.v1.models.community.post import Post, PostReaction, PostComment
 from src.api.v1.models.user import User
 from src.api.v1.schemas.brief import UserBrief
-from collections import defaultdict
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 from fastapi import HTTPException
 from src.api.v1.models.association_tables import user_post_bookmarks
+from src.core.database.routing import replica_read
+from src.core.utils.fragment_cache import fragment_cache
+from src.core.utils.user_projection import PRINCIPAL_COLUMNS, UserPrincipal
+from src.api.v1.repositories.community.post_stat_repository import PostStatRepository, counter_for
+from src.api.v1.repositories.community.post_tag_repository import PostTagRepository
+
+# 응답 조각 캐시 태그 (게시글 목록/태그, 게시글 반응 수)
+POSTS_TAG = "posts"
+POST_REACTIONS_TAG = "post_reactions"
 
 class PostRepository:
   def __init__(self, db: Session):
@@ -15,7 +25,10 @@ class PostRepository:
   def create(self, post_in: PostCreate) -> Post:
     post = Post(**post_in.model_dump())
     self.db.add(post)
+    self.db.flush()
+    PostTagRepository(self.db).sync(post.id, post.tags)
     self.db.commit()
+    fragment_cache.invalidate_tags(POSTS_TAG)
     self.db.refresh(post)
     return post
   
@@ -26,8 +39,11 @@ class PostRepository:
     update_data = post_in.model_dump(exclude_unset=True)
     for key, value in update_data.items():
       setattr(post, key, value)
+    if 'tags' in update_data:
+      PostTagRepository(self.db).sync(post_id, update_data['tags'])
     self.db.add(post)
     self.db.commit()
+    fragment_cache.invalidate_tags(POSTS_TAG)
     self.db.refresh(post)
     return post
   
@@ -35,247 +51,296 @@ class PostRepository:
     post = self.db.query(Post).filter(Post.id == post_id).first()
     if not post:
       raise HTTPException(status_code=404, detail="Post not found")
+    PostStatRepository(self.db).delete(post_id)
+    PostTagRepository(self.db).delete(post_id)
     self.db.delete(post)
     self.db.commit()
+    fragment_cache.invalidate_tags(POSTS_TAG)
     return post
       
-  def _get_reactions_for_post(self, post_id: int) -> Dict[str, Dict[str, Any]]:
-    reactions = self.db.query(PostReaction).options(
-      joinedload(PostReaction.user)
-    ).filter(PostReaction.post_id == post_id).all()
-    reaction_groups = defaultdict(list)
-    for reaction in reactions:
-      if reaction.user:
-        user_brief = UserBrief.model_validate(reaction.user, from_attributes=True)
-        reaction_groups[reaction.reaction_type].append(user_brief)
-    comments = self.db.query(PostComment).options(
-      joinedload(PostComment.user)
-    ).filter(PostComment.post_id == post_id).all()
-    reaction_data = {}
-    for reaction_type in ['like', 'dislike', 'view', 'share']:
-      users = reaction_groups.get(reaction_type, [])
-      reaction_data[reaction_type] = {
-        'count': len(users),
-        'users': users
+  REACTION_TYPES = ('like', 'dislike', 'view', 'share')
+  # 게시글마다 응답에 포함하는 반응 사용자/댓글 수 (count는 항상 전체 수)
+  REACTION_USER_SAMPLE = 20
+  COMMENT_SAMPLE = 20
+  
+  def _load_reactions(
+    self,
+    post_ids: List[int],
+    user_sample: Optional[int] = REACTION_USER_SAMPLE,
+    comment_sample: Optional[int] = COMMENT_SAMPLE
+  ) -> Dict[int, Dict[str, Dict[str, Any]]]:
+    """
+    여러 게시글의 반응을 게시글 수와 관계없이 세 번의 쿼리로 조회합니다.
+    1. 반응 종류별/댓글 수: 카운터 테이블 (행이 없는 게시글은 GROUP BY 집계 한 번 추가)
+    2. 반응 사용자: 게시글·반응 종류마다 앞에서 user_sample명 (윈도 함수)
+    3. 댓글: 게시글마다 앞에서 comment_sample개 (윈도 함수, None이면 전체)
+    """
+    post_ids = list(dict.fromkeys(post_ids))
+    reaction_data = {
+      post_id: {
+        **{reaction_type: {'count': 0, 'users': []} for reaction_type in self.REACTION_TYPES},
+        'comment': {'count': 0, 'comments': []}
       }
-    reaction_data['comment'] = {
-      'count': len(comments),
-      'comments': comments
+      for post_id in post_ids
     }
-    return reaction_data
-  
-  def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[PostDetail]:
-    posts = self.db.query(Post).options(
-      joinedload(Post.creator)
-    ).filter(Post.user_id == user_id).offset(skip).limit(limit).all()
+    if not post_ids:
+      return reaction_data
     
-    result = []
-    for post in posts:
-      reaction_data = self._get_reactions_for_post(post.id)
-      post_dict = {
-        **post.__dict__,
-        'reaction': {
-          'likes': reaction_data['like'],
-          'dislikes': reaction_data['dislike'],
-          'views': reaction_data['view'],
-          'shares': reaction_data.get('share', {'count': 0, 'users': []}),
-          'comments': reaction_data.get('comment', {}).get('comments', [])
-        }
-      }
-      post_detail = PostDetail.model_validate(post_dict, from_attributes=True)
-      result.append(post_detail)
+    # 1. 반응 종류별 수와 댓글 수 (카운터 테이블)
+    for post_id, counts in PostStatRepository(self.db).get_counts(post_ids).items():
+      for kind in reaction_data[post_id]:
+        reaction_data[post_id][kind]['count'] = counts[counter_for(kind)]
+    
+    # 2. 반응 사용자 (사용자는 기본 컬럼만 조회)
+    ranked = select(
+      PostReaction.post_id,
+      PostReaction.reaction_type,
+      PostReaction.user_id,
+      func.row_number().over(
+        partition_by=(PostReaction.post_id, PostReaction.reaction_type), order_by=PostReaction.id
+      ).label("rank")
+    ).where(PostReaction.post_id.in_(post_ids)).subquery()
+    query = select(*PRINCIPAL_COLUMNS, ranked.c.post_id, ranked.c.reaction_type).join(
+      ranked, ranked.c.user_id == User.id
+    )
+    if user_sample is not None:
+      query = query.where(ranked.c.rank <= user_sample)
+    for row in self.db.execute(query.order_by(ranked.c.post_id, ranked.c.reaction_type, ranked.c.rank)):
+      group = reaction_data[row.post_id].get(row.reaction_type)
+      if group is not None:
+        group['users'].append(UserBrief.model_validate(UserPrincipal.from_row(row), from_attributes=True))
     
-    return result
+    # 3. 댓글 (작성자는 기본 컬럼만 조회)
+    ranked = select(
+      PostComment.id,
+      PostComment.post_id,
+      func.row_number().over(partition_by=PostComment.post_id, order_by=PostComment.id).label("rank")
+    ).where(PostComment.post_id.in_(post_ids)).subquery()
+    query = select(
+      *PRINCIPAL_COLUMNS,
+      PostComment.id.label("comment_id"),
+      PostComment.post_id,
+      PostComment.content,
+      PostComment.created_at.label("comment_created_at"),
+      PostComment.updated_at.label("comment_updated_at")
+    ).select_from(PostComment).join(ranked, ranked.c.id == PostComment.id).outerjoin(
+      User, PostComment.user_id == User.id
+    )
+    if comment_sample is not None:
+      query = query.where(ranked.c.rank <= comment_sample)
+    for row in self.db.execute(query.order_by(PostComment.post_id, ranked.c.rank)):
+      reaction_data[row.post_id]['comment']['comments'].append({
+        'id': row.comment_id,
+        'content': row.content,
+        'created_at': row.comment_created_at,
+        'updated_at': row.comment_updated_at,
+        'user': UserBrief.model_validate(UserPrincipal.from_row(row), from_attributes=True) if row.id is not None else None
+      })
+    
+    return reaction_data
   
-  def get_by_id(self, post_id: int) -> PostDetail:
-    post = self.db.query(Post).filter(Post.id == post_id).first()
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
-    reaction_data = self._get_reactions_for_post(post.id)
+  def _to_detail(self, post: Post, reaction_data: Dict[str, Dict[str, Any]]) -> PostDetail:
     post_dict = {
       **post.__dict__,
       'reaction': {
         'likes': reaction_data['like'],
         'dislikes': reaction_data['dislike'],
         'views': reaction_data['view'],
-        'shares': reaction_data.get('share', {'count': 0, 'users': []}),
-        'comments': reaction_data.get('comment', {}).get('comments', [])
+        'shares': reaction_data['share'],
+        'comments': reaction_data['comment']['comments'],
+        'comments_count': reaction_data['comment']['count']
       }
     }
-    post_detail = PostDetail.model_validate(post_dict, from_attributes=True)
-    return post_detail
+    return PostDetail.model_validate(post_dict, from_attributes=True)
+  
+  def _to_details(self, posts: List[Post]) -> List[PostDetail]:
+    """게시글 목록을 PostDetail로 변환 (반응은 _load_reactions로 한 번에 조회)"""
+    reactions = self._load_reactions([post.id for post in posts])
+    return [self._to_detail(post, reactions[post.id]) for post in posts]
   
-  def get_all(self, skip: int = 0, limit: int = 100) -> List[PostDetail]:
+  @replica_read
+  def get_by_user(self, user_id: int, skip: int = 0, limit: int = 100) -> List[PostDetail]:
     posts = self.db.query(Post).options(
       joinedload(Post.creator)
-    ).offset(skip).limit(limit).all()
+    ).filter(Post.user_id == user_id).offset(skip).limit(limit).all()
     
-    result = []
-    for post in posts:
-      reaction_data = self._get_reactions_for_post(post.id)
-      post_dict = {
-        **post.__dict__,
-        'reaction': {
-          'likes': reaction_data['like'],
-          'dislikes': reaction_data['dislike'],
-          'views': reaction_data['view'],
-          'shares': reaction_data.get('share', {'count': 0, 'users': []}),
-          'comments': reaction_data.get('comment', {}).get('comments', [])
-        }
-      }
-      post_detail = PostDetail.model_validate(post_dict, from_attributes=True)
-      result.append(post_detail)
+    return self._to_details(posts)
+  
+  @replica_read
+  def get_by_id(self, post_id: int) -> PostDetail:
+    post = self.db.query(Post).filter(Post.id == post_id).first()
+    if not post:
+      raise HTTPException(status_code=404, detail="Post not found")
+    # 상세 조회는 댓글을 모두 포함
+    reaction_data = self._load_reactions([post.id], comment_sample=None)[post.id]
+    return self._to_detail(post, reaction_data)
+  
+  @replica_read
+  def get_all(self, skip: int = 0, limit: int = 100, tag: Optional[str] = None) -> List[PostDetail]:
+    query = self.db.query(Post).options(joinedload(Post.creator))
+    if tag:
+      # 태그 필터는 post_tags 인덱스로 (JSON 스캔 없이)
+      query = query.filter(Post.id.in_(PostTagRepository(self.db).post_ids_with_tag(tag)))
+    posts = query.offset(skip).limit(limit).all()
     
-    return result
+    return self._to_details(posts)
   
+  @replica_read
   def get_bookmarked_posts(self, user_id: int, skip: int = 0, limit: int = 100) -> List[PostDetail]:
     posts = self.db.query(Post).options(
       joinedload(Post.creator)
     ).filter(Post.bookmarked_users.any(User.id == user_id)).offset(skip).limit(limit).all()
     
-    result = []
-    for post in posts:
-      reaction_data = self._get_reactions_for_post(post.id)
-      post_dict = {
-        **post.__dict__,
-        'reaction': {
-          'likes': reaction_data['like'],
-          'dislikes': reaction_data['dislike'],
-          'views': reaction_data['view'],
-          'shares': reaction_data.get('share', {'count': 0, 'users': []}),
-          'comments': reaction_data.get('comment', {}).get('comments', [])
-        }
-      }
-      post_detail = PostDetail.model_validate(post_dict, from_attributes=True)
-      result.append(post_detail)
-    
-    return result
+    return self._to_details(posts)
   
-  def like(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
+  def _ensure_exists(self, post_id: int) -> None:
+    """게시글 존재 여부를 EXISTS 한 번으로 확인"""
+    if not self.db.query(exists().where(Post.id == post_id)).scalar():
       raise HTTPException(status_code=404, detail="Post not found")
-    reaction = PostReaction(reaction_type="like", user_id=user_id, post_id=post_id)
-    if self.db.query(PostReaction).filter(PostReaction.post_id == post_id, PostReaction.user_id == user_id).first():
-      raise HTTPException(status_code=400, detail="Already liked this post")
-    self.db.add(reaction)
-    self.db.commit()
-    return self.get_by_id(post_id)
   
-  def delete_like(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
+  def _check_reaction(self, post_id: int, user_id: int) -> bool:
+    """
+    게시글 존재 여부와 사용자의 기존 반응 여부를 한 번의 쿼리로 확인
+    게시글이 없으면 404, 반응이 있으면 True를 반환합니다. (조회는 반응이 아니므로 제외)
+    """
+    post_exists, reacted = self.db.execute(select(
+      exists().where(Post.id == post_id),
+      exists().where(
+        PostReaction.post_id == post_id,
+        PostReaction.user_id == user_id,
+        PostReaction.reaction_type != "view"
+      )
+    )).one()
+    if not post_exists:
       raise HTTPException(status_code=404, detail="Post not found")
-    reaction = self.db.query(PostReaction).filter(PostReaction.post_id == post_id, PostReaction.user_id == user_id).first()
+    return bool(reacted)
+  
+  def _get_reaction(self, post_id: int, user_id: int) -> PostReaction:
+    """취소할 사용자의 반응 조회 (없으면 게시글 유무에 따라 404/400)"""
+    reaction = self.db.query(PostReaction).filter(
+      PostReaction.post_id == post_id,
+      PostReaction.user_id == user_id,
+      PostReaction.reaction_type != "view"
+    ).first()
     if not reaction:
+      self._ensure_exists(post_id)
       raise HTTPException(status_code=400, detail="Reaction not found")
-    self.db.delete(reaction)
-    self.db.commit()
+    return reaction
+  
+  def _ack(self, post_id: int, user_id: int, comment: Optional[PostComment] = None) -> PostReactionAck:
+    """
+    쓰기 응답(fields="ack"): 게시글의 새 카운터와 요청자의 반응/북마크 상태만 반환
+    카운터 한 번, 요청자 상태 한 번 조회합니다.
+    """
+    counts = PostStatRepository(self.db).get_counts([post_id])[post_id]
+    my_reaction, bookmarked = self.db.execute(select(
+      select(PostReaction.reaction_type).where(
+        PostReaction.post_id == post_id,
+        PostReaction.user_id == user_id,
+        PostReaction.reaction_type != "view"
+      ).limit(1).scalar_subquery(),
+      exists().where(user_post_bookmarks.c.post_id == post_id, user_post_bookmarks.c.user_id == user_id)
+    )).one()
+    return PostReactionAck(
+      post_id=post_id,
+      likes=counts['like_count'],
+      dislikes=counts['dislike_count'],
+      views=counts['view_count'],
+      shares=counts['share_count'],
+      comments_count=counts['comment_count'],
+      my_reaction=my_reaction,
+      bookmarked=bool(bookmarked),
+      # 작성자는 요청자 본인이므로 사용자 정보는 싣지 않음
+      comment={
+        'id': comment.id,
+        'content': comment.content,
+        'created_at': comment.created_at,
+        'updated_at': comment.updated_at
+      } if comment is not None else None
+    )
+  
+  def _respond(self, post_id: int, user_id: int, fields: str, comment: Optional[PostComment] = None) -> Union[PostDetail, PostReactionAck]:
+    if fields == "ack":
+      return self._ack(post_id, user_id, comment)
     return self.get_by_id(post_id)
-    
-  def dislike(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
-    reaction = PostReaction(reaction_type="dislike", user_id=user_id, post_id=post_id)
-    if self.db.query(PostReaction).filter(PostReaction.post_id == post_id, PostReaction.user_id == user_id).first():
-      raise HTTPException(status_code=400, detail="Already disliked this post")
-    self.db.add(reaction)
+  
+  def _react(self, post_id: int, user_id: int, reaction_type: str, detail: str, fields: str) -> Union[PostDetail, PostReactionAck]:
+    if self._check_reaction(post_id, user_id):
+      raise HTTPException(status_code=400, detail=detail)
+    self.db.add(PostReaction(reaction_type=reaction_type, user_id=user_id, post_id=post_id))
+    PostStatRepository(self.db).increment(post_id, **{counter_for(reaction_type): 1})
     self.db.commit()
-    return self.get_by_id(post_id)
+    fragment_cache.invalidate_tags(POST_REACTIONS_TAG)
+    return self._respond(post_id, user_id, fields)
   
-  def delete_dislike(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
-    reaction = self.db.query(PostReaction).filter(PostReaction.post_id == post_id, PostReaction.user_id == user_id).first()
-    if not reaction:
-      raise HTTPException(status_code=400, detail="Reaction not found")
+  def _unreact(self, post_id: int, user_id: int, fields: str) -> Union[PostDetail, PostReactionAck]:
+    reaction = self._get_reaction(post_id, user_id)
+    PostStatRepository(self.db).increment(post_id, **{counter_for(reaction.reaction_type): -1})
     self.db.delete(reaction)
     self.db.commit()
-    return self.get_by_id(post_id)
+    fragment_cache.invalidate_tags(POST_REACTIONS_TAG)
+    return self._respond(post_id, user_id, fields)
   
-  def view(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
-    reaction = PostReaction(reaction_type="view", user_id=user_id, post_id=post_id)
-    if self.db.query(PostReaction).filter(PostReaction.post_id == post_id, PostReaction.user_id == user_id).first():
-      raise HTTPException(status_code=400, detail="Already viewed this post")
-    self.db.add(reaction)
-    self.db.commit()
-    return self.get_by_id(post_id)
+  def like(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    return self._react(post_id, user_id, "like", "Already liked this post", fields)
   
-  def share(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
-    reaction = PostReaction(reaction_type="share", user_id=user_id, post_id=post_id)
-    if self.db.query(PostReaction).filter(PostReaction.post_id == post_id, PostReaction.user_id == user_id).first():
-      raise HTTPException(status_code=400, detail="Already shared this post")
-    self.db.add(reaction)
-    self.db.commit()
-    return self.get_by_id(post_id)
+  def delete_like(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    return self._unreact(post_id, user_id, fields)
+    
+  def dislike(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    return self._react(post_id, user_id, "dislike", "Already disliked this post", fields)
   
-  def create_comment(self, post_id: int, user_id: int, comment_in: CommentCreate) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
+  def delete_dislike(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    return self._unreact(post_id, user_id, fields)
+  
+  def view(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    self._ensure_exists(post_id)
+    # 조회는 반응 행을 만들지 않고 조회수 버퍼에 모았다가 주기적으로 반영
+    PostStatRepository(self.db).add_view(post_id)
+    return self._respond(post_id, user_id, fields)
+  
+  def share(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    return self._react(post_id, user_id, "share", "Already shared this post", fields)
+  
+  def create_comment(self, post_id: int, user_id: int, comment_in: CommentCreate, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    self._ensure_exists(post_id)
     comment = PostComment(post_id=post_id, user_id=user_id, content=comment_in.content)
     self.db.add(comment)
+    PostStatRepository(self.db).increment(post_id, comment_count=1)
     self.db.commit()
-    return self.get_by_id(post_id)
+    fragment_cache.invalidate_tags(POST_REACTIONS_TAG)
+    return self._respond(post_id, user_id, fields, comment)
   
-  def delete_comment(self, post_id: int, user_id: int, comment_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
+  def delete_comment(self, post_id: int, user_id: int, comment_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
     comment = self.db.query(PostComment).filter(PostComment.post_id == post_id, PostComment.user_id == user_id, PostComment.id == comment_id).first()
     if not comment:
+      self._ensure_exists(post_id)
       raise HTTPException(status_code=404, detail="Comment not found")
+    PostStatRepository(self.db).increment(post_id, comment_count=-1)
     self.db.delete(comment)
     self.db.commit()
-    return self.get_by_id(post_id)
+    fragment_cache.invalidate_tags(POST_REACTIONS_TAG)
+    return self._respond(post_id, user_id, fields)
   
-  def bookmark(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
+  def bookmark(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    self._ensure_exists(post_id)
     
-    # Check if bookmark already exists
-    existing = self.db.query(user_post_bookmarks).filter(
-        user_post_bookmarks.c.post_id == post_id,
-        user_post_bookmarks.c.user_id == user_id
-    ).first()
-    
-    if existing:
-      return self.get_by_id(post_id)
-      
-    # Insert new bookmark
-    stmt = user_post_bookmarks.insert().values(post_id=post_id, user_id=user_id)
-    self.db.execute(stmt)
+    # 이미 북마크했으면 기본 키 충돌을 무시 (조회 후 삽입 대신 삽입 후 충돌 처리)
+    try:
+      with self.db.begin_nested():
+        self.db.execute(user_post_bookmarks.insert().values(post_id=post_id, user_id=user_id))
+    except IntegrityError:
+      pass
     self.db.commit()
-    return self.get_by_id(post_id)
+    return self._respond(post_id, user_id, fields)
   
-  def delete_bookmark(self, post_id: int, user_id: int) -> PostDetail:
-    post = self.get_by_id(post_id)
-    if not post:
-      raise HTTPException(status_code=404, detail="Post not found")
-    
-    # Check if bookmark exists
-    existing = self.db.query(user_post_bookmarks).filter(
-        user_post_bookmarks.c.post_id == post_id,
-        user_post_bookmarks.c.user_id == user_id
-    ).first()
+  def delete_bookmark(self, post_id: int, user_id: int, fields: str = "detail") -> Union[PostDetail, PostReactionAck]:
+    self._ensure_exists(post_id)
     
-    if not existing:
-      return self.get_by_id(post_id)
-      
-    # Delete bookmark
-    stmt = user_post_bookmarks.delete().where(
-        user_post_bookmarks.c.post_id == post_id,
-        user_post_bookmarks.c.user_id == user_id
-    )
-    self.db.execute(stmt)
+    # 북마크가 없으면 아무 행도 지워지지 않음
+    self.db.execute(user_post_bookmarks.delete().where(
+      user_post_bookmarks.c.post_id == post_id,
+      user_post_bookmarks.c.user_id == user_id
+    ))
     self.db.commit()
-    return self.get_by_id(post_id)
\ No newline at end of file
+    return self._respond(post_id, user_id, fields)
@@ -0,0 +1,151 @@
+from sqlalchemy import bindparam, delete, func, insert, literal, select, union_all, update
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from src.api.v1.models.community.post import Post, PostReaction, PostComment
+from src.api.v1.models.community.post_stat import PostStat
+from src.core.database.upsert import insert_ignore
+from src.core.utils.view_counter import view_counter
+
+POST_COUNTERS = (
+  "like_count",
+  "dislike_count",
+  "view_count",
+  "share_count",
+  "comment_count",
+)
+
+def counter_for(reaction_type: str) -> str:
+  """반응 종류(like, dislike, view, share, comment)의 카운터 컬럼 이름"""
+  return f"{reaction_type}_count"
+
+class PostStatRepository:
+  """
+  게시글 반응 카운터 저장소
+  좋아요/싫어요/공유/댓글 쓰기 시 같은 트랜잭션에서 증감값을 반영하고,
+  조회수는 view_counter 버퍼에 모았다가 주기적으로 한 번에 반영합니다.
+  """
+  def __init__(self, db: Session):
+    self.db = db
+
+  def get_counts(self, post_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """
+    여러 게시글의 카운터 조회 (조회수는 아직 반영되지 않은 증가분 포함)
+    카운터 행이 없는 게시글은 집계 쿼리로 계산합니다.
+    """
+    if not post_ids:
+      return {}
+
+    rows = self.db.query(
+      PostStat.post_id,
+      *[getattr(PostStat, counter) for counter in POST_COUNTERS]
+    ).filter(PostStat.post_id.in_(post_ids)).all()
+
+    counts = {row[0]: dict(zip(POST_COUNTERS, row[1:])) for row in rows}
+
+    missing = [post_id for post_id in post_ids if post_id not in counts]
+    if missing:
+      counts.update(self._aggregate_counts(missing))
+
+    for post_id, post_counts in counts.items():
+      post_counts["view_count"] += view_counter.pending("post", post_id)
+    return counts
+
+  def increment(self, post_id: int, **deltas: int) -> None:
+    """
+    게시글 카운터 증감
+    변경 사항이 플러시되기 전에 호출해야 합니다.
+    """
+    deltas = {counter: delta for counter, delta in deltas.items() if delta}
+    if not deltas:
+      return
+
+    self._ensure_rows([post_id])
+    self.db.execute(
+      update(PostStat)
+      .where(PostStat.post_id == post_id)
+      .values({counter: getattr(PostStat, counter) + delta for counter, delta in deltas.items()})
+    )
+
+  def add_view(self, post_id: int) -> None:
+    """조회수 1 증가 (view_counter 버퍼에 모았다가 반영)"""
+    view_counter.add("post", post_id)
+
+  def apply_views(self, deltas: Dict[int, int]) -> None:
+    """
+    모인 조회수 증가분을 반영합니다. (view_counter가 호출)
+    삭제된 게시글의 증가분은 버립니다.
+    """
+    post_ids = [row[0] for row in self.db.query(Post.id).filter(Post.id.in_(list(deltas))).all()]
+    if not post_ids:
+      return
+
+    self._ensure_rows(post_ids)
+    stats = PostStat.__table__
+    self.db.execute(
+      update(stats)
+      .where(stats.c.post_id == bindparam("target_id"))
+      .values(view_count=stats.c.view_count + bindparam("delta")),
+      [{"target_id": post_id, "delta": deltas[post_id]} for post_id in post_ids]
+    )
+
+  def delete(self, post_id: int) -> None:
+    """
+    게시글 카운터 삭제
+    """
+    self.db.execute(delete(PostStat).where(PostStat.post_id == post_id))
+
+  def reconcile(self, post_ids: Optional[List[int]] = None) -> int:
+    """
+    카운터 재구성
+    post_ids가 없으면 모든 게시글의 카운터를 다시 계산합니다. (버퍼에 남은 조회수 증가분은 먼저 반영하세요)
+    반응 행으로 남아 있는 조회(이전 방식)는 view_count에 포함됩니다.
+    """
+    query = self.db.query(Post.id)
+    if post_ids is not None:
+      query = query.filter(Post.id.in_(post_ids))
+    post_ids = [row[0] for row in query.all()]
+    if not post_ids:
+      return 0
+
+    counts = self._aggregate_counts(post_ids)
+    self.db.execute(delete(PostStat).where(PostStat.post_id.in_(post_ids)))
+    self.db.execute(insert(PostStat), [{"post_id": post_id, **post_counts} for post_id, post_counts in counts.items()])
+    return len(counts)
+
+  def _ensure_rows(self, post_ids: List[int]) -> None:
+    """
+    카운터 행이 없으면 현재 데이터로 계산하여 생성
+    """
+    with self.db.no_autoflush:
+      existing = {
+        row[0] for row in self.db.query(PostStat.post_id).filter(PostStat.post_id.in_(post_ids)).all()
+      }
+      missing = [post_id for post_id in post_ids if post_id not in existing]
+      if not missing:
+        return
+      counts = self._aggregate_counts(missing)
+    # 동시에 첫 반응/조회수 반영이 일어나면 먼저 만든 행을 그대로 사용
+    insert_ignore(self.db, PostStat, [{"post_id": post_id, **post_counts} for post_id, post_counts in counts.items()])
+
+  def _aggregate_counts(self, post_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """
+    반응/댓글 테이블에서 게시글별 카운터를 한 번의 GROUP BY로 집계
+    """
+    counts = {post_id: {counter: 0 for counter in POST_COUNTERS} for post_id in post_ids}
+
+    counted = union_all(
+      select(PostReaction.post_id, PostReaction.reaction_type.label("kind"))
+      .where(PostReaction.post_id.in_(post_ids)),
+      select(PostComment.post_id, literal("comment").label("kind"))
+      .where(PostComment.post_id.in_(post_ids))
+    ).subquery()
+    for post_id, kind, count in self.db.execute(
+      select(counted.c.post_id, counted.c.kind, func.count()).group_by(counted.c.post_id, counted.c.kind)
+    ):
+      counter = counter_for(kind)
+      if counter in counts[post_id]:
+        counts[post_id][counter] = count
+
+    return counts
+
+view_counter.register("post", lambda db, deltas: PostStatRepository(db).apply_views(deltas))
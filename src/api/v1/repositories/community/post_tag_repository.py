@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from typing import Dict, Iterable, List, Optional
+from src.api.v1.models.community.post import Post
+from src.api.v1.models.community.post_tag import PostTag
+from src.core.database.routing import replica_read
+
+# 인기 태그 집계 기간 (None이면 전체 기간)
+TAG_WINDOWS = {
+  "24h": timedelta(hours=24),
+  "7d": timedelta(days=7),
+  "all": None,
+}
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+  """앞뒤 공백 제거, 빈 태그/중복 제거 (입력 순서 유지)"""
+  normalized = []
+  for tag in tags or []:
+    if not isinstance(tag, str):
+      continue
+    tag = tag.strip()[:100]
+    if tag and tag not in normalized:
+      normalized.append(tag)
+  return normalized
+
+class PostTagRepository:
+  """
+  게시글 태그 색인 저장소
+  게시글 생성/수정/삭제 시 같은 트랜잭션에서 post_tags를 갱신하고,
+  인기 태그와 태그별 게시글 조회는 JSON 대신 이 테이블의 인덱스를 읽습니다.
+  """
+  def __init__(self, db: Session):
+    self.db = db
+
+  def sync(self, post_id: int, tags: Optional[Iterable[str]]) -> None:
+    """
+    게시글의 태그 행을 tags와 맞춤
+    유지되는 태그는 붙은 시각을 그대로 두고, 빠진 태그는 삭제, 새 태그만 추가합니다.
+    """
+    tags = normalize_tags(tags)
+    existing = set(self.db.scalars(select(PostTag.tag).where(PostTag.post_id == post_id)))
+
+    removed = existing.difference(tags)
+    if removed:
+      self.db.execute(delete(PostTag).where(PostTag.post_id == post_id, PostTag.tag.in_(removed)))
+
+    added = [tag for tag in tags if tag not in existing]
+    if added:
+      now = _utcnow()
+      self.db.execute(insert(PostTag), [
+        {"post_id": post_id, "tag": tag, "created_at": now, "updated_at": now} for tag in added
+      ])
+
+  def delete(self, post_id: int) -> None:
+    self.db.execute(delete(PostTag).where(PostTag.post_id == post_id))
+
+  @replica_read
+  def get_hot_tags(self, limit: Optional[int] = None, window: str = "all") -> List[Dict[str, int]]:
+    """
+    기간 내 태그별 게시글 수 상위 목록
+    window: 24h | 7d | all
+    """
+    query = select(PostTag.tag, func.count().label("count"))
+    since = TAG_WINDOWS[window]
+    if since is not None:
+      query = query.where(PostTag.created_at >= _utcnow() - since)
+    query = query.group_by(PostTag.tag).order_by(func.count().desc(), PostTag.tag)
+    if limit is not None:
+      query = query.limit(limit)
+
+    return [{"tag": tag, "count": count} for tag, count in self.db.execute(query)]
+
+  def post_ids_with_tag(self, tag: str) -> Select:
+    """태그가 붙은 게시글 ID 서브쿼리 (Post.id.in_(...)에 사용)"""
+    return select(PostTag.post_id).where(PostTag.tag == tag.strip())
+
+  def rebuild(self, post_ids: Optional[List[int]] = None) -> int:
+    """
+    posts.tags JSON에서 태그 색인 재구성 (붙은 시각은 게시글 작성 시각)
+    post_ids가 없으면 모든 게시글을 다시 만듭니다.
+    """
+    query = self.db.query(Post.id, Post.tags, Post.created_at)
+    if post_ids is not None:
+      query = query.filter(Post.id.in_(post_ids))
+    posts = query.all()
+    if not posts:
+      return 0
+
+    self.db.execute(delete(PostTag).where(PostTag.post_id.in_([post.id for post in posts])))
+    rows = [
+      {"post_id": post.id, "tag": tag, "created_at": post.created_at, "updated_at": post.created_at}
+      for post in posts
+      for tag in normalize_tags(post.tags)
+    ]
+    if rows:
+      self.db.execute(insert(PostTag), rows)
+    return len(posts)
+
+def _utcnow() -> datetime:
+  return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -1,12 +1,18 @@
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
 from fastapi import HTTPException
 from src.core.utils.similarity_calculator import similarity_calculator
+from src.core.utils.similarity_index import UserFeatures, UserSimilarityIndex, load_features, similarity_components, similarity_index
+from src.core.utils.recommendation_cache import RecommendationCache, recommendation_cache
 from src.api.v1.models.user import User
+from src.api.v1.repositories.user.follow_repository import FollowRepository
 
 class RecommendationRepository:
-  def __init__(self, db: Session):
+  def __init__(self, db: Session, index: UserSimilarityIndex = similarity_index, cache: RecommendationCache = recommendation_cache):
     self.db = db
+    self.index = index
+    self.cache = cache
     
   def get_follow_recommendations(self, user_id: int, limit: int = 10, min_similarity: float = 0.1) -> List[Dict[str, Any]]:
     """
@@ -25,41 +31,78 @@ class RecommendationRepository:
     if not target_user:
       raise HTTPException(status_code=404, detail="User not found")
     
-    all_users = self.db.query(User).filter(User.id != user_id).all()
-    
-    similar_users = similarity_calculator.get_top_similar_users(
-      target_user=target_user,
-      all_users=all_users,
-      exclude_following=True,
-      limit=limit * 2
-    )
+    # 인덱스에서 후보 ID/점수만 계산한 뒤, 응답에 필요한 유저만 한 번에 로드
+    similar_users = self.index.recommend(self.db, user_id, limit=limit * 2, exclude_following=True)
     
     filtered_recommendations = [
-      (user, similarity) for user, similarity in similar_users 
+      (similar_user_id, similarity) for similar_user_id, similarity in similar_users 
       if similarity >= min_similarity
-    ]
+    ][:limit]
+    if not filtered_recommendations:
+      return []
+    
+    users = {
+      user.id: user
+      for user in self.db.query(User)
+      .options(
+        selectinload(User.tech_stacks),
+        selectinload(User.interests),
+        selectinload(User.collaboration_preference)
+      )
+      .filter(User.id.in_([similar_user_id for similar_user_id, _ in filtered_recommendations]))
+    }
     
+    target_features = UserFeatures.from_user(target_user)
     recommendations = []
-    for user, similarity in filtered_recommendations[:limit]:
+    for similar_user_id, similarity in filtered_recommendations:
+      user = users.get(similar_user_id)
+      if not user:
+        continue
+      features = UserFeatures.from_user(user)
       recommendation = {
         "user_id": user.id,
         "name": user.name,
         "email": user.email,
         "profile_image": user.profile_image,
         "bio": user.bio,
-        "role": user.role,
+        "role": user.job,
         "similarity_score": similarity,
         "collaboration_preference": self._format_collaboration_preference(user.collaboration_preference),
         "tech_stacks": [{"tech": stack.tech, "level": stack.level} for stack in user.tech_stacks],
         "interests": [{"category": interest.interest_category, "name": interest.interest_name} 
                     for interest in user.interests],
-        "common_tech_stacks": self._get_common_tech_stacks(target_user, user),
-        "common_interests": self._get_common_interests(target_user, user)
+        "common_tech_stacks": self._get_common_tech_stacks(target_features, features),
+        "common_interests": self._get_common_interests(target_features, features)
       }
       recommendations.append(recommendation)
     
     return recommendations
   
+  def get_cached_follow_recommendations(self, user_id: int, limit: int = 10, min_similarity: float = 0.1) -> Tuple[List[Dict[str, Any]], datetime]:
+    """
+    캐시된 팔로우 추천과 계산 시각을 반환합니다.
+    
+    유저별 상위 TOP_K개를 캐시에 보관하고 limit / min_similarity는 조회 시 적용합니다.
+    캐시가 없으면 즉시 계산하고, 오래된 항목은 백그라운드에서 갱신합니다.
+    
+    Returns:
+        Tuple[List[Dict], datetime]: (추천 목록, 계산 시각)
+    """
+    index = self.index
+    
+    def compute(db: Session, target_user_id: int) -> List[Dict[str, Any]]:
+      return RecommendationRepository(db, index=index).get_follow_recommendations(
+        user_id=target_user_id,
+        limit=RecommendationCache.TOP_K,
+        min_similarity=0.0
+      )
+    
+    recommendations, computed_at = self.cache.get(self.db, user_id, compute)
+    return [
+      recommendation for recommendation in recommendations
+      if recommendation["similarity_score"] >= min_similarity
+    ][:limit], computed_at
+  
   def get_similarity_breakdown(self, user_id: int, target_user_id: int) -> Dict[str, Any]:
     """
     두 유저 간의 상세 유사도 분석을 반환합니다.
@@ -71,45 +114,75 @@ class RecommendationRepository:
     Returns:
         Dict: 상세 유사도 분석 결과
     """
-    user1 = self.db.query(User).filter(User.id == user_id).first()
-    user2 = self.db.query(User).filter(User.id == target_user_id).first()
-    
-    if not user1 or not user2:
+    breakdowns = self.get_similarity_breakdowns(user_id=user_id, target_user_ids=[target_user_id])
+    if not breakdowns:
       raise HTTPException(status_code=404, detail="User not found")
+    return breakdowns[0]
+  
+  def get_similarity_breakdowns(self, user_id: int, target_user_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    기준 유저와 여러 유저 간의 상세 유사도 분석을 한 번에 반환합니다.
     
-    # 각 구성요소별 유사도 계산
-    collaboration_sim = similarity_calculator._calculate_collaboration_similarity(user1, user2)
-    tech_stack_sim = similarity_calculator._calculate_tech_stack_similarity(user1, user2)
-    interests_sim = similarity_calculator._calculate_interests_similarity(user1, user2)
+    기준 유저와 대상 유저들의 특성을 집합 쿼리로 한 번만 읽고,
+    구성요소별 유사도는 모든 대상에 대해 벡터 연산으로 계산합니다.
     
-    # 전체 유사도 계산
-    total_similarity = similarity_calculator.calculate_similarity(user1, user2)
+    Args:
+        user_id: 기준 유저 ID
+        target_user_ids: 비교 대상 유저 ID 목록 (존재하지 않는 ID는 제외)
+        
+    Returns:
+        List[Dict]: 요청 순서대로 정렬된 상세 유사도 분석 결과
+    """
+    target_ids = list(dict.fromkeys(target_user_ids))
+    features = load_features(self.db, [user_id, *target_ids])
+    viewer = features.get(user_id)
+    if viewer is None:
+      raise HTTPException(status_code=404, detail="User not found")
     
-    return {
-      "total_similarity": total_similarity,
-      "breakdown": {
-        "collaboration_preference": {
-          "similarity": collaboration_sim,
-          "weight": similarity_calculator.COLLABORATION_WEIGHT,
-          "contribution": collaboration_sim * similarity_calculator.COLLABORATION_WEIGHT
-        },
-        "tech_stacks": {
-          "similarity": tech_stack_sim,
-          "weight": similarity_calculator.TECH_STACK_WEIGHT,
-          "contribution": tech_stack_sim * similarity_calculator.TECH_STACK_WEIGHT
+    found_ids = [target_id for target_id in target_ids if target_id in features]
+    components = similarity_components(viewer, {target_id: features[target_id] for target_id in found_ids})
+    
+    breakdowns = []
+    for target_id in found_ids:
+      target = features[target_id]
+      collaboration_sim, tech_stack_sim, interests_sim = components[target_id]
+      
+      # calculate_similarity와 같은 가중합/반올림
+      total_similarity = round(
+        collaboration_sim * similarity_calculator.COLLABORATION_WEIGHT +
+        tech_stack_sim * similarity_calculator.TECH_STACK_WEIGHT +
+        interests_sim * similarity_calculator.INTERESTS_WEIGHT,
+        4
+      )
+      
+      breakdowns.append({
+        "target_user_id": target_id,
+        "total_similarity": total_similarity,
+        "breakdown": {
+          "collaboration_preference": {
+            "similarity": collaboration_sim,
+            "weight": similarity_calculator.COLLABORATION_WEIGHT,
+            "contribution": collaboration_sim * similarity_calculator.COLLABORATION_WEIGHT
+          },
+          "tech_stacks": {
+            "similarity": tech_stack_sim,
+            "weight": similarity_calculator.TECH_STACK_WEIGHT,
+            "contribution": tech_stack_sim * similarity_calculator.TECH_STACK_WEIGHT
+          },
+          "interests": {
+            "similarity": interests_sim,
+            "weight": similarity_calculator.INTERESTS_WEIGHT,
+            "contribution": interests_sim * similarity_calculator.INTERESTS_WEIGHT
+          }
         },
-        "interests": {
-          "similarity": interests_sim,
-          "weight": similarity_calculator.INTERESTS_WEIGHT,
-          "contribution": interests_sim * similarity_calculator.INTERESTS_WEIGHT
+        "common_elements": {
+          "tech_stacks": self._get_common_tech_stacks(viewer, target),
+          "interests": self._get_common_interests(viewer, target),
+          "collaboration_preferences": self._get_common_collaboration_preferences(viewer, target)
         }
-      },
-      "common_elements": {
-        "tech_stacks": self._get_common_tech_stacks(user1, user2),
-        "interests": self._get_common_interests(user1, user2),
-        "collaboration_preferences": self._get_common_collaboration_preferences(user1, user2)
-      }
-    }
+      })
+    
+    return breakdowns
     
   def _format_collaboration_preference(self, preference) -> Optional[Dict[str, Any]]:
     """협업 선호도를 포맷팅합니다."""
@@ -128,65 +201,45 @@ class RecommendationRepository:
       "preferred_project_length": preference.preferred_project_length
     }
     
-  def _get_common_tech_stacks(self, user1: User, user2: User) -> List[Dict[str, Any]]:
+  def _get_common_tech_stacks(self, features1: UserFeatures, features2: UserFeatures) -> List[Dict[str, Any]]:
     """두 유저의 공통 기술 스택을 반환합니다."""
-    tech1 = {stack.tech: stack.level for stack in user1.tech_stacks}
-    tech2 = {stack.tech: stack.level for stack in user2.tech_stacks}
-    
-    common_techs = set(tech1.keys()) & set(tech2.keys())
-    
     return [
       {
         "tech": tech,
-        "user1_level": tech1[tech],
-        "user2_level": tech2[tech],
-        "level_difference": abs(tech1[tech] - tech2[tech])
+        "user1_level": level,
+        "user2_level": features2.techs[tech],
+        "level_difference": abs(level - features2.techs[tech])
       }
-      for tech in common_techs
+      for tech, level in features1.techs.items()
+      if tech in features2.techs
     ]
     
-  def _get_common_interests(self, user1: User, user2: User) -> List[Dict[str, Any]]:
+  def _get_common_interests(self, features1: UserFeatures, features2: UserFeatures) -> List[Dict[str, Any]]:
     """두 유저의 공통 관심분야를 반환합니다."""
-    interests1 = {(interest.interest_category, interest.interest_name) for interest in user1.interests}
-    interests2 = {(interest.interest_category, interest.interest_name) for interest in user2.interests}
-    
-    common_interests = interests1 & interests2
-    
     return [
       {"category": category, "name": name}
-      for category, name in common_interests
+      for category, name in features1.interests & features2.interests
     ]
     
-  def _get_common_collaboration_preferences(self, user1: User, user2: User) -> Dict[str, Any]:
+  def _get_common_collaboration_preferences(self, features1: UserFeatures, features2: UserFeatures) -> Dict[str, Any]:
     """두 유저의 공통 협업 선호도를 반환합니다."""
-    pref1 = user1.collaboration_preference
-    pref2 = user2.collaboration_preference
+    pref1 = features1.preference
+    pref2 = features2.preference
     
     if not pref1 or not pref2:
       return {}
     
     common_preferences = {}
     
-    # 각 필드별로 공통점 찾기
-    if (pref1.collaboration_style and pref2.collaboration_style and 
-        pref1.collaboration_style.lower() == pref2.collaboration_style.lower()):
-        common_preferences["collaboration_style"] = pref1.collaboration_style
-    
-    if (pref1.preferred_project_type and pref2.preferred_project_type and 
-        pref1.preferred_project_type.lower() == pref2.preferred_project_type.lower()):
-        common_preferences["preferred_project_type"] = pref1.preferred_project_type
-    
-    if (pref1.preferred_role and pref2.preferred_role and 
-        pref1.preferred_role.lower() == pref2.preferred_role.lower()):
-        common_preferences["preferred_role"] = pref1.preferred_role
-    
-    if (pref1.available_time_zone and pref2.available_time_zone and 
-        pref1.available_time_zone == pref2.available_time_zone):
-        common_preferences["available_time_zone"] = pref1.available_time_zone
-    
-    if (pref1.preferred_project_length and pref2.preferred_project_length and 
-        pref1.preferred_project_length.lower() == pref2.preferred_project_length.lower()):
-        common_preferences["preferred_project_length"] = pref1.preferred_project_length
+    # 각 필드별로 공통점 찾기 (시간대는 대소문자까지 일치해야 함)
+    for field in ("collaboration_style", "preferred_project_type", "preferred_role", "available_time_zone", "preferred_project_length"):
+      value1, value2 = pref1.get(field), pref2.get(field)
+      if not value1 or not value2:
+        continue
+      if field == "available_time_zone" and value1 != value2:
+        continue
+      if value1.lower() == value2.lower():
+        common_preferences[field] = value1
     
     return common_preferences
   
@@ -207,7 +260,7 @@ class RecommendationRepository:
     
     total_active_users = self.db.query(User).filter(User.status == "active").count()
     
-    following_count = len(target_user.following)
+    following_count, _ = FollowRepository(self.db).get_counts([user_id])[user_id]
     
     available_for_recommendation = total_active_users - 1 - following_count
     
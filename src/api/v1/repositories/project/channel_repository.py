@@ -10,6 +10,7 @@ from fastapi import HTTPException
 from typing import List
 from sqlalchemy import and_
 from src.api.v1.models.association_tables import channel_members
+from src.core.utils.user_projection import PRINCIPAL_COLUMNS, UserPrincipal
 
 class ChannelRepository:
   def __init__(self, db: Session):
@@ -23,7 +24,7 @@ class ChannelRepository:
     # 채널 멤버 로드 (User + role, joined_at 포함)
     member_rows = (
       self.db.query(
-        User,
+        *PRINCIPAL_COLUMNS,
         channel_members.c.role,
         channel_members.c.joined_at,
       )
@@ -34,11 +35,11 @@ class ChannelRepository:
 
     members = [
       ChannelMemberResponse(
-        user=UserBrief.model_validate(user, from_attributes=True),
-        role=role,
-        joined_at=joined_at,
+        user=UserBrief.model_validate(UserPrincipal.from_row(row), from_attributes=True),
+        role=row.role,
+        joined_at=row.joined_at,
       )
-      for (user, role, joined_at) in member_rows
+      for row in member_rows
     ]
 
     return ChannelDetail(
@@ -228,13 +229,13 @@ class ChannelRepository:
     if not channel:
       raise HTTPException(status_code=404, detail="채널을 찾을 수 없습니다.")
     
-    users = self.db.query(User).join(channel_members).filter(
+    users = self.db.query(*PRINCIPAL_COLUMNS).join(channel_members).filter(
         and_(
           channel_members.c.channel_id == channel_id,
         )
     ).all()
     
-    return [UserBrief.model_validate(user, from_attributes=True) for user in users]
+    return [UserBrief.model_validate(UserPrincipal.from_row(row), from_attributes=True) for row in users]
     
   def is_user_member_of_channel(self, project_id: str, channel_id: str, user_id: int) -> bool:
     """
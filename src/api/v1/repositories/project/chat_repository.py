@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 from fastapi import HTTPException
 from typing import List
+from src.core.database.routing import replica_read
 
 class ChatRepository:
   def __init__(self, db: Session):
@@ -25,6 +26,7 @@ class ChatRepository:
     self.db.refresh(db_obj)
     return db_obj
   
+  @replica_read
   def get(self, project_id: str, channel_id: str, user_id: int, chat_id: int) -> ChatDetail:
     """
     채팅 조회
@@ -34,6 +36,7 @@ class ChatRepository:
       raise HTTPException(status_code=404, detail="채팅을 찾을 수 없습니다.")
     return ChatDetail.model_validate(chat, from_attributes=True)
   
+  @replica_read
   def get_by_project_id(self, project_id: str, skip: int = 0, limit: int = 100) -> List[ChatDetail]:
     """
     프로젝트별 채팅 조회
@@ -41,6 +44,7 @@ class ChatRepository:
     chats = self.db.query(Chat).filter(Chat.project_id == project_id).offset(skip).limit(limit).all()
     return [ChatDetail.model_validate(chat, from_attributes=True) for chat in chats]
     
+  @replica_read
   def get_by_channel_id(self, project_id: str, channel_id: str, skip: int = 0, limit: int = 100) -> List[ChatDetail]:
     """
     채널별 채팅 조회
@@ -48,6 +52,7 @@ class ChatRepository:
     chats = self.db.query(Chat).filter(Chat.project_id == project_id, Chat.channel_id == channel_id).offset(skip).limit(limit).all()
     return [ChatDetail.model_validate(chat, from_attributes=True) for chat in chats]
   
+  @replica_read
   def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100) -> List[ChatDetail]:
     """
     사용자별 채팅 조회
@@ -55,6 +60,7 @@ class ChatRepository:
     chats = self.db.query(Chat).filter(Chat.user_id == user_id).offset(skip).limit(limit).all()
     return [ChatDetail.model_validate(chat, from_attributes=True) for chat in chats]
     
+  @replica_read
   def get_by_date_range(self, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100) -> List[ChatDetail]:
     """
     날짜 범위별 채팅 조회
@@ -62,6 +68,7 @@ class ChatRepository:
     chats = self.db.query(Chat).filter(Chat.timestamp >= start_date, Chat.timestamp <= end_date).offset(skip).limit(limit).all()
     return [ChatDetail.model_validate(chat, from_attributes=True) for chat in chats]
     
+  @replica_read
   def search(self, search_term: str, skip: int = 0, limit: int = 100) -> List[ChatDetail]:
     """
     검색어로 채팅 조회
@@ -5,6 +5,8 @@ from src.api.v1.schemas.brief import UserBrief
 from src.api.v1.models.project.milestone import Milestone
 from src.api.v1.models.project.project import Project
 from src.api.v1.models.user.user import User
+from src.api.v1.repositories.project.project_stat_repository import ProjectStatRepository
+from src.core.utils.project_events import record_project_event, entity_fields, CREATED, UPDATED, DELETED
 from fastapi import HTTPException
 from datetime import datetime
 from typing import List
@@ -12,6 +14,7 @@ from typing import List
 class MilestoneRepository:
   def __init__(self, db: Session):
     self.db = db
+    self.stats = ProjectStatRepository(db)
     
   def create(self, project_id: str, milestone: MilestoneCreate) -> Milestone:
     """
@@ -32,7 +35,19 @@ class MilestoneRepository:
         raise HTTPException(status_code=404, detail="일부 담당자를 찾을 수 없습니다.")
       db_obj.assignees = assignees
     
+    # 통계 카운터 반영
+    self.stats.increment(
+      db_obj.project_id,
+      total_milestones=1,
+      completed_milestones=1 if db_obj.status == "completed" else 0
+    )
+    
     self.db.add(db_obj)
+    self.db.flush()
+    record_project_event(
+      self.db, project_id, "milestone", CREATED, db_obj.id,
+      {**entity_fields(db_obj), "assignee_ids": [assignee.id for assignee in db_obj.assignees]}
+    )
     self.db.commit()
     self.db.refresh(db_obj)
     return db_obj
@@ -47,10 +62,12 @@ class MilestoneRepository:
       raise HTTPException(status_code=404, detail="마일스톤을 찾을 수 없습니다.")
     
     update_data = obj_in.model_dump(exclude_unset=True)
+    changes = {}
 
     if "assignee_ids" in update_data:
       assignee_ids = update_data.pop("assignee_ids")
       if assignee_ids is not None:
+        changes["assignee_ids"] = assignee_ids
         assignees = self.db.query(User).filter(User.id.in_(assignee_ids)).all()
         if len(assignees) != len(set(assignee_ids)):
           raise HTTPException(status_code=404, detail="일부 담당자를 찾을 수 없습니다.")
@@ -61,8 +78,14 @@ class MilestoneRepository:
         update_data["completed_at"] = datetime.utcnow()
       elif update_data["status"] != "completed" and milestone.status == "completed":
         update_data["completed_at"] = None
+      
+      # 통계 카운터 반영
+      was_completed = 1 if milestone.status == "completed" else 0
+      is_completed = 1 if update_data["status"] == "completed" else 0
+      self.stats.increment(project_id, completed_milestones=is_completed - was_completed)
 
     self.db.query(Milestone).filter(Milestone.project_id == project_id, Milestone.id == milestone_id).update(update_data)
+    record_project_event(self.db, project_id, "milestone", UPDATED, milestone_id, {**update_data, **changes})
     self.db.commit()
     self.db.refresh(milestone)
     return milestone
@@ -84,7 +107,16 @@ class MilestoneRepository:
     if milestone.tasks:
       raise HTTPException(status_code=400, detail="마일스톤에 연결된 업무가 있어 삭제할 수 없습니다. 먼저 업무의 마일스톤 연결을 해제해주세요.")
     
+    # 통계 카운터 반영
+    self.stats.increment(
+      project_id,
+      total_milestones=-1,
+      completed_milestones=-1 if milestone.status == "completed" else 0
+    )
+    self.stats.delete_milestone(id)
+    
     self.db.delete(milestone)
+    record_project_event(self.db, project_id, "milestone", DELETED, id)
     self.db.commit()
     return milestone
   
@@ -1,19 +1,29 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
+from typing import List, Dict, Any, Optional, Tuple, Union
 from src.api.v1.models.project.project import Project
 from src.api.v1.schemas.project.project_schema import ProjectDetail, ProjectCreate, ProjectUpdate
 from src.api.v1.repositories.user.user_repository import UserRepository
 from src.api.v1.models.association_tables import project_members
 from src.api.v1.models.user.user import User
-from src.core.utils.format_project_members import format_member_details
+from src.api.v1.schemas.brief import UserBrief, ProjectBrief
+from src.core.utils.pagination import encode_cursor, decode_cursor
+from src.core.utils.format_project_members import format_members_by_project
 from src.core.utils.calculate_project_stat import calculate_project_stat
+from src.api.v1.repositories.project.project_stat_repository import ProjectStatRepository
+from src.core.utils.project_events import record_project_event, CREATED, UPDATED, DELETED
 from fastapi import status
+from src.core.database.routing import replica_read
 
 class ProjectRepository:
+  BRIEF_COLUMNS = ("id", "title", "description", "status", "team_size", "tags", "project_type")
+  
   def __init__(self, db: Session):
     self.db = db
     
+  @replica_read
   def get(self, project_id: str) -> ProjectDetail:
     """
     프로젝트 ID로 프로젝트 조회
@@ -22,20 +32,10 @@ class ProjectRepository:
     
     if not project:
       raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
-    project_dict = project.__dict__.copy()
-    
-    project_dict["owner"] = UserRepository(self.db).get(project.owner_id)
-    
-    formatted_members = [
-        format_member_details(self.db, project.id, member) 
-        for member in project.members
-    ]
-    project_dict["members"] = formatted_members
     
-    project_dict["stats"] = calculate_project_stat(project)
-    
-    return ProjectDetail.model_validate(project_dict, from_attributes=True)
+    return self._hydrate_projects([project])[0]
   
+  @replica_read
   def get_all_projects(self) -> List[ProjectDetail]:
     """
     모든 프로젝트 조회
@@ -44,57 +44,25 @@ class ProjectRepository:
     if not projects:
       raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
     
-    result = []
-    for project in projects:
-      project_dict = project.__dict__.copy()
-      project_dict["owner"] = UserRepository(self.db).get(project.owner_id)
-      formatted_members = [
-          format_member_details(self.db, project.id, member)
-          for member in project.members
-      ]
-      
-      project_dict["members"] = formatted_members
-      
-      project_dict["stats"] = calculate_project_stat(project)
-      
-      result.append(ProjectDetail.model_validate(project_dict, from_attributes=True))
-    
-    return result
+    return self._hydrate_projects(projects)
   
+  @replica_read
   def get_by_user_id(self, user_id: int) -> List[ProjectDetail]:
     """
     사용자 ID로 프로젝트 조회
     """
-    user = UserRepository(self.db).get(user_id)
-    if not user:
-      raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    self._ensure_user_exists(user_id)
     
     projects = self.db.query(Project).filter(Project.members.any(User.id == user_id)).all()
     
-    result = []
-    for project in projects:
-      project_dict = project.__dict__.copy()
-      project_dict["owner"] = UserRepository(self.db).get(project.owner_id)
-      formatted_members = [
-          format_member_details(self.db, project.id, member)
-          for member in project.members
-      ]
-      
-      project_dict["members"] = formatted_members
-      
-      project_dict["stats"] = calculate_project_stat(project)
-      
-      result.append(ProjectDetail.model_validate(project_dict, from_attributes=True))
-    
-    return result
+    return self._hydrate_projects(projects)
   
+  @replica_read
   def get_all_projects_excluding_my(self, user_id: int) -> List[ProjectDetail]:
     """
     사용자가 속한 프로젝트를 제외한 모든 프로젝트 조회
     """
-    user = UserRepository(self.db).get(user_id)
-    if not user:
-      raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    self._ensure_user_exists(user_id)
     
     # 사용자가 속한 프로젝트 ID 목록을 가져옵니다.
     user_projects = self.db.query(project_members.c.project_id).filter(
@@ -106,23 +74,97 @@ class ProjectRepository:
         ~Project.id.in_(self.db.query(user_projects))
     ).all()
     
+    return self._hydrate_projects(projects)
+  
+  @replica_read
+  def get_projects_page(
+    self,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: str = "detail",
+    exclude_user_id: Optional[int] = None
+  ) -> Tuple[List[Union[ProjectDetail, ProjectBrief]], Optional[str]]:
+    """
+    프로젝트 목록 페이지 조회 (키셋 페이지네이션)
+    기본 키(id) 순으로 정렬하며, 다음 페이지 커서를 함께 반환합니다.
+    fields="brief"인 경우 멤버와 통계 없이 ProjectBrief를 반환합니다.
+    """
+    query = self.db.query(Project)
+    
+    if exclude_user_id is not None:
+      self._ensure_user_exists(exclude_user_id)
+      user_projects = self.db.query(project_members.c.project_id).filter(
+        project_members.c.user_id == exclude_user_id
+      )
+      query = query.filter(~Project.id.in_(user_projects))
+    
+    position = decode_cursor(cursor)
+    if position:
+      query = query.filter(Project.id > str(position.get("id", "")))
+    
+    if fields == "brief":
+      query = query.options(load_only(*[getattr(Project, field) for field in self.BRIEF_COLUMNS]))
+    
+    projects = query.order_by(Project.id).limit(limit + 1).all()
+    
+    next_cursor = None
+    if len(projects) > limit:
+      projects = projects[:limit]
+      last = projects[-1]
+      next_cursor = encode_cursor({"id": last.id})
+    
+    if fields == "brief":
+      items = [
+        ProjectBrief.model_validate({field: getattr(project, field) for field in self.BRIEF_COLUMNS})
+        for project in projects
+      ]
+    else:
+      items = self._hydrate_projects(projects)
+    
+    return items, next_cursor
+  
+  def _hydrate_projects(self, projects: List[Project]) -> List[ProjectDetail]:
+    """
+    여러 프로젝트를 ProjectDetail로 변환
+    소유자, 멤버, 통계를 프로젝트 수와 무관하게 고정된 수의 쿼리로 조회합니다.
+    """
+    if not projects:
+      return []
+    
+    project_ids = [project.id for project in projects]
+    
+    owner_ids = {project.owner_id for project in projects if project.owner_id is not None}
+    owners = {}
+    if owner_ids:
+      owners = {
+        owner.id: UserBrief.model_validate(owner, from_attributes=True)
+        for owner in self.db.query(User).filter(User.id.in_(owner_ids)).all()
+      }
+    
+    members_by_project = format_members_by_project(self.db, project_ids)
+    counts_by_project = ProjectStatRepository(self.db).get_counts(project_ids)
+    
     result = []
     for project in projects:
-      project_dict = project.__dict__.copy()
-      project_dict["owner"] = UserRepository(self.db).get(project.owner_id)
-      formatted_members = [
-          format_member_details(self.db, project.id, member)
-          for member in project.members
-      ]
-      
-      project_dict["members"] = formatted_members
-      
-      project_dict["stats"] = calculate_project_stat(project)
+      # 관계 속성이 로드되어 있어도 컬럼 값만 사용
+      project_dict = {attr.key: getattr(project, attr.key) for attr in inspect(Project).column_attrs}
+      project_dict["owner"] = owners.get(project.owner_id)
+      project_dict["members"] = members_by_project.get(project.id, [])
+      project_dict["stats"] = calculate_project_stat(counts_by_project.get(project.id, {}), project.end_date)
       
       result.append(ProjectDetail.model_validate(project_dict, from_attributes=True))
     
     return result
   
+  def _ensure_user_exists(self, user_id: int) -> None:
+    """
+    사용자 존재 여부 확인
+    """
+    exists = self.db.query(User.id).filter(User.id == user_id).first()
+    if not exists:
+      raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+  
+  @replica_read
   def get_all_project_ids(self) -> List[str]:
     """
     모든 프로젝트 ID 조회
@@ -166,6 +208,11 @@ class ProjectRepository:
       db_obj.members = [owner]
     
     self.db.add(db_obj)
+    self.db.flush()
+    
+    # 통계 카운터 생성
+    ProjectStatRepository(self.db).create(db_obj.id)
+    
     self.db.commit()
     self.db.refresh(db_obj)
     
@@ -240,10 +287,12 @@ class ProjectRepository:
     db_obj = self.db.query(Project).filter(Project.id == project_id).first()
     if not db_obj:
       raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+    ProjectStatRepository(self.db).delete(project_id)
     self.db.delete(db_obj)
     self.db.commit()
     return db_obj
   
+  @replica_read
   def get_project_members(self, project_id: str) -> List[Dict[str, Any]]:
     """
     프로젝트 멤버 정보 조회 (역할, 리더 여부, 관리자 여부, 가입일 포함)
@@ -253,12 +302,7 @@ class ProjectRepository:
     if not project:
       raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
     
-    formatted_members = [
-      format_member_details(self.db, project.id, member)
-      for member in project.members
-    ]
-    
-    return formatted_members
+    return format_members_by_project(self.db, [project.id])[project.id]
   
   def add_member(self, project_id: str, user_id: int) -> Project:
     """
@@ -276,6 +320,7 @@ class ProjectRepository:
       raise HTTPException(status_code=400, detail="이미 프로젝트의 멤버입니다.")
     
     orm_project.members.append(orm_user)
+    record_project_event(self.db, project_id, "member", CREATED, user_id, UserBrief.model_validate(orm_user, from_attributes=True).model_dump())
     self.db.commit()
     self.db.refresh(orm_project)
     return orm_project
@@ -362,6 +407,7 @@ class ProjectRepository:
     # 5. 프로젝트 멤버에서 사용자 제거
     project.members.remove(user)
     
+    record_project_event(self.db, project_id, "member", DELETED, user_id)
     self.db.commit()
     self.db.refresh(project)
     return project
@@ -415,7 +461,42 @@ class ProjectRepository:
       "is_leader": is_leader,
       "is_manager": is_manager
     })
+    record_project_event(self.db, project_id, "member", UPDATED, user_id, {"role": role, "is_leader": is_leader, "is_manager": is_manager})
         
     self.db.commit()
     self.db.refresh(project)
-    return project
\ No newline at end of file
+    return project
+
+
+class AsyncProjectRepository:
+  """
+  프로젝트 조회 저장소 (비동기 세션)
+  자주 호출되는 읽기 경로만 제공하며, ProjectRepository의 조회 로직을 AsyncSession.run_sync로 실행합니다.
+  쿼리는 비동기 드라이버(asyncpg/aiosqlite)로 나가므로 응답을 기다리는 동안 이벤트 루프가 막히지 않습니다.
+  """
+  def __init__(self, db: AsyncSession):
+    self.db = db
+    
+  async def _run(self, method: str, *args):
+    return await self.db.run_sync(lambda session: getattr(ProjectRepository(session), method)(*args))
+    
+  async def get(self, project_id: str) -> ProjectDetail:
+    return await self._run("get", project_id)
+  
+  async def get_by_user_id(self, user_id: int) -> List[ProjectDetail]:
+    return await self._run("get_by_user_id", user_id)
+  
+  async def get_projects_page(
+    self,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: str = "detail",
+    exclude_user_id: Optional[int] = None
+  ) -> Tuple[List[Union[ProjectDetail, ProjectBrief]], Optional[str]]:
+    return await self._run("get_projects_page", limit, cursor, fields, exclude_user_id)
+  
+  async def get_all_project_ids(self) -> List[str]:
+    return await self._run("get_all_project_ids")
+  
+  async def get_project_members(self, project_id: str) -> List[Dict[str, Any]]:
+    return await self._run("get_project_members", project_id)
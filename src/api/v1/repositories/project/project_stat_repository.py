@@ -0,0 +1,229 @@
+from sqlalchemy import func, case, update, insert, delete
+from sqlalchemy.orm import Session
+from typing import List, Dict, Optional
+from src.api.v1.models.project.project import Project
+from src.api.v1.models.project.task import Task, SubTask
+from src.api.v1.models.project.milestone import Milestone
+from src.api.v1.models.project.project_stat import ProjectStat, MilestoneStat
+from src.core.database.upsert import insert_ignore
+
+PROJECT_COUNTERS = (
+  "total_tasks",
+  "completed_tasks",
+  "total_milestones",
+  "completed_milestones",
+  "total_subtasks",
+  "completed_subtasks",
+)
+
+MILESTONE_COUNTERS = (
+  "total_tasks",
+  "completed_tasks",
+)
+
+class ProjectStatRepository:
+  """
+  프로젝트/마일스톤 통계 카운터 저장소
+  업무, 하위 업무, 마일스톤 쓰기 시 같은 트랜잭션에서 증감값을 반영합니다.
+  """
+  def __init__(self, db: Session):
+    self.db = db
+    
+  def get_counts(self, project_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """
+    여러 프로젝트의 카운터 조회
+    카운터 행이 없는 프로젝트는 집계 쿼리로 계산합니다.
+    """
+    if not project_ids:
+      return {}
+    
+    rows = self.db.query(
+      ProjectStat.project_id,
+      *[getattr(ProjectStat, counter) for counter in PROJECT_COUNTERS]
+    ).filter(ProjectStat.project_id.in_(project_ids)).all()
+    
+    counts = {row[0]: dict(zip(PROJECT_COUNTERS, row[1:])) for row in rows}
+    
+    missing = [project_id for project_id in project_ids if project_id not in counts]
+    if missing:
+      counts.update(self._aggregate_project_counts(missing))
+    
+    return counts
+  
+  def get_milestone_counts(self, milestone_id: int) -> Dict[str, int]:
+    """
+    마일스톤 카운터 조회
+    """
+    row = self.db.query(
+      *[getattr(MilestoneStat, counter) for counter in MILESTONE_COUNTERS]
+    ).filter(MilestoneStat.milestone_id == milestone_id).first()
+    
+    if row:
+      return dict(zip(MILESTONE_COUNTERS, row))
+    return self._aggregate_milestone_counts([milestone_id])[milestone_id]
+  
+  def create(self, project_id: str) -> None:
+    """
+    새 프로젝트의 빈 카운터 생성
+    """
+    self.db.execute(insert(ProjectStat).values(
+      project_id=project_id,
+      **{counter: 0 for counter in PROJECT_COUNTERS}
+    ))
+  
+  def increment(self, project_id: str, **deltas: int) -> None:
+    """
+    프로젝트 카운터 증감
+    변경 사항이 플러시되기 전에 호출해야 합니다.
+    """
+    deltas = {counter: delta for counter, delta in deltas.items() if delta}
+    if not deltas:
+      return
+    
+    self._ensure_project_row(project_id)
+    self.db.execute(
+      update(ProjectStat)
+      .where(ProjectStat.project_id == project_id)
+      .values({counter: getattr(ProjectStat, counter) + delta for counter, delta in deltas.items()})
+    )
+  
+  def increment_milestone(self, milestone_id: int, project_id: str, **deltas: int) -> None:
+    """
+    마일스톤 카운터 증감
+    변경 사항이 플러시되기 전에 호출해야 합니다.
+    """
+    deltas = {counter: delta for counter, delta in deltas.items() if delta}
+    if not deltas:
+      return
+    
+    self._ensure_milestone_row(milestone_id, project_id)
+    self.db.execute(
+      update(MilestoneStat)
+      .where(MilestoneStat.milestone_id == milestone_id)
+      .values({counter: getattr(MilestoneStat, counter) + delta for counter, delta in deltas.items()})
+    )
+  
+  def delete(self, project_id: str) -> None:
+    """
+    프로젝트 카운터 삭제
+    """
+    self.db.execute(delete(MilestoneStat).where(MilestoneStat.project_id == project_id))
+    self.db.execute(delete(ProjectStat).where(ProjectStat.project_id == project_id))
+  
+  def delete_milestone(self, milestone_id: int) -> None:
+    """
+    마일스톤 카운터 삭제
+    """
+    self.db.execute(delete(MilestoneStat).where(MilestoneStat.milestone_id == milestone_id))
+  
+  def reconcile(self, project_ids: Optional[List[str]] = None) -> int:
+    """
+    카운터 재구성
+    project_ids가 없으면 모든 프로젝트의 카운터를 다시 계산합니다.
+    """
+    query = self.db.query(Project.id)
+    if project_ids is not None:
+      query = query.filter(Project.id.in_(project_ids))
+    project_ids = [row[0] for row in query.all()]
+    if not project_ids:
+      return 0
+    
+    project_counts = self._aggregate_project_counts(project_ids)
+    milestone_ids = [
+      row[0] for row in self.db.query(Milestone.id).filter(Milestone.project_id.in_(project_ids)).all()
+    ]
+    milestone_counts = self._aggregate_milestone_counts(milestone_ids)
+    milestone_projects = dict(
+      self.db.query(Milestone.id, Milestone.project_id).filter(Milestone.id.in_(milestone_ids)).all()
+    ) if milestone_ids else {}
+    
+    self.db.execute(delete(MilestoneStat).where(MilestoneStat.project_id.in_(project_ids)))
+    self.db.execute(delete(ProjectStat).where(ProjectStat.project_id.in_(project_ids)))
+    
+    self.db.execute(insert(ProjectStat), [
+      {"project_id": project_id, **counts} for project_id, counts in project_counts.items()
+    ])
+    if milestone_counts:
+      self.db.execute(insert(MilestoneStat), [
+        {"milestone_id": milestone_id, "project_id": milestone_projects[milestone_id], **counts}
+        for milestone_id, counts in milestone_counts.items()
+      ])
+    
+    return len(project_counts)
+  
+  def _ensure_project_row(self, project_id: str) -> None:
+    """
+    카운터 행이 없으면 현재 데이터로 계산하여 생성
+    """
+    with self.db.no_autoflush:
+      exists = self.db.query(ProjectStat.project_id).filter(ProjectStat.project_id == project_id).first()
+      if exists:
+        return
+      counts = self._aggregate_project_counts([project_id])[project_id]
+    # 동시에 첫 쓰기가 일어나면 먼저 만든 행을 그대로 사용
+    insert_ignore(self.db, ProjectStat, [{"project_id": project_id, **counts}])
+  
+  def _ensure_milestone_row(self, milestone_id: int, project_id: str) -> None:
+    """
+    마일스톤 카운터 행이 없으면 현재 데이터로 계산하여 생성
+    """
+    with self.db.no_autoflush:
+      exists = self.db.query(MilestoneStat.milestone_id).filter(MilestoneStat.milestone_id == milestone_id).first()
+      if exists:
+        return
+      counts = self._aggregate_milestone_counts([milestone_id])[milestone_id]
+    insert_ignore(self.db, MilestoneStat, [{"milestone_id": milestone_id, "project_id": project_id, **counts}])
+  
+  def _aggregate_project_counts(self, project_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """
+    업무, 마일스톤, 하위 업무 테이블에서 프로젝트별 카운터 집계
+    """
+    counts = {project_id: {counter: 0 for counter in PROJECT_COUNTERS} for project_id in project_ids}
+    
+    task_rows = self.db.query(
+      Task.project_id,
+      func.count(Task.id),
+      func.sum(case((Task.status == "completed", 1), else_=0))
+    ).filter(Task.project_id.in_(project_ids)).group_by(Task.project_id).all()
+    for project_id, total, completed in task_rows:
+      counts[project_id]["total_tasks"] = total
+      counts[project_id]["completed_tasks"] = completed or 0
+    
+    milestone_rows = self.db.query(
+      Milestone.project_id,
+      func.count(Milestone.id),
+      func.sum(case((Milestone.status == "completed", 1), else_=0))
+    ).filter(Milestone.project_id.in_(project_ids)).group_by(Milestone.project_id).all()
+    for project_id, total, completed in milestone_rows:
+      counts[project_id]["total_milestones"] = total
+      counts[project_id]["completed_milestones"] = completed or 0
+    
+    subtask_rows = self.db.query(
+      Task.project_id,
+      func.count(SubTask.id),
+      func.sum(case((SubTask.is_completed.is_(True), 1), else_=0))
+    ).join(SubTask, SubTask.task_id == Task.id).filter(Task.project_id.in_(project_ids)).group_by(Task.project_id).all()
+    for project_id, total, completed in subtask_rows:
+      counts[project_id]["total_subtasks"] = total
+      counts[project_id]["completed_subtasks"] = completed or 0
+    
+    return counts
+  
+  def _aggregate_milestone_counts(self, milestone_ids: List[int]) -> Dict[int, Dict[str, int]]:
+    """
+    업무 테이블에서 마일스톤별 카운터 집계
+    """
+    counts = {milestone_id: {counter: 0 for counter in MILESTONE_COUNTERS} for milestone_id in milestone_ids}
+    if not milestone_ids:
+      return counts
+    
+    rows = self.db.query(
+      Task.milestone_id,
+      func.count(Task.id),
+      func.sum(case((Task.status == "completed", 1), else_=0))
+    ).filter(Task.milestone_id.in_(milestone_ids)).group_by(Task.milestone_id).all()
+    for milestone_id, total, completed in rows:
+      counts[milestone_id]["total_tasks"] = total
+      counts[milestone_id]["completed_tasks"] = completed or 0
+    
+    return counts
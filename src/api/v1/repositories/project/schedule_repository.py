@@ -4,6 +4,7 @@ from src.api.v1.models.project.schedule import Schedule
 from src.api.v1.models.association_tables import project_members
 from src.api.v1.models.project import Project
 from src.api.v1.models.user import User
+from src.core.utils.project_events import record_project_event, entity_fields, CREATED, UPDATED, DELETED
 from fastapi import HTTPException, status
 from typing import List
 
@@ -28,6 +29,10 @@ class ScheduleRepository:
           if user:
             db_schedule.assignees.append(user)
       
+      record_project_event(
+        self.db, project_id, "schedule", CREATED, db_schedule.id,
+        {**entity_fields(db_schedule), "assignee_ids": [assignee.id for assignee in db_schedule.assignees]}
+      )
       self.db.commit()
       self.db.refresh(db_schedule)
       return ScheduleDetail.model_validate(db_schedule, from_attributes=True)
@@ -68,10 +73,12 @@ class ScheduleRepository:
       
       obj_data = obj.__dict__
       update_data = obj_in.model_dump(exclude_unset=True, exclude={"assignee_ids"})
+      changes = {}
       
       for field in obj_data:
         if field in update_data:
           setattr(obj, field, update_data[field])
+          changes[field] = update_data[field]
       
       if hasattr(obj_in, "assignee_ids") and obj_in.assignee_ids is not None:
         obj.assignees = []
@@ -79,8 +86,10 @@ class ScheduleRepository:
           user = self.db.query(User).filter(User.id == user_id).first()
           if user:
             obj.assignees.append(user)
+        changes["assignee_ids"] = [assignee.id for assignee in obj.assignees]
       
       self.db.add(obj)
+      record_project_event(self.db, project_id, "schedule", UPDATED, schedule_id, changes)
       self.db.commit()
       self.db.refresh(obj)
       return ScheduleDetail.model_validate(obj, from_attributes=True)
@@ -95,6 +104,7 @@ class ScheduleRepository:
     try:
       obj = self.db.query(Schedule).filter(Schedule.id == schedule_id, Schedule.project_id == project_id).first()
       self.db.delete(obj)
+      record_project_event(self.db, project_id, "schedule", DELETED, schedule_id)
       self.db.commit()
       return ScheduleDetail.model_validate(obj, from_attributes=True)
     except Exception as e:
@@ -1,9 +1,12 @@
+from sqlalchemy import func, case
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from src.api.v1.models.project.task import Task, SubTask, Comment
 from src.api.v1.models.user.user import User
 from src.api.v1.models.project.project import Project
 from src.api.v1.models.project.milestone import Milestone
+from src.api.v1.repositories.project.project_stat_repository import ProjectStatRepository
+from src.core.utils.project_events import record_project_event, entity_fields, CREATED, UPDATED, DELETED
 from src.api.v1.schemas.project.task_schema import CommentCreate, CommentUpdate, TaskDetail, TaskCreate, TaskUpdate, SubTaskCreate, SubTaskUpdate
 from typing import List
 from datetime import datetime
@@ -11,6 +14,7 @@ from datetime import datetime
 class TaskRepository:
   def __init__(self, db: Session):
     self.db = db
+    self.stats = ProjectStatRepository(db)
     
   def get(self, project_id: str, task_id: int) -> TaskDetail:
     """
@@ -73,6 +77,19 @@ class TaskRepository:
         raise HTTPException(status_code=404, detail="일부 담당자를 찾을 수 없습니다.")
       db_obj.assignees = assignees
     
+    # 통계 카운터 반영
+    completed = 1 if db_obj.status == "completed" else 0
+    subtasks = task.subtasks or []
+    self.stats.increment(
+      db_obj.project_id,
+      total_tasks=1,
+      completed_tasks=completed,
+      total_subtasks=len(subtasks),
+      completed_subtasks=sum(1 for subtask in subtasks if subtask.is_completed)
+    )
+    if db_obj.milestone_id:
+      self.stats.increment_milestone(db_obj.milestone_id, db_obj.project_id, total_tasks=1, completed_tasks=completed)
+    
     self.db.add(db_obj)
     self.db.flush()
     
@@ -87,12 +104,16 @@ class TaskRepository:
         )
         self.db.add(subtask)
     
-    self.db.commit()
-    self.db.refresh(db_obj)
-    
     if db_obj.milestone_id:
       self._update_milestone_progress(db_obj.milestone_id)
     
+    record_project_event(
+      self.db, project_id, "task", CREATED, db_obj.id,
+      {**entity_fields(db_obj), "assignee_ids": [assignee.id for assignee in db_obj.assignees]}
+    )
+    self.db.commit()
+    self.db.refresh(db_obj)
+    
     return db_obj
     
   
@@ -108,9 +129,21 @@ class TaskRepository:
     milestone_id = task.milestone_id
     
     try:
-      # 먼저 마일스톤 진행도 업데이트 (아직 task가 삭제되기 전이므로 정상적으로 계산됨)
+      # 통계 카운터 반영
+      completed = 1 if task.status == "completed" else 0
+      total_subtasks, completed_subtasks = self.db.query(
+        func.count(SubTask.id),
+        func.sum(case((SubTask.is_completed.is_(True), 1), else_=0))
+      ).filter(SubTask.task_id == task_id).one()
+      self.stats.increment(
+        task.project_id,
+        total_tasks=-1,
+        completed_tasks=-completed,
+        total_subtasks=-total_subtasks,
+        completed_subtasks=-(completed_subtasks or 0)
+      )
       if milestone_id:
-        self._update_milestone_progress(milestone_id)
+        self.stats.increment_milestone(milestone_id, task.project_id, total_tasks=-1, completed_tasks=-completed)
       
       # 연관된 하위 작업 삭제
       self.db.query(SubTask).filter(SubTask.task_id == task_id).delete()
@@ -121,6 +154,11 @@ class TaskRepository:
       # 작업 삭제
       self.db.delete(task)
       
+      if milestone_id:
+        self._update_milestone_progress(milestone_id)
+      
+      record_project_event(self.db, project_id, "task", DELETED, task_id)
+      
       # 모든 변경사항을 한 번에 커밋
       self.db.commit()
       
@@ -151,9 +189,11 @@ class TaskRepository:
         raise HTTPException(status_code=400, detail="마일스톤이 업무의 프로젝트에 속하지 않습니다.")
       
     # 담당자 업데이트
+    changes = {}
     if "assignee_ids" in update_data:
       assignee_ids = update_data.pop("assignee_ids")
       if assignee_ids is not None:
+        changes["assignee_ids"] = assignee_ids
         assignees = self.db.query(User).filter(User.id.in_(assignee_ids)).all()
         if len(assignees) != len(set(assignee_ids)):
           raise HTTPException(status_code=404, detail="일부 담당자를 찾을 수 없습니다.")
@@ -167,44 +207,50 @@ class TaskRepository:
       elif update_data["status"] != "completed" and db_task.status == "completed":
         update_data["completed_at"] = None
     
+    # 통계 카운터 반영
+    was_completed = 1 if db_task.status == "completed" else 0
+    is_completed = 1 if update_data.get("status", db_task.status) == "completed" else 0
+    new_milestone_id = update_data.get("milestone_id", old_milestone_id)
+    
+    self.stats.increment(db_task.project_id, completed_tasks=is_completed - was_completed)
+    if old_milestone_id == new_milestone_id:
+      if old_milestone_id:
+        self.stats.increment_milestone(old_milestone_id, db_task.project_id, completed_tasks=is_completed - was_completed)
+    else:
+      if old_milestone_id:
+        self.stats.increment_milestone(old_milestone_id, db_task.project_id, total_tasks=-1, completed_tasks=-was_completed)
+      if new_milestone_id:
+        self.stats.increment_milestone(new_milestone_id, db_task.project_id, total_tasks=1, completed_tasks=is_completed)
+    
     for key, value in update_data.items():
       setattr(db_task, key, value)
     
     self.db.add(db_task)
-    self.db.commit()
-    self.db.refresh(db_task)
     
     if old_milestone_id:
         self._update_milestone_progress(old_milestone_id)
-    if db_task.milestone_id and db_task.milestone_id != old_milestone_id:
-        self._update_milestone_progress(db_task.milestone_id)
+    if new_milestone_id and new_milestone_id != old_milestone_id:
+        self._update_milestone_progress(new_milestone_id)
+    
+    record_project_event(self.db, project_id, "task", UPDATED, task_id, {**update_data, **changes})
+    self.db.commit()
+    self.db.refresh(db_task)
     
     return db_task
   
   def _update_milestone_progress(self, milestone_id: int) -> None:
     """
     마일스톤의 진행도를 업데이트
+    마일스톤 통계 카운터를 사용하므로 업무 수와 무관하게 일정한 비용이 듭니다.
     """
-    # 현재 세션의 변경사항을 플러시하여 데이터베이스에 반영
-    self.db.flush()
-    
-    milestone = self.db.query(Milestone).filter(Milestone.id == milestone_id).first()
-    if not milestone:
-      return
-    
-    # Get all tasks for this milestone
-    tasks = self.db.query(Task).filter(Task.milestone_id == milestone_id).all()
+    counts = self.stats.get_milestone_counts(milestone_id)
+    total_tasks = counts["total_tasks"]
+    progress = int((counts["completed_tasks"] / total_tasks) * 100) if total_tasks > 0 else 0
     
-    if not tasks:
-      milestone.progress = 0
-    else:
-      total_tasks = len(tasks)
-      completed_tasks = sum(1 for task in tasks if task.status == "completed")
-      milestone.progress = int((completed_tasks / total_tasks) * 100) if total_tasks > 0 else 0
-    
-    self.db.add(milestone)
+    self.db.query(Milestone).filter(Milestone.id == milestone_id).update(
+      {"progress": progress}, synchronize_session=False
+    )
     # 여기서는 커밋하지 않고 호출한 쪽에서 커밋하도록 합니다.
-    self.db.flush()
     
   
   def add_assignee(self, project_id: str, task_id: int, user_id: int) -> Task:
@@ -221,6 +267,7 @@ class TaskRepository:
     if user not in task.assignees:
       task.assignees.append(user)
       self.db.add(task)
+      record_project_event(self.db, project_id, "task", UPDATED, task_id, {"assignee_ids": [a.id for a in task.assignees]})
       self.db.commit()
       self.db.refresh(task)
     return task
@@ -239,6 +286,7 @@ class TaskRepository:
     if user in task.assignees:
       task.assignees.remove(user)
       self.db.add(task)
+      record_project_event(self.db, project_id, "task", UPDATED, task_id, {"assignee_ids": [a.id for a in task.assignees]})
       self.db.commit()
       self.db.refresh(task)
     return task
@@ -260,6 +308,8 @@ class TaskRepository:
     
     if task.created_by != user_id and user_id not in [a.id for a in task.assignees] and not self.is_manager(project_id, task_id, user_id):
       raise HTTPException(status_code=403, detail="이 업무에 하위 업무를 추가할 권한이 없습니다.")
+    self.stats.increment(task.project_id, total_subtasks=1)
+    
     subtask = SubTask(
       title=subtask.title,
       task_id=task_id,
@@ -299,6 +349,11 @@ class TaskRepository:
     # Get update data, excluding unset fields and id
     update_data = subtask_update.model_dump(exclude_unset=True, exclude={"id"})
     
+    # 통계 카운터 반영
+    if "is_completed" in update_data and update_data["is_completed"] is not None:
+      delta = int(bool(update_data["is_completed"])) - int(bool(subtask_to_update.is_completed))
+      self.stats.increment(task.project_id, completed_subtasks=delta)
+    
     # Apply updates
     for field, value in update_data.items():
       setattr(subtask_to_update, field, value)
@@ -334,6 +389,12 @@ class TaskRepository:
       not self.is_manager(project_id, task_id, user_id)):
       raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="이 하위 업무를 삭제할 권한이 없습니다.")
     
+    self.stats.increment(
+      task.project_id,
+      total_subtasks=-1,
+      completed_subtasks=-1 if subtask.is_completed else 0
+    )
+    
     self.db.delete(subtask)
     self.db.commit()
     return subtask
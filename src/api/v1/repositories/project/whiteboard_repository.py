@@ -20,7 +20,9 @@ from src.api.v1.schemas.project.whiteboard_schema import (
 )
 from src.api.v1.schemas.brief import UserBrief
 from src.api.v1.models.project.project import Project
-from typing import List, Set
+from src.core.utils.view_counter import view_counter
+from sqlalchemy import bindparam, func, insert, update
+from typing import Dict, List, Set
 from datetime import datetime
 import logging
 
@@ -35,6 +37,7 @@ class WhiteBoardRepository:
     seen_user_ids: Set[int] = set()
     comment_items: List[Comment] = []
 
+    total_views += view_counter.pending("whiteboard", whiteboard.id)
     for r in (whiteboard.reactions or []):
       total_views += (r.views or 0)
       # Collect unique users who liked
@@ -289,22 +292,8 @@ class WhiteBoardRepository:
       if not whiteboard:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="화이트보드를 찾을 수 없습니다.")
 
-      # Find or create a reaction aggregate for this whiteboard
-      reaction = (
-        self.db.query(WhiteboardReaction)
-        .filter(WhiteboardReaction.whiteboard_id == whiteboard_id)
-        .first()
-      )
-      if not reaction:
-        reaction = WhiteboardReaction(whiteboard_id=whiteboard_id, views=1)
-        self.db.add(reaction)
-        self.db.flush()
-      else:
-        reaction.views = (reaction.views or 0) + 1
-        self.db.add(reaction)
-
-      self.db.commit()
-      self.db.refresh(whiteboard)
+      # 조회수는 버퍼에 모았다가 주기적으로 한 번에 반영 (응답에는 반영 전 증가분 포함)
+      view_counter.add("whiteboard", whiteboard_id)
 
       return self._attach_reactions(whiteboard)
     except Exception as e:
@@ -379,4 +368,37 @@ class WhiteBoardRepository:
       raise HTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail=f"댓글 삭제 중 오류 발생: {str(e)}"
-      )
\ No newline at end of file
+      )
+  
+  def apply_views(self, deltas: Dict[int, int]) -> None:
+    """
+    모인 조회수 증가분을 반영합니다. (view_counter가 호출)
+    화이트보드의 첫 반응 행에 원자적으로 더하고, 반응 행이 없으면 만듭니다. 삭제된 화이트보드는 건너뜁니다.
+    """
+    whiteboard_ids = [
+      row[0] for row in self.db.query(WhiteBoard.id).filter(WhiteBoard.id.in_(list(deltas))).all()
+    ]
+    if not whiteboard_ids:
+      return
+    
+    reaction_ids = dict(
+      self.db.query(WhiteboardReaction.whiteboard_id, func.min(WhiteboardReaction.id))
+      .filter(WhiteboardReaction.whiteboard_id.in_(whiteboard_ids))
+      .group_by(WhiteboardReaction.whiteboard_id)
+      .all()
+    )
+    reactions = WhiteboardReaction.__table__
+    if reaction_ids:
+      self.db.execute(
+        update(reactions)
+        .where(reactions.c.id == bindparam("reaction_id"))
+        .values(views=func.coalesce(reactions.c.views, 0) + bindparam("delta")),
+        [{"reaction_id": reaction_id, "delta": deltas[whiteboard_id]} for whiteboard_id, reaction_id in reaction_ids.items()]
+      )
+    missing = [whiteboard_id for whiteboard_id in whiteboard_ids if whiteboard_id not in reaction_ids]
+    if missing:
+      self.db.execute(insert(WhiteboardReaction), [
+        {"whiteboard_id": whiteboard_id, "views": deltas[whiteboard_id]} for whiteboard_id in missing
+      ])
+
+view_counter.register("whiteboard", lambda db, deltas: WhiteBoardRepository(db).apply_views(deltas))
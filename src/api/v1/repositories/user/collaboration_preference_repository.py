@@ -2,6 +2,8 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from src.api.v1.models.user.collaboration_preference import CollaborationPreference as DBCollaborationPreference
 from src.api.v1.schemas.user.collaboration_preference_schema import CollaborationPreferenceCreate, CollaborationPreferenceUpdate, CollaborationPreference
+from src.core.utils.similarity_index import similarity_index
+from src.core.utils.recommendation_cache import recommendation_cache
 
 class CollaborationPreferenceRepository:
   def __init__(self, db: Session):
@@ -21,6 +23,8 @@ class CollaborationPreferenceRepository:
     self.db.add(db_obj)
     self.db.commit()
     self.db.refresh(db_obj)
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return db_obj
     
   def update(self, user_id: int, preference_data: CollaborationPreferenceUpdate) -> DBCollaborationPreference:
@@ -31,4 +35,6 @@ class CollaborationPreferenceRepository:
     self.db.add(db_obj)
     self.db.commit()
     self.db.refresh(db_obj)
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return db_obj
\ No newline at end of file
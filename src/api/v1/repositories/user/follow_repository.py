@@ -1,10 +1,17 @@
+from sqlalchemy import func, literal, select, union_all
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from fastapi import status
+from typing import Dict, Iterable, Optional, Tuple
 from src.api.v1.models.association_tables import user_follows
 from src.api.v1.models.user import User
+from src.api.v1.schemas.brief import UserBrief
 from src.api.v1.schemas.user.follow_schema import FollowList, FollowCreate, FollowResponse
+from src.core.database.routing import replica_read
+from src.core.utils.pagination import decode_cursor, encode_cursor
+from src.core.utils.recommendation_cache import recommendation_cache
+from src.core.utils.user_projection import UserPrincipal, select_principals
 
 class FollowRepository:
   def __init__(self, db: Session):
@@ -35,6 +42,7 @@ class FollowRepository:
         )
       )
       self.db.commit()
+      recommendation_cache.invalidate(follow_create.follower_id)
     except IntegrityError as e:
       self.db.rollback()
       if "duplicate key" in str(e).lower():
@@ -47,12 +55,80 @@ class FollowRepository:
   def delete(self, follow_create: FollowCreate) -> FollowResponse:
     self.db.execute(user_follows.delete().where(user_follows.c.follower_id == follow_create.follower_id, user_follows.c.followed_id == follow_create.followed_id))
     self.db.commit()
+    recommendation_cache.invalidate(follow_create.follower_id)
     
-  def get_followers(self, user_id: int) -> FollowList:
-    followers = self.db.query(user_follows.c.follower_id).filter(user_follows.c.followed_id == user_id).all()
-    return FollowList(count=len(followers), users=followers)
+  @replica_read
+  def get_counts(self, user_ids: Iterable[int]) -> Dict[int, Tuple[int, int]]:
+    """
+    사용자별 (팔로잉 수, 팔로워 수)를 한 번의 집계 쿼리로 조회합니다.
+    팔로우 관계가 없는 사용자는 (0, 0)입니다.
+    """
+    user_ids = list(set(user_ids))
+    counts = {user_id: (0, 0) for user_id in user_ids}
+    if not user_ids:
+      return counts
     
-  def get_followed(self, user_id: int) -> FollowList:
-    followed = self.db.query(user_follows.c.followed_id).filter(user_follows.c.follower_id == user_id).all()
-    return FollowList(count=len(followed), users=followed)
-    
\ No newline at end of file
+    edges = union_all(
+      select(
+        user_follows.c.follower_id.label("user_id"),
+        literal(1).label("following"),
+        literal(0).label("followers")
+      ).where(user_follows.c.follower_id.in_(user_ids)),
+      select(
+        user_follows.c.followed_id.label("user_id"),
+        literal(0).label("following"),
+        literal(1).label("followers")
+      ).where(user_follows.c.followed_id.in_(user_ids))
+    ).subquery()
+    rows = self.db.execute(
+      select(edges.c.user_id, func.sum(edges.c.following), func.sum(edges.c.followers)).group_by(edges.c.user_id)
+    )
+    for user_id, following, followers in rows:
+      counts[user_id] = (int(following), int(followers))
+    return counts
+  
+  def get_summary(self, user_id: int) -> Tuple[FollowList, FollowList]:
+    """(팔로잉, 팔로워) 수만 담은 FollowList 한 쌍 (사용자 목록은 비어 있음)"""
+    following, followers = self.get_counts([user_id])[user_id]
+    return FollowList(count=following), FollowList(count=followers)
+  
+  @replica_read
+  def get_page(
+    self,
+    user_id: int,
+    followers: bool,
+    limit: int = 20,
+    cursor: Optional[str] = None
+  ) -> Tuple[FollowList, Optional[str]]:
+    """
+    팔로워(followers=True) 또는 팔로잉 목록 페이지 조회 (사용자 ID 순 키셋 페이지네이션)
+    count는 전체 수이며, 다음 페이지 커서를 함께 반환합니다.
+    """
+    if followers:
+      user_column, owner_column = user_follows.c.follower_id, user_follows.c.followed_id
+    else:
+      user_column, owner_column = user_follows.c.followed_id, user_follows.c.follower_id
+    
+    query = select_principals(owner_column == user_id).join(user_follows, User.id == user_column)
+    position = decode_cursor(cursor)
+    if position:
+      query = query.where(User.id > int(position.get("id", 0)))
+    principals = [
+      UserPrincipal.from_row(row)
+      for row in self.db.execute(query.order_by(User.id).limit(limit + 1))
+    ]
+    
+    next_cursor = None
+    if len(principals) > limit:
+      principals = principals[:limit]
+      next_cursor = encode_cursor({"id": principals[-1].id})
+    
+    following_count, followers_count = self.get_counts([user_id])[user_id]
+    users = [UserBrief.model_validate(principal, from_attributes=True) for principal in principals]
+    return FollowList(count=followers_count if followers else following_count, users=users), next_cursor
+    
+  def get_followers(self, user_id: int, limit: int = 20, cursor: Optional[str] = None) -> Tuple[FollowList, Optional[str]]:
+    return self.get_page(user_id, followers=True, limit=limit, cursor=cursor)
+    
+  def get_followed(self, user_id: int, limit: int = 20, cursor: Optional[str] = None) -> Tuple[FollowList, Optional[str]]:
+    return self.get_page(user_id, followers=False, limit=limit, cursor=cursor)
@@ -2,6 +2,8 @@ from typing import List
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from src.api.v1.models.user.interest import UserInterest as DBInterest
+from src.core.utils.similarity_index import similarity_index
+from src.core.utils.recommendation_cache import recommendation_cache
 from src.api.v1.schemas.user.interest_schema import (
     InterestCreate,
     InterestUpdate
@@ -58,6 +60,8 @@ class InterestRepository:
     self.db.add(db_interest)
     self.db.commit()
     self.db.refresh(db_interest)
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return db_interest
   
   def update_interest(
@@ -91,6 +95,8 @@ class InterestRepository:
     self.db.add(db_interest)
     self.db.commit()
     self.db.refresh(db_interest)
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return db_interest
   
   def delete_interest(self, interest_id: int, user_id: int) -> None:
@@ -98,4 +104,6 @@ class InterestRepository:
     db_interest = self.get_interest(interest_id, user_id)
     self.db.delete(db_interest)
     self.db.commit()
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return None
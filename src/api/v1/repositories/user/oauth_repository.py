@@ -5,6 +5,7 @@ from fastapi.responses import RedirectResponse
 from src.api.v1.schemas.user.user_schema import UserCreate, UserDetail
 from src.core.security.oauth import get_github_user_info, get_google_user_info
 from src.core.security.jwt import create_access_token
+from src.core.security.auth_cache import auth_cache
 from fastapi import HTTPException, status
 from datetime import datetime
 from src.api.v1.schemas.user.oauth_schema import OauthRequest
@@ -83,6 +84,7 @@ class AuthRepository:
           existing.status = "active"
           self.db.commit()
           self.db.refresh(existing)
+          auth_cache.invalidate_user(existing.email)
         except Exception as e:
           raise HTTPException(status_code=500, detail=str(e))
         
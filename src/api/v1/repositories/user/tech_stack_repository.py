@@ -2,6 +2,8 @@ from typing import List
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from src.api.v1.models.user.tech_stack import UserTechStack as DBTechStack
+from src.core.utils.similarity_index import similarity_index
+from src.core.utils.recommendation_cache import recommendation_cache
 from src.api.v1.schemas.user.tech_stack_schema import (
     TechStackCreate,
     TechStackUpdate
@@ -57,6 +59,8 @@ class TechStackRepository:
     self.db.add(db_tech)
     self.db.commit()
     self.db.refresh(db_tech)
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return db_tech
   
   def update_tech_stack(
@@ -89,6 +93,8 @@ class TechStackRepository:
     self.db.add(db_tech)
     self.db.commit()
     self.db.refresh(db_tech)
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return db_tech
   
   def delete_tech_stack(self, tech_stack_id: int, user_id: int) -> None:
@@ -96,4 +102,6 @@ class TechStackRepository:
     db_tech = self.get_tech_stack(tech_stack_id, user_id)
     self.db.delete(db_tech)
     self.db.commit()
+    similarity_index.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
     return None
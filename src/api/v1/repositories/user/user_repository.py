@@ -4,34 +4,36 @@ from typing import List
 from datetime import datetime
 
 from src.core.security.password import get_password_hash
+from src.core.utils.similarity_index import similarity_index
+from src.core.utils.recommendation_cache import recommendation_cache
+from src.core.utils.user_brief_cache import user_brief_cache
+from src.core.security.auth_cache import auth_cache
+from src.core.utils.user_projection import load_principal
 from src.api.v1.models.user.user import User
 from src.api.v1.models.user.tech_stack import UserTechStack
 from src.api.v1.models.user.interest import UserInterest
 from src.api.v1.models.user.social_link import UserSocialLink
 from src.api.v1.models.user.collaboration_preference import CollaborationPreference
+from src.api.v1.repositories.user.follow_repository import FollowRepository
 from src.api.v1.schemas.user.user_schema import UserCreate, UserUpdate, UserDetail, UserNolinks
 from src.api.v1.schemas.brief import UserBrief
 from src.api.v1.schemas.user.follow_schema import FollowList
 from src.api.v1.schemas.user.user_schema import UserNolinks
+from src.core.database.routing import replica_read
 
 class UserRepository:
   def __init__(self, db: Session):
     self.db = db
     
+  @replica_read
   def get(self, user_id: int) -> UserDetail:
     """Get user by ID with related resource URLs"""
     db_user = self.db.query(User).filter(User.id == user_id).first()
     if not db_user:
       raise HTTPException(status_code=404, detail="User not found")
     
-    following_users = db_user.following.all()
-    followers_users = db_user.followers.all()
-    
-    following_briefs = [UserBrief.model_validate(user, from_attributes=True) for user in following_users]
-    followers_briefs = [UserBrief.model_validate(user, from_attributes=True) for user in followers_users]
-    
-    following_list = FollowList(count=len(following_briefs), users=following_briefs)
-    followers_list = FollowList(count=len(followers_briefs), users=followers_briefs)
+    # 팔로워/팔로잉은 수만 포함 (목록은 팔로우 API에서 페이지 단위로 조회)
+    following_list, followers_list = FollowRepository(self.db).get_summary(user_id)
     
     user_dict = {
         "id": db_user.id,
@@ -57,12 +59,13 @@ class UserRepository:
     
     user_detail = UserDetail(**user_dict)
     return user_detail
+  @replica_read
   def get_user_brief(self, user_id: int) -> UserBrief:
-    db_user = self.db.query(User).filter(User.id == user_id).first()
-    if not db_user:
+    principal = load_principal(self.db, User.id == user_id)
+    if principal is None:
       raise HTTPException(status_code=404, detail="User not found")
     
-    user_brief = UserBrief.model_validate(db_user, from_attributes=True)
+    user_brief = UserBrief.model_validate(principal, from_attributes=True)
     return user_brief
   
   def get_by_email(self, email: str) -> User:
@@ -71,6 +74,7 @@ class UserRepository:
   def get_all(self) -> List[User]:
     return self.db.query(User).all()
   
+  @replica_read
   def get_multi(self, skip: int = 0, limit: int = 100) -> List[User]:
     return self.db.query(User).offset(skip).limit(limit).all()
     
@@ -158,6 +162,8 @@ class UserRepository:
 
       self.db.commit()
       self.db.refresh(db_obj)
+      similarity_index.invalidate(db_obj.id)
+      recommendation_cache.invalidate(db_obj.id)
       
       return db_obj
     except Exception as e:
@@ -172,6 +178,7 @@ class UserRepository:
     db_user = self.db.query(User).filter(User.id == user_id).first()
     if not db_user:
       raise HTTPException(status_code=404, detail="User not found")
+    previous_email = db_user.email
     
     # 비밀번호가 제공되면 해싱 처리
     if "password" in update_data:
@@ -206,6 +213,14 @@ class UserRepository:
     self.db.commit()
     self.db.refresh(db_user)
     
+    user_brief_cache.invalidate(user_id)
+    auth_cache.invalidate_user(previous_email)
+    auth_cache.invalidate_user(db_user.email)
+    if tech_stacks_data is not None or interests_data is not None or collaboration_preference_data is not None:
+      similarity_index.invalidate(user_id)
+    # 추천 항목에는 이름, 이메일, 프로필 이미지, 소개, 직무도 담기므로 수정할 때마다 제거
+    recommendation_cache.invalidate(user_id)
+    
     # Return UserDetail schema
     return self.get(user_id)
   
@@ -216,6 +231,10 @@ class UserRepository:
       raise HTTPException(status_code=404, detail="User not found")
     self.db.delete(db_user)
     self.db.commit()
+    similarity_index.invalidate(user_id)
+    user_brief_cache.invalidate(user_id)
+    recommendation_cache.invalidate(user_id)
+    auth_cache.invalidate_user(db_user.email)
     return db_user
           
   def update_last_login(self, user_id: int) -> User:
@@ -230,9 +249,11 @@ class UserRepository:
     user.last_login = datetime.now()
     self.db.commit()
     self.db.refresh(user)
+    auth_cache.invalidate_user(user.email)
     return user
   
 
+  @replica_read
   def get_users_exclude_me(self, user_id: int) -> List[UserDetail]:
     """Get all users except the current user"""
     user = self.db.query(User).filter(User.id == user_id).first()
@@ -241,16 +262,13 @@ class UserRepository:
     
     other_users = self.db.query(User).filter(User.id != user_id).all()
     
+    follow_counts = FollowRepository(self.db).get_counts(user.id for user in other_users)
+    
     result = []
     for user in other_users:
-      following_users = user.following.all()
-      followers_users = user.followers.all()
-      
-      following_briefs = [UserBrief.model_validate(u, from_attributes=True) for u in following_users]
-      followers_briefs = [UserBrief.model_validate(u, from_attributes=True) for u in followers_users]
-      
-      following_list = FollowList(count=len(following_briefs), users=following_briefs)
-      followers_list = FollowList(count=len(followers_briefs), users=followers_briefs)
+      following_count, followers_count = follow_counts[user.id]
+      following_list = FollowList(count=following_count)
+      followers_list = FollowList(count=followers_count)
       
       user_dict = {
         "id": user.id,
@@ -278,6 +296,7 @@ class UserRepository:
     
     return result
   
+  @replica_read
   def get_user_by_id_no_links(self, user_id: int) -> UserNolinks:
     from api.v1.schemas.user.collaboration_preference_schema import CollaborationPreference
     from api.v1.schemas.user.tech_stack_schema import TechStack
@@ -293,14 +312,8 @@ class UserRepository:
     if not db_user:
       return None
       
-    following_users = db_user.following.all()
-    followers_users = db_user.followers.all()
-    
-    following_briefs = [UserBrief.model_validate(u, from_attributes=True) for u in following_users]
-    followers_briefs = [UserBrief.model_validate(u, from_attributes=True) for u in followers_users]
-    
-    following_list = FollowList(count=len(following_briefs), users=following_briefs)
-    followers_list = FollowList(count=len(followers_briefs), users=followers_briefs)
+    # 팔로워/팔로잉은 수만 포함 (목록은 팔로우 API에서 페이지 단위로 조회)
+    following_list, followers_list = FollowRepository(self.db).get_summary(user_id)
     
     project_service = ProjectService(self.db)
     projects = project_service.get_by_user_id(user_id)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from src.core.database.database import get_db
 from src.core.security.auth import get_current_user
@@ -15,7 +15,8 @@ def get_community(
     if not current_user:
       raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     community_service = CommunityService(db)
-    return community_service.get_info(current_user.id)
+    # 캐시된 조각을 이어 붙인 JSON이므로 다시 검증/직렬화하지 않고 그대로 응답
+    return Response(content=community_service.get_info(current_user.id), media_type="application/json")
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -25,13 +26,14 @@ def get_community(
 def get_all_post_tags(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
-    limit: int = None
+    limit: int = None,
+    window: str = Query("all", pattern="^(24h|7d|all)$")
 ):
   try:
     if not current_user:
       raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     community_service = CommunityService(db)
-    return community_service.get_all_tags(limit=limit)
+    return community_service.get_all_tags(limit=limit, window=window)
   except HTTPException as e:
     raise e
   except Exception as e:
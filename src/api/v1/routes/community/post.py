@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from src.api.v1.services.community.post_service import PostService
-from src.api.v1.schemas.community.post_schema import PostCreate, PostUpdate, CommentCreate, PostDetail
+from src.api.v1.schemas.community.post_schema import PostCreate, PostUpdate, CommentCreate, PostDetail, PostReactionAck
 from src.core.security.auth import get_current_user
 from sqlalchemy.orm import Session
+from typing import Optional, Union
 from src.core.database.database import get_db
 
 router = APIRouter(prefix="/api/v1/community/posts", tags=["community_posts"])
@@ -42,6 +43,7 @@ def get_posts(
   
 @router.get("/all")
 def get_all_posts(
+    tag: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -50,7 +52,7 @@ def get_all_posts(
   
   try:
     post_service = PostService(db)
-    return post_service.get_all()
+    return post_service.get_all(tag=tag)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -127,6 +129,7 @@ def delete_post(
 @router.post("/{post_id}/likes")
 def like_post(
     post_id: int,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -135,7 +138,7 @@ def like_post(
   
   try:
     post_service = PostService(db)
-    return post_service.like(post_id, current_user.id)
+    return post_service.like(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -144,6 +147,7 @@ def like_post(
 @router.delete("/{post_id}/likes")
 def delete_like_post(
     post_id: int,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -152,7 +156,7 @@ def delete_like_post(
   
   try:
     post_service = PostService(db)
-    return post_service.delete_like(post_id, current_user.id)
+    return post_service.delete_like(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -161,6 +165,7 @@ def delete_like_post(
 @router.post("/{post_id}/dislikes")
 def dislike_post(
     post_id: int,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -169,7 +174,7 @@ def dislike_post(
   
   try:
     post_service = PostService(db)
-    return post_service.dislike(post_id, current_user.id)
+    return post_service.dislike(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -178,6 +183,7 @@ def dislike_post(
 @router.delete("/{post_id}/dislikes")
 def delete_dislike_post(
     post_id: int,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -186,7 +192,7 @@ def delete_dislike_post(
   
   try:
     post_service = PostService(db)
-    return post_service.delete_dislike(post_id, current_user.id)
+    return post_service.delete_dislike(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -195,6 +201,7 @@ def delete_dislike_post(
 @router.post("/{post_id}/views")
 def view_post(
     post_id: int,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -203,7 +210,7 @@ def view_post(
   
   try:
     post_service = PostService(db)
-    return post_service.view(post_id, current_user.id)
+    return post_service.view(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -213,6 +220,7 @@ def view_post(
 def create_comment_post(
     post_id: int,
     comment_in: CommentCreate,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -221,7 +229,7 @@ def create_comment_post(
   
   try:
     post_service = PostService(db)
-    return post_service.create_comment(post_id, current_user.id, comment_in)
+    return post_service.create_comment(post_id, current_user.id, comment_in, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -231,6 +239,7 @@ def create_comment_post(
 def delete_comment_post(
     post_id: int,
     comment_id: int,
+    fields: str = Query("detail", pattern="^(detail|ack)$"),
     current_user: dict = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -239,15 +248,16 @@ def delete_comment_post(
   
   try:
     post_service = PostService(db)
-    return post_service.delete_comment(post_id, current_user.id, comment_id)
+    return post_service.delete_comment(post_id, current_user.id, comment_id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
     raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/{post_id}/bookmarks", response_model=PostDetail)
+@router.post("/{post_id}/bookmarks", response_model=Union[PostDetail, PostReactionAck])
 def bookmark_post(
   post_id: int,
+  fields: str = Query("detail", pattern="^(detail|ack)$"),
   current_user: dict = Depends(get_current_user),
   db: Session = Depends(get_db)
 ):
@@ -256,15 +266,16 @@ def bookmark_post(
   
   try:
     post_service = PostService(db)
-    return post_service.bookmark(post_id, current_user.id)
+    return post_service.bookmark(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
     raise HTTPException(status_code=400, detail=str(e))
 
-@router.delete("/{post_id}/bookmarks", response_model=PostDetail)
+@router.delete("/{post_id}/bookmarks", response_model=Union[PostDetail, PostReactionAck])
 def delete_bookmark_post(
   post_id: int,
+  fields: str = Query("detail", pattern="^(detail|ack)$"),
   current_user: dict = Depends(get_current_user),
   db: Session = Depends(get_db)
 ):
@@ -273,7 +284,7 @@ def delete_bookmark_post(
   
   try:
     post_service = PostService(db)
-    return post_service.delete_bookmark(post_id, current_user.id)
+    return post_service.delete_bookmark(post_id, current_user.id, fields)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from src.api.v1.services.community.recommendation_service import RecommendationService
-from src.api.v1.schemas.community.recommendation_schema import FollowRecommendationResponse, RecommendationRequest, SimilarityBreakdownResponse, SimilarityAnalysisRequest, RecommendationStatsResponse
+from src.api.v1.schemas.community.recommendation_schema import FollowRecommendationResponse, RecommendationRequest, SimilarityBreakdownResponse, SimilarityAnalysisRequest, RecommendationStatsResponse, BatchSimilarityAnalysisRequest, TargetSimilarityBreakdownResponse
 from typing import List
 from src.core.security.auth import get_current_user
 from src.core.database.database import get_db
@@ -10,6 +10,7 @@ router = APIRouter(prefix="/api/v1/community/recommendation", tags=["recommendat
 
 @router.get("/follow-recommendations", response_model=List[FollowRecommendationResponse])
 async def get_follow_recommendations(
+  response: Response,
   limit: int = 10,
   min_similarity: float = 0.2,
   db: Session = Depends(get_db),
@@ -20,17 +21,20 @@ async def get_follow_recommendations(
       raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     
     service = RecommendationService(db)
-    return service.get_follow_recommendations(
+    recommendations, computed_at = service.get_cached_follow_recommendations(
       user_id=current_user.id,
       limit=limit,
       min_similarity=min_similarity
     )
+    response.headers["X-Recommendations-Computed-At"] = computed_at.isoformat()
+    return recommendations
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
   
 @router.post("/follow-recommendations", response_model=List[FollowRecommendationResponse])
 async def get_follow_recommendations_with_request(
   request: RecommendationRequest,
+  response: Response,
   db: Session = Depends(get_db),
   current_user: dict = Depends(get_current_user)
 ):
@@ -39,11 +43,13 @@ async def get_follow_recommendations_with_request(
       raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     
     service = RecommendationService(db)
-    return service.get_follow_recommendations(
+    recommendations, computed_at = service.get_cached_follow_recommendations(
       user_id=current_user.id,
       limit=request.limit,
       min_similarity=request.min_similarity
     )
+    response.headers["X-Recommendations-Computed-At"] = computed_at.isoformat()
+    return recommendations
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -58,7 +64,7 @@ async def get_similarity_analysis(
       raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     
     service = RecommendationService(db)
-    return service.get_similarity_analysis(
+    return service.get_similarity_breakdown(
       user_id=current_user.id,
       target_user_id=target_user_id
     )
@@ -76,13 +82,31 @@ async def get_similarity_analysis_with_request(
       raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     
     service = RecommendationService(db)
-    return service.get_similarity_analysis(
+    return service.get_similarity_breakdown(
       user_id=current_user.id,
       target_user_id=request.target_user_id
     )
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+@router.post("/similarity-analysis/batch", response_model=List[TargetSimilarityBreakdownResponse])
+async def get_similarity_analysis_batch(
+  request: BatchSimilarityAnalysisRequest,
+  db: Session = Depends(get_db),
+  current_user: dict = Depends(get_current_user)
+):
+  try:
+    if not current_user:
+      raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+    
+    service = RecommendationService(db)
+    return service.get_similarity_breakdowns(
+      user_id=current_user.id,
+      target_user_ids=request.target_user_ids
+    )
+  except Exception as e:
+    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
 @router.get("/stats", response_model=RecommendationStatsResponse)
 async def get_recommendation_stats(
   db: Session = Depends(get_db),
@@ -0,0 +1,5 @@
+from .metrics import router as metrics_router
+
+routers = [
+  metrics_router,
+]
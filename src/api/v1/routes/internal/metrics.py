@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from typing import Any, Dict, List, Optional
+from src.core.config import setting
+from src.core.database.pool_metrics import pool_metrics
+import secrets
+
+router = APIRouter(prefix="/api/v1/internal", tags=["internal"], include_in_schema=False)
+
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+def _authorize(request: Request, token: Optional[str]) -> None:
+  """
+  내부 엔드포인트 접근 확인
+  INTERNAL_METRICS_TOKEN이 설정되어 있으면 X-Internal-Token 헤더로, 아니면 로컬호스트에서만 허용합니다.
+  """
+  if setting.INTERNAL_METRICS_TOKEN:
+    if token and secrets.compare_digest(token, setting.INTERNAL_METRICS_TOKEN):
+      return
+  elif request.client and request.client.host in LOOPBACK_HOSTS:
+    return
+  raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform this action")
+
+@router.get("/db/pools", response_model=List[Dict[str, Any]])
+async def get_db_pool_stats(request: Request, x_internal_token: Optional[str] = Header(None)):
+  """
+  DB 커넥션 풀 상태 조회
+  엔진별 크기, 사용 중/대기 중 연결 수, 오버플로, 연결 대기 시간 히스토그램과 타임아웃 수를 반환합니다.
+  """
+  _authorize(request, x_internal_token)
+  return pool_metrics.snapshot()
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
-from src.core.database.database import get_db
+from src.core.database.database import get_db, get_stream_db
 from src.api.v1.services.project.chat_service import ChatService
 from src.api.v1.schemas.project.chat_schema import ChatCreate, ChatUpdate, ChatDetail
 from src.core.security.auth import get_current_user
@@ -134,7 +134,7 @@ async def chat_endpoint(
     channel_id: str,
     user_id: int,
     access_token: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_stream_db)
 ):
   try:
     verify_token(access_token)
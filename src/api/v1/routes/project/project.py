@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from src.core.database.database import get_db
-from src.api.v1.services.project.project_service import ProjectService
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_db, get_async_db, get_async_stream_db
+from src.api.v1.services.project.project_service import ProjectService, AsyncProjectService
 from src.api.v1.schemas.project.project_schema import ProjectCreate, ProjectUpdate, ProjectDetail
 from src.core.security.auth import get_current_user
-from typing import List, Dict, Any
-from src.core.utils.sse_manager import project_sse_manager
+from src.api.v1.schemas.brief import ProjectBrief
+from typing import List, Dict, Any, Optional, Union
+from src.core.utils.sse_manager import sse_hub
 from fastapi.responses import StreamingResponse
 from fastapi import Request
 import json
@@ -34,7 +36,7 @@ async def create_project(
   
 @router.get("/ids", response_model=List[str])
 async def get_all_project_ids(
-  db: Session = Depends(get_db),
+  db: AsyncSession = Depends(get_async_db),
   current_user: dict = Depends(get_current_user)
 ):
   if not current_user:
@@ -44,8 +46,8 @@ async def get_all_project_ids(
     )
     
   try:
-    service = ProjectService(db)
-    return service.get_all_project_ids()
+    service = AsyncProjectService(db)
+    return await service.get_all_project_ids()
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -54,7 +56,7 @@ async def get_all_project_ids(
 @router.get("/", response_model=List[ProjectDetail])
 async def get_all_projects_by_user(
   user_id: int,
-  db: Session = Depends(get_db),
+  db: AsyncSession = Depends(get_async_db),
   current_user: dict = Depends(get_current_user)
 ):
   if not current_user:
@@ -64,16 +66,20 @@ async def get_all_projects_by_user(
     )
     
   try:
-    service = ProjectService(db)
-    return service.get_by_user_id(user_id)
+    service = AsyncProjectService(db)
+    return await service.get_by_user_id(user_id)
   except HTTPException as e:
     raise e
   except Exception as e:
     raise HTTPException(status_code=400, detail=str(e))
   
-@router.get("/all", response_model=List[ProjectDetail])
+@router.get("/all", response_model=List[Union[ProjectDetail, ProjectBrief]])
 async def get_all_projects(
-  db: Session = Depends(get_db),
+  response: Response,
+  limit: int = Query(20, ge=1, le=100),
+  cursor: Optional[str] = None,
+  fields: str = Query("detail", pattern="^(detail|brief)$"),
+  db: AsyncSession = Depends(get_async_db),
   current_user: dict = Depends(get_current_user)
 ):
   if not current_user:
@@ -83,17 +89,24 @@ async def get_all_projects(
     )
     
   try:
-    service = ProjectService(db)
-    return service.get_all_projects()
+    service = AsyncProjectService(db)
+    projects, next_cursor = await service.get_projects_page(limit=limit, cursor=cursor, fields=fields)
+    if next_cursor:
+      response.headers["X-Next-Cursor"] = next_cursor
+    return projects
   except HTTPException as e:
     raise e
   except Exception as e:
     raise HTTPException(status_code=400, detail=str(e))
   
-@router.get("/exclude", response_model=List[ProjectDetail])
+@router.get("/exclude", response_model=List[Union[ProjectDetail, ProjectBrief]])
 async def get_all_projects_excluding_my(
   user_id: int,
-  db: Session = Depends(get_db),
+  response: Response,
+  limit: int = Query(20, ge=1, le=100),
+  cursor: Optional[str] = None,
+  fields: str = Query("detail", pattern="^(detail|brief)$"),
+  db: AsyncSession = Depends(get_async_db),
   current_user: dict = Depends(get_current_user)
 ):
   if not current_user:
@@ -103,8 +116,11 @@ async def get_all_projects_excluding_my(
     )
     
   try:
-    service = ProjectService(db)
-    return service.get_all_projects_excluding_my(user_id)
+    service = AsyncProjectService(db)
+    projects, next_cursor = await service.get_projects_page(limit=limit, cursor=cursor, fields=fields, exclude_user_id=user_id)
+    if next_cursor:
+      response.headers["X-Next-Cursor"] = next_cursor
+    return projects
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -113,7 +129,7 @@ async def get_all_projects_excluding_my(
 @router.get("/{project_id}", response_model=ProjectDetail)
 async def get_project(
   project_id: str,
-  db: Session = Depends(get_db),
+  db: AsyncSession = Depends(get_async_db),
   current_user: dict = Depends(get_current_user)
 ):
   if not current_user:
@@ -123,8 +139,8 @@ async def get_project(
     )
 
   try:
-    service = ProjectService(db)
-    return service.get_project(project_id)
+    service = AsyncProjectService(db)
+    return await service.get_project(project_id)
   except HTTPException as e:
     raise e
   except Exception as e:
@@ -176,7 +192,7 @@ async def delete_project(
 @router.get("/{project_id}/members", response_model=List[Dict[str, Any]])
 async def get_project_members(
   project_id: str,
-  db: Session = Depends(get_db),
+  db: AsyncSession = Depends(get_async_db),
   current_user: dict = Depends(get_current_user)
 ):
   if not current_user:
@@ -186,33 +202,38 @@ async def get_project_members(
     )
     
   try:
-    service = ProjectService(db)
-    return service.get_project_members(project_id)
+    service = AsyncProjectService(db)
+    return await service.get_project_members(project_id)
   except HTTPException as e:
     raise e
   except Exception as e:
     raise HTTPException(status_code=400, detail=str(e))
   
 @router.get("/{project_id}/sse")
-async def read_project_sse(project_id: str, request: Request, db: Session = Depends(get_db)):
+async def read_project_sse(project_id: str, request: Request, db: AsyncSession = Depends(get_async_stream_db)):
   """프로젝트 SSE 연결"""
-  queue = await project_sse_manager.connect(project_id)
+  # 재연결한 클라이언트는 Last-Event-ID 이후 놓친 이벤트만 받음
+  subscription = await sse_hub.subscribe("project", project_id, last_event_id=request.headers.get("last-event-id"))
   
   async def event_generator():
     try:
-      service = ProjectService(db)
-      db_project = service.get_project(project_id)
-      if db_project:
-        project_dict = project_sse_manager.convert_to_dict(db_project)
-        yield f"data: {json.dumps(project_dict)}\n\n"
+      if not subscription.resumed:
+        try:
+          service = AsyncProjectService(db)
+          db_project = await service.get_project(project_id)
+          if db_project:
+            yield sse_hub.snapshot(subscription, db_project)
+        finally:
+          await db.close()
+      else:
+        await db.close()
+          
+      async for event in sse_hub.stream(subscription):
+        if await request.is_disconnected():
+          break
+        yield event
     finally:
-      db.close()
-        
-    async for event in project_sse_manager.event_generator(project_id, queue):
-      if await request.is_disconnected():
-        await project_sse_manager.disconnect(project_id, queue)
-        break
-      yield event
+      await sse_hub.unsubscribe(subscription)
           
   return StreamingResponse(
     event_generator(),
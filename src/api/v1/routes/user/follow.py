@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
+from typing import Optional
 from src.api.v1.services.user.follow_service import FollowService
 from src.api.v1.schemas.user.follow_schema import FollowCreate, FollowList
 from src.core.security.auth import get_current_user
@@ -42,6 +43,9 @@ def delete_follow(
 @router.get("/followers", response_model=FollowList)
 def get_followers(
   user_id: int,
+  response: Response,
+  limit: int = Query(20, ge=1, le=100),
+  cursor: Optional[str] = None,
   db: Session = Depends(get_db),
   current_user: dict = Depends(get_current_user)
 ):
@@ -50,13 +54,22 @@ def get_followers(
   
   try: 
     follow_service = FollowService(db)
-    return follow_service.get_followers(user_id)
+    followers, next_cursor = follow_service.get_followers(user_id, limit=limit, cursor=cursor)
+    if next_cursor:
+      response.headers["X-Next-Cursor"] = next_cursor
+    return followers
+  except HTTPException as e:
+    raise e
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
+@router.get("/following", response_model=FollowList)
 @router.get("/followed", response_model=FollowList)
 def get_followed(
   user_id: int,
+  response: Response,
+  limit: int = Query(20, ge=1, le=100),
+  cursor: Optional[str] = None,
   db: Session = Depends(get_db),
   current_user: dict = Depends(get_current_user)
 ):
@@ -65,8 +78,11 @@ def get_followed(
   
   try: 
     follow_service = FollowService(db)
-    return follow_service.get_followed(user_id)
+    followed, next_cursor = follow_service.get_followed(user_id, limit=limit, cursor=cursor)
+    if next_cursor:
+      response.headers["X-Next-Cursor"] = next_cursor
+    return followed
+  except HTTPException as e:
+    raise e
   except Exception as e:
     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
-
-
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from src.core.database.database import get_db
+from src.core.database.database import get_db, get_stream_db
 from src.api.v1.schemas.user.notification_schema import (
     Notification,
     NotificationCreate,
@@ -13,7 +13,7 @@ from src.core.security.auth import get_current_user
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 import json
-from src.core.utils.sse_manager import notification_sse_manager
+from src.core.utils.sse_manager import COALESCE, sse_hub
 
 router = APIRouter(
   prefix="/api/v1/users/{user_id}/notifications",
@@ -24,24 +24,32 @@ router = APIRouter(
 async def notification_sse(
   user_id: int,
   request: Request,
-  db: Session = Depends(get_db),
+  db: Session = Depends(get_stream_db),
 ):
-  queue = await notification_sse_manager.connect(user_id)
+  # 알림 스트림은 전체 목록 스냅샷이므로 밀린 이벤트는 최신 하나로 합침
+  # 재연결한 클라이언트는 Last-Event-ID 이후 놓친 이벤트만 받음
+  subscription = await sse_hub.subscribe(
+    "notification", user_id, policy=COALESCE, last_event_id=request.headers.get("last-event-id")
+  )
   
   async def event_generator():
     try:
-      service = NotificationService(db)
-      notifications = service.get_user_notifications(user_id=user_id)
-      notifications_dict = notification_sse_manager.convert_to_dict(notifications)
-      yield f"data: {json.dumps(notifications_dict)}\n\n"
+      if not subscription.resumed:
+        try:
+          service = NotificationService(db)
+          notifications = service.get_user_notifications(user_id=user_id)
+          yield sse_hub.snapshot(subscription, notifications)
+        finally:
+          db.close()
+      else:
+        db.close()
+        
+      async for event in sse_hub.stream(subscription):
+        if await request.is_disconnected():
+          break
+        yield event
     finally:
-      db.close()
-      
-    async for event in notification_sse_manager.event_generator(user_id, queue):
-      if await request.is_disconnected():
-        await notification_sse_manager.disconnect(user_id, queue)
-        break
-      yield event
+      await sse_hub.unsubscribe(subscription)
 
   return StreamingResponse(
     event_generator(),
@@ -47,7 +47,7 @@ class PostComment(BaseModel):
         
 class ReactionUsers(BaseModel):
   count: int
-  users: List[UserBrief]
+  users: List[UserBrief]  # 목록 조회에서는 앞쪽 일부만 포함 (count는 전체 수)
   
   class Config:
     from_attributes = True
@@ -57,11 +57,27 @@ class PostReactions(BaseModel):
   dislikes: ReactionUsers
   views: ReactionUsers
   shares: ReactionUsers
-  comments: List[PostComment]
+  comments: List[PostComment]  # 목록 조회에서는 앞쪽 일부만 포함
+  comments_count: int = 0
     
   class Config:
     from_attributes = True
     
+class PostReactionAck(BaseModel):
+  """반응/댓글/북마크 쓰기 응답 (fields=ack): 새 카운터와 요청자의 상태만 포함"""
+  post_id: int
+  likes: int
+  dislikes: int
+  views: int
+  shares: int
+  comments_count: int
+  my_reaction: Optional[str] = None  # 요청자의 반응 ('like', 'dislike', 'share')
+  bookmarked: bool = False
+  comment: Optional[PostComment] = None  # 댓글 작성 시 생성된 댓글
+  
+  class Config:
+    from_attributes = True
+    
 class PostDetail(PostBase):
   id: int
   created_at: datetime
@@ -67,6 +67,11 @@ class SimilarityBreakdownResponse(BaseModel):
   common_elements: Dict[str, Any] = Field(..., description="공통 요소들")
 
 
+class TargetSimilarityBreakdownResponse(SimilarityBreakdownResponse):
+  """대상 유저별 유사도 분석 응답"""
+  target_user_id: int
+
+
 class RecommendationStatsResponse(BaseModel):
   """추천 통계 응답"""
   user_id: int
@@ -85,3 +90,8 @@ class RecommendationRequest(BaseModel):
 class SimilarityAnalysisRequest(BaseModel):
   """유사도 분석 요청"""
   target_user_id: int = Field(..., description="비교 대상 유저 ID")
+
+
+class BatchSimilarityAnalysisRequest(BaseModel):
+  """일괄 유사도 분석 요청"""
+  target_user_ids: List[int] = Field(..., min_length=1, max_length=50, description="비교 대상 유저 ID 목록")
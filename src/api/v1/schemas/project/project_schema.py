@@ -53,6 +53,8 @@ class ProjectStats(BaseModel):
   completed_tasks: int = 0
   total_milestones: int = 0
   completed_milestones: int = 0
+  total_subtasks: int = 0
+  completed_subtasks: int = 0
   progress_percentage: float = 0.0
   days_remaining: Optional[int] = None
   
@@ -62,6 +64,7 @@ class ProjectStats(BaseModel):
 class ProjectDetail(ProjectBase):
   id: str
   completed_at: Optional[datetime] = None
+  version: int = 0
   
   owner: Optional[UserBrief] = None
   members: List[ProjectMember] = []
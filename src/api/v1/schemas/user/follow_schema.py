@@ -11,7 +11,7 @@ class FollowCreate(FollowBase):
   
 class FollowList(BaseModel):
   count: int
-  users: List[UserBrief]
+  users: List[UserBrief] = []  # 사용자 상세에서는 비어 있음 (목록은 팔로워/팔로잉 API로 조회)
   
 class FollowResponse(BaseModel):
   user: UserBrief
\ No newline at end of file
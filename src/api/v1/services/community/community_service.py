@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, List
 from sqlalchemy.orm import Session
 from src.api.v1.repositories.community.community_repository import CommunityRepository
 
@@ -6,8 +6,8 @@ class CommunityService:
   def __init__(self, db: Session):
     self.repository = CommunityRepository(db)
     
-  def get_info(self, user_id: int) -> Dict[str, Any]:
+  def get_info(self, user_id: int) -> bytes:
     return self.repository.get_info(user_id=user_id)
   
-  def get_all_tags(self, limit: int = None) -> List[Dict[str, int]]:
-    return self.repository.get_all_tags(limit=limit)
\ No newline at end of file
+  def get_all_tags(self, limit: int = None, window: str = "all") -> List[Dict[str, int]]:
+    return self.repository.get_all_tags(limit=limit, window=window)
\ No newline at end of file
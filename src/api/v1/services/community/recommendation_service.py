@@ -1,4 +1,5 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
 from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
 
@@ -9,8 +10,14 @@ class RecommendationService:
   def get_follow_recommendations(self, user_id: int, limit: int = 10, min_similarity: float = 0.1) -> List[Dict[str, Any]]:
     return self.repository.get_follow_recommendations(user_id=user_id, limit=limit, min_similarity=min_similarity)
   
+  def get_cached_follow_recommendations(self, user_id: int, limit: int = 10, min_similarity: float = 0.1) -> Tuple[List[Dict[str, Any]], datetime]:
+    return self.repository.get_cached_follow_recommendations(user_id=user_id, limit=limit, min_similarity=min_similarity)
+  
   def get_similarity_breakdown(self, user_id: int, target_user_id: int) -> Dict[str, Any]:
     return self.repository.get_similarity_breakdown(user_id=user_id, target_user_id=target_user_id)
   
+  def get_similarity_breakdowns(self, user_id: int, target_user_ids: List[int]) -> List[Dict[str, Any]]:
+    return self.repository.get_similarity_breakdowns(user_id=user_id, target_user_ids=target_user_ids)
+  
   def get_recommendation_stats(self, user_id: int) -> Dict[str, Any]:
     return self.repository.get_recommendation_stats(user_id=user_id)
\ No newline at end of file
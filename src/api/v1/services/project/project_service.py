@@ -1,7 +1,9 @@
-from src.api.v1.repositories.project.project_repository import ProjectRepository
+from src.api.v1.repositories.project.project_repository import ProjectRepository, AsyncProjectRepository
 from src.api.v1.schemas.project.project_schema import ProjectDetail
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
+from src.api.v1.schemas.brief import ProjectBrief
 from src.api.v1.schemas.project.project_schema import ProjectCreate, ProjectUpdate
 from src.api.v1.models.project.project import Project
 
@@ -15,6 +17,9 @@ class ProjectService:
   def get_all_projects(self) -> List[ProjectDetail]:
     return self.repository.get_all_projects()
   
+  def get_projects_page(self, limit: int = 20, cursor: Optional[str] = None, fields: str = "detail", exclude_user_id: Optional[int] = None) -> Tuple[List[Union[ProjectDetail, ProjectBrief]], Optional[str]]:
+    return self.repository.get_projects_page(limit, cursor, fields, exclude_user_id)
+  
   def get_by_user_id(self, user_id: int) -> List[ProjectDetail]:
     return self.repository.get_by_user_id(user_id)
   
@@ -49,4 +54,25 @@ class ProjectService:
     return self.repository.remove_member(project_id, user_id)
         
   def update_project_member_permission(self, project_id: str, user_id: int, permission: str) -> Project:
-    return self.repository.update_project_member_permission(project_id, user_id, permission)
\ No newline at end of file
+    return self.repository.update_project_member_permission(project_id, user_id, permission)
+
+
+class AsyncProjectService:
+  """async def 라우트의 프로젝트 조회 서비스"""
+  def __init__(self, db: AsyncSession):
+    self.repository = AsyncProjectRepository(db)
+  
+  async def get_project(self, project_id: str) -> ProjectDetail:
+    return await self.repository.get(project_id)
+  
+  async def get_projects_page(self, limit: int = 20, cursor: Optional[str] = None, fields: str = "detail", exclude_user_id: Optional[int] = None) -> Tuple[List[Union[ProjectDetail, ProjectBrief]], Optional[str]]:
+    return await self.repository.get_projects_page(limit, cursor, fields, exclude_user_id)
+  
+  async def get_by_user_id(self, user_id: int) -> List[ProjectDetail]:
+    return await self.repository.get_by_user_id(user_id)
+  
+  async def get_all_project_ids(self) -> List[str]:
+    return await self.repository.get_all_project_ids()
+  
+  async def get_project_members(self, project_id: str) -> List[Dict[str, Any]]:
+    return await self.repository.get_project_members(project_id)
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from typing import Optional, Tuple
 from src.api.v1.repositories.user.follow_repository import FollowRepository
 from src.api.v1.schemas.user.follow_schema import FollowCreate, FollowList, FollowResponse
 
@@ -12,8 +13,8 @@ class FollowService:
   def delete(self, follow_create: FollowCreate) -> FollowResponse:
     return self.repository.delete(follow_create)
     
-  def get_followers(self, user_id: int) -> FollowList:
-    return self.repository.get_followers(user_id)
+  def get_followers(self, user_id: int, limit: int = 20, cursor: Optional[str] = None) -> Tuple[FollowList, Optional[str]]:
+    return self.repository.get_followers(user_id, limit=limit, cursor=cursor)
     
-  def get_followed(self, user_id: int) -> FollowList:
-    return self.repository.get_followed(user_id)
\ No newline at end of file
+  def get_followed(self, user_id: int, limit: int = 20, cursor: Optional[str] = None) -> Tuple[FollowList, Optional[str]]:
+    return self.repository.get_followed(user_id, limit=limit, cursor=cursor)
\ No newline at end of file
@@ -33,12 +33,49 @@ class Setting(BaseSettings):
   # JWT Configuration
   SECRET_KEY: str = ""
   ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+  # 인증 사용자/토큰 검증 캐시 (워커 프로세스마다, 0이면 캐시하지 않음)
+  AUTH_CACHE_TTL: float = 30
+  AUTH_CACHE_MAX_ENTRIES: int = 10000
 
   # Database Configuration
   POSTGRES_URL: str = ""
+  POSTGRES_REPLICA_URL: str = ""  # 읽기 복제본 (선택)
   SUPABASE_URL: str = ""
   SUPABASE_KEY: str = ""
 
+  # Database Connection Pool (워커 프로세스마다 적용)
+  DB_POOL_SIZE: int = 5
+  DB_MAX_OVERFLOW: int = 10
+  DB_POOL_TIMEOUT: float = 30
+  DB_POOL_RECYCLE: int = 1800
+  # SSE/WebSocket/채팅 쓰기용 풀
+  DB_STREAM_POOL_SIZE: int = 2
+  DB_STREAM_MAX_OVERFLOW: int = 8
+  DB_STREAM_POOL_TIMEOUT: float = 10
+  # 쓰기를 커밋한 클라이언트가 복제본 대신 기본 DB에서 읽는 시간(초)
+  DB_REPLICA_STICKY_SECONDS: float = 5
+  # 내부 지표 엔드포인트 토큰 (비어 있으면 로컬호스트에서만 허용)
+  INTERNAL_METRICS_TOKEN: str = ""
+
+  # Chat Write Pipeline
+  CHAT_DURABLE_WRITES: bool = False  # True면 커밋 후 실제 ID로 브로드캐스트
+  CHAT_WRITE_BATCH_SIZE: int = 100
+  CHAT_WRITE_MAX_PENDING: int = 10000
+
+  # 조회수 쓰기 버퍼 (조회수 증가분을 모아 주기적으로 한 번에 반영)
+  VIEW_FLUSH_INTERVAL: float = 5
+  VIEW_BUFFER_MAX_KEYS: int = 10000
+
+  # 커뮤니티 인기 태그 집계 기간 (24h | 7d | all, 기간 내 태그가 없으면 전체 기간)
+  HOT_TOPIC_WINDOW: str = "7d"
+  # 커뮤니티 홈의 사용자 무관 조각 캐시 TTL(초) (쓰기 시 태그로 즉시 무효화)
+  COMMUNITY_HOT_TOPIC_TTL: float = 60
+  COMMUNITY_POSTS_TTL: float = 10
+
+  # Chat/SSE Broadcast (여러 워커로 실행할 때는 redis 사용)
+  BROADCAST_BACKEND: str = "memory"  # memory | redis
+  REDIS_URL: str = "redis://localhost:6379/0"
+
   @property
   def API_VERSION(self) -> str:
     return f"v{self.VERSION}"
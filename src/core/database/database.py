@@ -1,5 +1,11 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from fastapi.requests import HTTPConnection
+from src.core.config import setting
+from src.core.database.pool_metrics import pool_metrics, timed_pool_class
+from src.core.database.routing import ReplicaRouter, RoutingSession
 from dotenv import load_dotenv
 import os
 
@@ -8,6 +14,9 @@ load_dotenv()
 # 데이터베이스 URL
 DATABASE_URL = os.getenv("POSTGRES_URL", "sqlite:///./test.db")
 
+# 읽기 복제본 URL (비어 있으면 모든 쿼리를 기본 DB에서 실행)
+REPLICA_DATABASE_URL = os.getenv("POSTGRES_REPLICA_URL", "")
+
 # 데이터베이스 타입 확인
 is_postgresql = DATABASE_URL.startswith("postgresql")
 
@@ -23,38 +32,140 @@ if is_postgresql:
 else:
     connect_args = {"check_same_thread": False}
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
+def to_async_url(url: str):
+  """
+  동기 드라이버 URL을 비동기 드라이버 URL로 변환합니다.
+  postgresql(psycopg2) -> postgresql+asyncpg, sqlite -> sqlite+aiosqlite
+  """
+  url = make_url(url)
+  if url.get_backend_name() == "postgresql":
+    # asyncpg는 sslmode 대신 ssl 인자를 사용
+    sslmode = url.query.get("sslmode")
+    url = url.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode"])
+    return url, ({"ssl": sslmode} if sslmode else {})
+  if url.get_backend_name() == "sqlite":
+    return url.set(drivername="sqlite+aiosqlite"), {}
+  return url, {}
+
+def create_engines(name: str, pool_size: int, max_overflow: int, pool_timeout: float, url: str = DATABASE_URL):
+  """
+  같은 풀 설정으로 동기/비동기 엔진 한 쌍을 만들고 풀 지표에 등록합니다.
+  (name, name_async로 등록)
+  """
+  async_url, async_connect_args = to_async_url(url)
+  if is_postgresql:
+    async_connect_args["timeout"] = 10
+  options = dict(
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_timeout=pool_timeout,
     pool_pre_ping=True,
-    pool_recycle=1800,  # Recycle connections after 30 minutes
-    connect_args=connect_args,
+    pool_recycle=setting.DB_POOL_RECYCLE,
     echo=False  # SQL 쿼리 로깅을 원하면 True로 변경
+  )
+  sync_engine = create_engine(
+    url,
+    poolclass=timed_pool_class(QueuePool, pool_metrics.create(name)),
+    connect_args=connect_args,
+    **options
+  )
+  async_engine = create_async_engine(
+    async_url,
+    poolclass=timed_pool_class(AsyncAdaptedQueuePool, pool_metrics.create(f"{name}_async")),
+    connect_args=async_connect_args,
+    **options
+  )
+  pool_metrics.register(name, sync_engine)
+  pool_metrics.register(f"{name}_async", async_engine)
+  return sync_engine, async_engine
+
+# REST 요청용 엔진 (짧은 트랜잭션)
+engine, async_engine = create_engines(
+  "rest", setting.DB_POOL_SIZE, setting.DB_MAX_OVERFLOW, setting.DB_POOL_TIMEOUT
 )
 
+# 스트리밍(SSE/WebSocket)과 채팅 쓰기용 엔진
+# 연결 폭주가 REST 풀을 고갈시키지 않도록 풀을 분리하고, 대기 시간을 짧게 둡니다.
+stream_engine, async_stream_engine = create_engines(
+  "stream", setting.DB_STREAM_POOL_SIZE, setting.DB_STREAM_MAX_OVERFLOW, setting.DB_STREAM_POOL_TIMEOUT
+)
+
+# 읽기 복제본 엔진 (REST 요청의 @replica_read 읽기용, 풀 설정은 REST와 같음)
+replica_engine, async_replica_engine = None, None
+if REPLICA_DATABASE_URL:
+  replica_engine, async_replica_engine = create_engines(
+    "replica", setting.DB_POOL_SIZE, setting.DB_MAX_OVERFLOW, setting.DB_POOL_TIMEOUT, url=REPLICA_DATABASE_URL
+  )
+
+# 쓰기 직후 같은 클라이언트의 읽기를 기본 DB로 보내는 기간
+replica_router = ReplicaRouter(window=setting.DB_REPLICA_STICKY_SECONDS)
+
 try:
-  engine.connect()
+  # 연결 확인 후 바로 풀에 반환
+  with engine.connect():
+    pass
   print("✅ Database connection successful!")
 except Exception as e:
   print(f"❌ Database connection failed: {str(e)}")
 
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 세션 팩토리 생성 (REST 세션은 읽기 복제본 라우팅 사용)
+SessionLocal = sessionmaker(
+  class_=RoutingSession, autocommit=False, autoflush=False, bind=engine,
+  replica=replica_engine, router=replica_router
+)
+StreamSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=stream_engine)
+
+# 비동기 세션 팩토리 생성 (커밋 후에도 로드된 속성을 다시 조회하지 않도록 expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(
+  async_engine, class_=AsyncSession, sync_session_class=RoutingSession, autoflush=False, expire_on_commit=False,
+  replica=async_replica_engine.sync_engine if async_replica_engine is not None else None, router=replica_router
+)
+AsyncStreamSessionLocal = async_sessionmaker(async_stream_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # 베이스 클래스 생성
 Base = declarative_base()
 
+def sticky_key(connection: HTTPConnection):
+  """
+  read-your-writes 기준이 되는 클라이언트 키 (인증 토큰, 없으면 None)
+  """
+  token = connection.headers.get("authorization") or connection.query_params.get("access_token")
+  return hash(token) if token else None
+
 # 데이터베이스 세션 의존성
-def get_db():
+def get_db(connection: HTTPConnection):
   """
   데이터베이스 세션을 생성하고 관리하는 의존성 함수
   FastAPI의 Depends와 함께 사용
   """
-  db = SessionLocal()
+  db = SessionLocal(sticky_key=sticky_key(connection))
   try:
     yield db
   finally:
     db.close()
+
+async def get_async_db(connection: HTTPConnection):
+  """
+  비동기 데이터베이스 세션 의존성 함수
+  async def 라우트에서 사용하며, 쿼리를 기다리는 동안 이벤트 루프가 다른 요청을 처리합니다.
+  """
+  async with AsyncSessionLocal(sticky_key=sticky_key(connection)) as db:
+    yield db
+
+def get_stream_db():
+  """
+  스트리밍 엔드포인트(SSE/WebSocket)용 세션 의존성 함수
+  REST 요청과 별도의 풀을 사용합니다.
+  """
+  db = StreamSessionLocal()
+  try:
+    yield db
+  finally:
+    db.close()
+
+async def get_async_stream_db():
+  """
+  스트리밍 엔드포인트(SSE)용 비동기 세션 의존성 함수
+  """
+  async with AsyncStreamSessionLocal() as db:
+    yield db
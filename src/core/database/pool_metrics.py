@@ -0,0 +1,99 @@
+"""
+커넥션 풀 지표
+엔진별로 풀에서 연결을 얻기까지 기다린 시간(히스토그램), 타임아웃 수와 현재 풀 상태를 모읍니다.
+
+- timed_pool_class()로 만든 풀 클래스는 connect() 대기 시간(새 연결 생성 포함)을 기록합니다.
+  (엔진 생성 시 poolclass로 지정, dispose()로 풀이 다시 만들어져도 유지)
+- pool_metrics.snapshot()은 /api/v1/internal/db/pools 응답으로 사용됩니다.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+# 대기 시간 히스토그램 버킷 상한 (ms)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000, 30000)
+
+
+class PoolMetrics:
+    """한 풀의 연결 대기 시간 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.waits = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        milliseconds = seconds * 1000
+        index = next((i for i, bound in enumerate(WAIT_BUCKETS_MS) if milliseconds <= bound), len(WAIT_BUCKETS_MS))
+        with self._lock:
+            self.waits += 1
+            self.timeouts += int(timed_out)
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self.buckets[index] += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            histogram = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self.buckets)}
+            histogram["le_inf"] = self.buckets[-1]
+            waits = {
+                "count": self.waits,
+                "timeouts": self.timeouts,
+                "total_ms": round(self.total_wait * 1000, 3),
+                "max_ms": round(self.max_wait * 1000, 3),
+                "histogram": histogram,
+            }
+        status = {"name": self.name, "pool": type(pool).__name__, "waits": waits}
+        # QueuePool 계열만 크기/사용량을 제공
+        for key, method in (("size", "size"), ("checked_out", "checkedout"), ("checked_in", "checkedin"),
+                            ("overflow", "overflow"), ("timeout", "timeout")):
+            if callable(getattr(pool, method, None)):
+                status[key] = getattr(pool, method)()
+        return status
+
+
+def timed_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """connect() 대기 시간을 metrics에 기록하는 풀 클래스를 만듭니다."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except exc.TimeoutError:
+            metrics.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.observe(time.perf_counter() - started)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect})
+
+
+class PoolMetricsRegistry:
+    """엔진 이름별 풀 지표 모음"""
+
+    def __init__(self):
+        self._engines: Dict[str, Any] = {}
+        self._metrics: Dict[str, PoolMetrics] = {}
+
+    def create(self, name: str) -> PoolMetrics:
+        metrics = self._metrics[name] = PoolMetrics(name)
+        return metrics
+
+    def register(self, name: str, engine: Any) -> None:
+        """엔진을 등록합니다. (AsyncEngine은 sync_engine의 풀을 사용)"""
+        self._engines[name] = getattr(engine, "sync_engine", engine)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [self._metrics[name].snapshot(engine.pool) for name, engine in self._engines.items()]
+
+
+# 전역 인스턴스 생성
+pool_metrics = PoolMetricsRegistry()
@@ -0,0 +1,116 @@
+"""
+읽기 복제본(read replica) 라우팅
+저장소의 읽기 메서드(@replica_read)는 복제본 엔진에서, 그 밖의 쿼리와 모든 쓰기는 기본(primary) 엔진에서 실행합니다.
+
+- 세션이 한 번이라도 쓰기(flush, INSERT/UPDATE/DELETE)를 하면 이후 읽기는 모두 기본 엔진을 사용합니다.
+- 쓰기를 커밋한 클라이언트(sticky_key, 보통 인증 토큰)는 window초 동안 기본 엔진에서 읽습니다.
+  복제 지연 때문에 방금 쓴 내용이 보이지 않는 문제(read-your-writes)를 막기 위한 것이며,
+  워커 프로세스마다 따로 기억합니다.
+- 복제본이 설정되지 않았으면(replica=None) 모든 쿼리가 기본 엔진을 사용합니다.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_REPLICA_DEPTH = "replica_depth"
+_WROTE = "wrote"
+
+
+class ReplicaRouter:
+    """쓰기 직후 기본 엔진에서 읽어야 하는 클라이언트를 기억"""
+
+    def __init__(self, window: float = 5.0, clock: Callable[[], float] = time.monotonic, max_keys: int = 100000):
+        self.window = window
+        self._clock = clock
+        self._max_keys = max_keys
+        self._deadlines: Dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+
+    def mark_write(self, key: Optional[Hashable]) -> None:
+        if key is None or self.window <= 0:
+            return
+        now = self._clock()
+        with self._lock:
+            if len(self._deadlines) >= self._max_keys:
+                self._deadlines = {k: deadline for k, deadline in self._deadlines.items() if deadline > now}
+            self._deadlines[key] = now + self.window
+
+    def is_sticky(self, key: Optional[Hashable]) -> bool:
+        if key is None:
+            return False
+        deadline = self._deadlines.get(key)
+        if deadline is None:
+            return False
+        if deadline <= self._clock():
+            self._deadlines.pop(key, None)
+            return False
+        return True
+
+
+class RoutingSession(Session):
+    """@replica_read 구간의 읽기를 복제본 엔진으로 보내는 세션"""
+
+    def __init__(self, *args: Any, replica: Any = None, router: Optional[ReplicaRouter] = None,
+                 sticky_key: Optional[Hashable] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.router = router
+        self.sticky_key = sticky_key
+
+    def uses_replica(self) -> bool:
+        return (
+            self.replica is not None
+            and self.info.get(_REPLICA_DEPTH, 0) > 0
+            and not self.info.get(_WROTE)
+            and not self._flushing
+            and not (self.router is not None and self.router.is_sticky(self.sticky_key))
+        )
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.uses_replica() and not getattr(clause, "is_dml", False):
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_dml(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _stick_after_commit(session: Session) -> None:
+    if session.info.get(_WROTE) and session.router is not None:
+        session.router.mark_write(session.sticky_key)
+
+
+@contextmanager
+def use_replica(db: Session):
+    """이 구간의 읽기를 복제본에서 실행합니다. (RoutingSession이 아니면 영향 없음)"""
+    db.info[_REPLICA_DEPTH] = db.info.get(_REPLICA_DEPTH, 0) + 1
+    try:
+        yield db
+    finally:
+        db.info[_REPLICA_DEPTH] -= 1
+
+
+def replica_read(method: Callable) -> Callable:
+    """저장소 읽기 메서드를 복제본에서 실행하도록 표시하는 데코레이터 (self.db 사용)"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with use_replica(self.db):
+            return method(self, *args, **kwargs)
+
+    return wrapper
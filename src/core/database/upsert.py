@@ -0,0 +1,36 @@
+"""
+충돌 무시 INSERT (INSERT ... ON CONFLICT DO NOTHING)
+카운터 행처럼 "없으면 만들기"가 동시에 일어날 수 있는 곳에서 조회 후 삽입 대신 사용합니다.
+먼저 들어간 행이 이기고, 나머지 요청은 기본 키 충돌(IntegrityError) 없이 그대로 진행합니다.
+
+- PostgreSQL, SQLite는 방언의 on_conflict_do_nothing()을 사용합니다.
+- 그 밖의 DB는 행마다 savepoint 안에서 삽입하고 IntegrityError를 무시합니다.
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+
+def insert_ignore(db: Session, model: Any, rows: List[Dict[str, Any]]) -> None:
+    """기본 키가 이미 있는 행은 건너뛰고 rows를 삽입합니다."""
+    if not rows:
+        return
+
+    dialect = db.get_bind(mapper=model, clause=insert(model)).dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        for row in rows:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(model).values(**row))
+            except IntegrityError:
+                pass
+        return
+
+    db.execute(dialect_insert(model).on_conflict_do_nothing(), rows)
@@ -94,8 +94,11 @@ def import_all_models() -> None:
         'user.user_session',
         'project.project',
         'project.project_member',
+        'project.project_stat',
         'project.participation_request',
         'community.post',
+        'community.post_stat',
+        'community.post_tag',
         'community.whiteboard',
         'community.notification',
         'association_tables',
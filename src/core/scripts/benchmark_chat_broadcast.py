@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Cross-worker chat broadcast benchmark.
+
+Runs several RedisBroadcastBackend instances ("workers"), each subscribed to every
+channel, and publishes chat payloads from all of them round-robin. A message is
+counted as delivered once every worker's local deliver callback has received it,
+so the throughput includes the pub/sub hop to the other workers.
+
+By default the workers share an in-memory broker in one process; pass --redis-url
+to go through a real Redis server (each worker then has its own connections).
+
+Usage:
+  python -m src.core.scripts.benchmark_chat_broadcast --workers 4 --messages 20000
+  python -m src.core.scripts.benchmark_chat_broadcast --redis-url redis://localhost:6379/0
+"""
+import asyncio
+import json
+import time
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from src.core.utils.broadcast_backend import InMemoryBroker, RedisBroadcastBackend
+
+console = Console()
+app = typer.Typer(add_help_option=True)
+
+
+async def _measure(workers: int, messages: int, channels: int, max_batch: int, redis_url: Optional[str]) -> dict:
+    broker = InMemoryBroker() if redis_url is None else None
+    expected = messages * workers
+    delivered = 0
+    done = asyncio.Event()
+
+    async def deliver(project_id, channel_id, payloads):
+        nonlocal delivered
+        delivered += len(payloads)
+        if delivered >= expected:
+            done.set()
+
+    backends = [
+        RedisBroadcastBackend(
+            deliver,
+            url=redis_url,
+            client_factory=broker.client if broker is not None else None,
+            prefix="teamup:bench",
+            max_batch=max_batch,
+        )
+        for _ in range(workers)
+    ]
+    for backend in backends:
+        for channel in range(channels):
+            await backend.subscribe("BENCH1", f"channel-{channel}")
+    await asyncio.sleep(0.1)
+
+    payload = json.dumps({"message": "x" * 80})
+    started = time.perf_counter()
+    for i in range(messages):
+        backend = backends[i % workers]
+        await backend.publish("BENCH1", f"channel-{i % channels}", payload)
+        if i % 500 == 499:
+            # 실제 서버처럼 다른 태스크(발행, 구독 수신)가 돌 수 있게 양보
+            await asyncio.sleep(0)
+    await asyncio.wait_for(done.wait(), timeout=60)
+    elapsed = time.perf_counter() - started
+
+    for backend in backends:
+        await backend.close()
+    return {
+        "elapsed": elapsed,
+        "publishes": broker.published if broker is not None else None,
+    }
+
+
+@app.command()
+def run(
+    workers: int = typer.Option(4, "--workers", help="Simulated worker processes"),
+    messages: int = typer.Option(20_000, "--messages", help="Chat messages to publish"),
+    channels: int = typer.Option(20, "--channels", help="Chat channels"),
+    redis_url: Optional[str] = typer.Option(None, "--redis-url", help="Use a real Redis server"),
+):
+    """Report cross-worker messages per second with and without publish batching."""
+    console.rule(f"Chat broadcast across {workers} workers ({'redis' if redis_url else 'in-memory broker'})")
+    table = Table("mode", "messages/s", "deliveries/s", "broker publishes", "elapsed")
+
+    for label, max_batch in (("unbatched (1 per PUBLISH)", 1), ("batched per channel", 100)):
+        result = asyncio.run(_measure(workers, messages, channels, max_batch, redis_url))
+        table.add_row(
+            label,
+            f"{messages / result['elapsed']:,.0f}",
+            f"{messages * workers / result['elapsed']:,.0f}",
+            f"{result['publishes']:,}" if result["publishes"] is not None else "-",
+            f"{result['elapsed']:.2f} s",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized similarity index against the pure-Python calculator.
+
+Generates synthetic users (tech stacks, interests, collaboration preferences) in memory.
+
+- benchmark: times index build / exact top-k queries against
+  UserSimilarityCalculator.get_top_similar_users and checks the rankings match.
+- recall: offline evaluation of candidate generation (tech/interest inverted index +
+  collaboration profile groups). Reports recall@k of the approximate ranking against
+  the exact one, latency and scored-set size for each max_candidates setting.
+
+Usage:
+  python -m src.core.scripts.benchmark_similarity_index benchmark --users 10000 --users 100000
+  python -m src.core.scripts.benchmark_similarity_index recall --users 200000 --max-candidates 1000 --max-candidates 5000
+"""
+import random
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from src.core.utils.similarity_calculator import similarity_calculator
+from src.core.utils.similarity_index import UserFeatures, UserSimilarityIndex
+
+console = Console()
+app = typer.Typer(add_help_option=True)
+
+TECHS = [f"tech-{i}" for i in range(200)]
+INTERESTS = [(category, f"{category}-{i}") for category in ("개발", "디자인", "기획", "데이터") for i in range(25)]
+STYLES = ["적극적", "소극적", "유연함", "Active", None]
+PROJECT_TYPES = ["웹", "모바일", "AI", "웹 서비스", "게임", None]
+ROLES = ["프론트엔드", "백엔드", "디자이너", "데이터 분석가", "프로젝트 매니저", None]
+TIME_ZONES = ["Asia/Seoul", "Asia/Tokyo", "UTC", "Europe/London", "America/New_York", "America/Los_Angeles", None]
+HOURS = [(9, 18), (10, 19), (13, 22), (20, 24), (None, None)]
+LENGTHS = ["짧음", "중간", "김", None]
+
+
+def _generate(count: int, seed: int) -> Dict[int, UserFeatures]:
+    rng = random.Random(seed)
+    features = {}
+    for user_id in range(1, count + 1):
+        preference = None
+        if rng.random() < 0.85:
+            start, end = rng.choice(HOURS)
+            preference = {
+                "collaboration_style": rng.choice(STYLES),
+                "preferred_project_type": rng.choice(PROJECT_TYPES),
+                "preferred_role": rng.choice(ROLES),
+                "available_time_zone": rng.choice(TIME_ZONES),
+                "work_hours_start": start,
+                "work_hours_end": end,
+                "preferred_project_length": rng.choice(LENGTHS),
+            }
+        features[user_id] = UserFeatures(
+            techs={tech: rng.randint(0, 2) for tech in rng.sample(TECHS, rng.randint(0, 8))},
+            interests=rng.sample(INTERESTS, rng.randint(0, 5)),
+            preference=preference,
+        )
+    return features
+
+
+def _as_user(user_id: int, feature: UserFeatures) -> SimpleNamespace:
+    """UserSimilarityCalculator가 읽는 속성만 가진 가짜 유저"""
+    pref = SimpleNamespace(**feature.preference) if feature.preference else None
+    return SimpleNamespace(
+        id=user_id,
+        following=[],
+        tech_stacks=[SimpleNamespace(tech=tech, level=level) for tech, level in feature.techs.items()],
+        interests=[SimpleNamespace(interest_category=c, interest_name=n) for c, n in feature.interests],
+        collaboration_preference=pref,
+    )
+
+
+def _tie_aware_hits(found, expected) -> int:
+    """
+    정확 순위의 k번째 점수 이상인 근사 결과 수
+    동점 유저는 ID 순으로 잘리므로, 같은 점수의 다른 유저를 찾아도 적중으로 봅니다.
+    """
+    if not expected:
+        return 0
+    cutoff = expected[-1][1]
+    return min(len(expected), sum(1 for _, score in found if score >= cutoff))
+
+
+@app.command()
+def benchmark(
+    users: List[int] = typer.Option([10_000, 100_000], "--users", help="Number of synthetic users"),
+    queries: int = typer.Option(20, "--queries", help="Index queries per size"),
+    baseline_queries: int = typer.Option(3, "--baseline-queries", help="Pure-Python queries per size"),
+    limit: int = typer.Option(20, "--limit", help="Top-k size"),
+    seed: int = typer.Option(42, "--seed"),
+):
+    """Compare query latency of the index and the pure-Python calculator."""
+    console.rule("Similarity Index Benchmark")
+    table = Table("users", "index build", "index query (avg)", "python query (avg)", "speedup", "rankings match")
+
+    for count in users:
+        features = _generate(count, seed)
+        rng = random.Random(seed + count)
+        targets = [rng.randint(1, count) for _ in range(max(queries, baseline_queries))]
+
+        started = time.perf_counter()
+        index = UserSimilarityIndex(max_age=None, max_candidates=None)
+        index.build(features)
+        build_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        index_results = [index.top_k(target, features[target], limit=limit, exact=True) for target in targets[:queries]]
+        index_time = (time.perf_counter() - started) / max(queries, 1)
+
+        all_users = [_as_user(user_id, feature) for user_id, feature in features.items()]
+        started = time.perf_counter()
+        baseline_results = [
+            similarity_calculator.get_top_similar_users(all_users[target - 1], all_users, limit=limit)
+            for target in targets[:baseline_queries]
+        ]
+        baseline_time = (time.perf_counter() - started) / max(baseline_queries, 1)
+
+        matches = all(
+            index_results[i] == [(user.id, score) for user, score in baseline_results[i]]
+            for i in range(min(queries, baseline_queries))
+        )
+        table.add_row(
+            f"{count:,}",
+            f"{build_time * 1000:.0f} ms",
+            f"{index_time * 1000:.1f} ms",
+            f"{baseline_time * 1000:.0f} ms",
+            f"{baseline_time / index_time:.0f}x" if index_time else "-",
+            "[green]yes[/green]" if matches else "[red]no[/red]",
+        )
+
+    console.print(table)
+
+
+@app.command()
+def recall(
+    users: int = typer.Option(200_000, "--users", help="Number of synthetic users"),
+    queries: int = typer.Option(100, "--queries", help="Queries to evaluate"),
+    k: int = typer.Option(10, "--k", help="Evaluate recall@k"),
+    max_candidates: List[int] = typer.Option([100, 500, 1000, 2000, 5000], "--max-candidates"),
+    seed: int = typer.Option(42, "--seed"),
+):
+    """Report recall@k of candidate generation against exact scoring."""
+    console.rule(f"Similarity Index recall@{k} ({users:,} users)")
+    features = _generate(users, seed)
+    rng = random.Random(seed + users)
+    targets = [rng.randint(1, users) for _ in range(queries)]
+
+    started = time.perf_counter()
+    index = UserSimilarityIndex(max_age=None, ann_min_users=0)
+    index.build(features)
+    console.print(f"build (with candidate generation): {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    started = time.perf_counter()
+    exact = [index.top_k(target, features[target], limit=k, exact=True) for target in targets]
+    exact_time = (time.perf_counter() - started) / queries
+
+    segment = index._segments[0]
+    table = Table("max candidates", "scored (avg)", f"recall@{k}", "query (avg)", "exact query (avg)")
+    for candidate_limit in max_candidates:
+        scored = sum(len(segment.candidate_rows(features[target], candidate_limit)) for target in targets)
+        started = time.perf_counter()
+        approx = [
+            index.top_k(target, features[target], limit=k, max_candidates=candidate_limit)
+            for target in targets
+        ]
+        approx_time = (time.perf_counter() - started) / queries
+        hits = sum(_tie_aware_hits(found, expected) for found, expected in zip(approx, exact))
+        total = sum(len(expected) for expected in exact)
+        table.add_row(
+            f"{candidate_limit:,}",
+            f"{scored / queries:,.0f}",
+            f"{hits / total:.3f}" if total else "-",
+            f"{approx_time * 1000:.1f} ms",
+            f"{exact_time * 1000:.1f} ms",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Idle WebSocket load test: CPU used by connected-but-silent chat clients.
+
+Compares the previous receive loop (asyncio.wait_for(receive_text(), timeout=1.0)
+on every socket, to check whether a ping is due) against the current
+websocket_handler (one long-lived receive per socket, pings from the shared
+heartbeat timing wheel).
+
+Sockets are in-memory fakes that never send anything, so the measured process
+CPU time is pure event-loop overhead of keeping idle connections open.
+
+Usage:
+  python -m src.core.scripts.benchmark_websocket_idle --connections 1000 --connections 10000 --duration 5
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import List
+
+import typer
+from fastapi import WebSocketDisconnect
+from rich.console import Console
+from rich.table import Table
+
+from src.core.utils import chat_websocket
+
+console = Console()
+app = typer.Typer(add_help_option=True)
+
+USERS_PER_CHANNEL = 10
+
+
+class IdleWebSocket:
+    """연결만 유지하고 아무 메시지도 보내지 않는 가짜 웹소켓"""
+
+    def __init__(self):
+        self._closed = asyncio.get_running_loop().create_future()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload: str):
+        pass
+
+    async def receive_text(self) -> str:
+        await asyncio.shield(self._closed)
+        raise WebSocketDisconnect()
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+
+async def _legacy_handler(websocket: IdleWebSocket) -> None:
+    """1초 타임아웃 폴링으로 핑 시점을 확인하던 이전 수신 루프"""
+    ping_interval = 30
+    last_ping_time = asyncio.get_event_loop().time()
+    while True:
+        current_time = asyncio.get_event_loop().time()
+        if current_time - last_ping_time > ping_interval:
+            await websocket.send_text(json.dumps({"type": "ping"}))
+            last_ping_time = current_time
+        try:
+            await asyncio.wait_for(websocket.receive_text(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+        except WebSocketDisconnect:
+            break
+
+
+async def _current_handler(websocket: IdleWebSocket, index: int) -> None:
+    await chat_websocket.websocket_handler(
+        websocket, f"channel-{index // USERS_PER_CHANNEL}", "PRJ-BENCH", index + 1, db=None
+    )
+
+
+async def _measure(mode: str, connections: int, duration: float, warmup: float) -> float:
+    """CPU 사용 시간(초)을 측정 구간 길이로 나눈 값을 반환합니다."""
+    sockets = [IdleWebSocket() for _ in range(connections)]
+    if mode == "legacy":
+        tasks = [asyncio.create_task(_legacy_handler(ws)) for ws in sockets]
+    else:
+        tasks = [asyncio.create_task(_current_handler(ws, i)) for i, ws in enumerate(sockets)]
+
+    # 연결 등록과 첫 타이머 설정이 끝날 때까지 대기
+    await asyncio.sleep(warmup)
+    started_cpu = time.process_time()
+    started_wall = time.perf_counter()
+    await asyncio.sleep(duration)
+    cpu = time.process_time() - started_cpu
+    wall = time.perf_counter() - started_wall
+
+    for ws in sockets:
+        await ws.close()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return cpu / wall
+
+
+@app.command()
+def run(
+    connections: List[int] = typer.Option([1_000, 10_000], "--connections", help="Idle connections"),
+    duration: float = typer.Option(5.0, "--duration", help="Measured seconds per run"),
+    warmup: float = typer.Option(2.0, "--warmup", help="Seconds before measuring"),
+):
+    """Report idle CPU of the polling loop and the event-driven loop."""
+    logging.getLogger("websocket").setLevel(logging.WARNING)
+    console.rule("Idle WebSocket CPU")
+    table = Table("connections", "polling loop CPU", "event-driven CPU", "polling per 1k", "event-driven per 1k")
+
+    for count in connections:
+        legacy = asyncio.run(_measure("legacy", count, duration, warmup))
+        current = asyncio.run(_measure("current", count, duration, warmup))
+        table.add_row(
+            f"{count:,}",
+            f"{legacy * 100:.1f}%",
+            f"{current * 100:.2f}%",
+            f"{legacy * 100 * 1000 / count:.2f}%",
+            f"{current * 100 * 1000 / count:.3f}%",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
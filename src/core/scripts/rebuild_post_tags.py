@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Rebuild the post_tags index table from the posts.tags JSON column.
+
+Post create/update/delete keep post_tags in sync; run this once after deploying
+the table (to backfill existing posts), after bulk imports, or after manual SQL
+edits of posts.tags. Rebuilt rows use the post's creation time as the time the
+tag was attached, which is what the 24h / 7d hot-topic windows count by.
+
+Usage:
+  python -m src.core.scripts.rebuild_post_tags --post-id 12 --post-id 34
+  python -m src.core.scripts.rebuild_post_tags --all
+"""
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from src.core.database.database import SessionLocal
+import src.api.v1.models  # noqa: F401  (populate metadata / mappers)
+from src.api.v1.repositories.community.post_tag_repository import PostTagRepository
+
+console = Console()
+app = typer.Typer(add_help_option=True)
+
+
+@app.command()
+def rebuild(
+    post_id: Optional[List[int]] = typer.Option(None, "--post-id", help="Only rebuild tags for these posts"),
+    all_posts: bool = typer.Option(False, "--all", help="Rebuild tags for every post"),
+):
+    """Recompute post tag rows in a single transaction."""
+    if not post_id and not all_posts:
+        console.print("[yellow]Pass --post-id or --all.[/yellow]")
+        raise typer.Exit(code=1)
+    console.rule("Rebuild Post Tags")
+
+    db = SessionLocal()
+    try:
+        count = PostTagRepository(db).rebuild(post_id or None)
+        db.commit()
+        console.print(f"[green]Rebuilt tags for {count} post(s).[/green]")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    app()
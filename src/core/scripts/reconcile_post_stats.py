@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Rebuild the post_stats counter table from post_reactions / post_comments rows.
+
+Like, dislike, share and comment counters are maintained by the write paths; view
+counts are buffered in memory and flushed periodically. Run this after bulk imports,
+manual SQL edits, or whenever counters drift. Rebuilding replaces view counts with
+the number of legacy view reaction rows, so only run it for posts whose buffered
+views you are willing to reset.
+
+Usage:
+  python -m src.core.scripts.reconcile_post_stats --post-id 12 --post-id 34
+  python -m src.core.scripts.reconcile_post_stats --all
+"""
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from src.core.database.database import SessionLocal
+import src.api.v1.models  # noqa: F401  (populate metadata / mappers)
+from src.api.v1.repositories.community.post_stat_repository import PostStatRepository
+
+console = Console()
+app = typer.Typer(add_help_option=True)
+
+
+@app.command()
+def reconcile(
+    post_id: Optional[List[int]] = typer.Option(None, "--post-id", help="Only rebuild counters for these posts"),
+    all_posts: bool = typer.Option(False, "--all", help="Rebuild counters for every post"),
+):
+    """Recompute post counters in a single transaction."""
+    if not post_id and not all_posts:
+        console.print("[yellow]Pass --post-id or --all.[/yellow]")
+        raise typer.Exit(code=1)
+    console.rule("Reconcile Post Stats")
+
+    db = SessionLocal()
+    try:
+        count = PostStatRepository(db).reconcile(post_id or None)
+        db.commit()
+        console.print(f"[green]Reconciled counters for {count} post(s).[/green]")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Rebuild the project_stats / milestone_stats counter tables from source rows.
+
+Counters are maintained incrementally by task, subtask and milestone writes.
+Run this after bulk imports, manual SQL edits, or whenever counters drift.
+
+Usage:
+  python -m src.core.scripts.reconcile_project_stats
+  python -m src.core.scripts.reconcile_project_stats --project-id ABC123 --project-id XYZ789
+"""
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from src.core.database.database import SessionLocal
+import src.api.v1.models  # noqa: F401  (populate metadata / mappers)
+from src.api.v1.repositories.project.project_stat_repository import ProjectStatRepository
+
+console = Console()
+app = typer.Typer(add_help_option=True)
+
+
+@app.command()
+def reconcile(project_id: Optional[List[str]] = typer.Option(None, "--project-id", help="Only rebuild counters for these projects")):
+    """Recompute project and milestone counters in a single transaction."""
+    console.rule("Reconcile Project Stats")
+
+    db = SessionLocal()
+    try:
+        count = ProjectStatRepository(db).reconcile(project_id or None)
+        db.commit()
+        console.print(f"[green]Reconciled counters for {count} project(s).[/green]")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    app()
@@ -3,7 +3,9 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from src.core.database.database import get_db
 from src.core.security.password import verify_password
-from src.core.security.jwt import create_access_token, verify_token
+from src.core.security.jwt import create_access_token
+from src.core.security.auth_cache import auth_cache
+from src.core.utils.user_projection import UserPrincipal
 from src.api.v1.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -31,15 +33,18 @@ def login(db: Session, email: str, password: str):
 
 def get_current_user(
   db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-  """현재 로그인된 사용자 반환"""
+) -> UserPrincipal:
+  """
+  현재 로그인된 사용자 반환
+  User 엔티티 대신 기본 컬럼만 담은 UserPrincipal을 반환합니다. (토큰 검증 결과와 함께 auth_cache에 잠시 보관)
+  """
   try:
-    payload = verify_token(token)
+    payload = auth_cache.verify(token)
     user_email = payload.get("sub")
   except Exception:
     raise HTTPException(status_code=401, detail="Invalid authentication token")
 
-  user = db.query(User).filter(User.email == user_email).first()
+  user = auth_cache.get_user(db, user_email)
   if user is None:
     raise HTTPException(status_code=401, detail="User not found")
 
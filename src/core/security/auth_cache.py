@@ -0,0 +1,64 @@
+"""
+인증 사용자 캐시
+get_current_user가 요청마다 토큰을 다시 디코드하고 users 테이블을 조회하지 않도록,
+토큰 검증 결과와 사용자(UserPrincipal)를 짧은 시간(TTL) 동안 워커 프로세스 메모리에 보관합니다.
+
+- 사용자는 토큰의 sub(이메일) 기준으로 보관합니다. 기본 컬럼만 담은 UserPrincipal이므로
+  세션에 붙이지 않고 그대로 여러 요청에서 공유합니다.
+- 사용자 수정/삭제/로그인 시 invalidate_user()로 지웁니다. 다른 워커의 캐시는 TTL이 지나야 갱신됩니다.
+- 토큰 검증 결과는 토큰 해시 기준으로 보관하고, exp가 지난 토큰은 다시 검증합니다.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from src.core.config import setting
+from src.core.security.jwt import verify_token
+from src.core.utils.user_brief_cache import TTLCache
+from src.core.utils.user_projection import UserPrincipal, load_principal
+from src.api.v1.models.user.user import User
+
+
+class AuthCache:
+  """토큰 검증 결과와 인증 사용자 캐시"""
+
+  def __init__(self, maxsize: int = 10000, ttl: float = 30.0):
+    self.tokens = TTLCache(maxsize=maxsize, ttl=ttl)
+    self.users = TTLCache(maxsize=maxsize, ttl=ttl)
+
+  def verify(self, token: str) -> Dict[str, Any]:
+    """verify_token()과 같지만, 같은 토큰은 TTL 동안 다시 디코드하지 않습니다."""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = self.tokens.get(key)
+    if payload is not None:
+      exp = payload.get("exp")
+      if exp is None or exp > time.time():
+        return payload
+      self.tokens.invalidate(key)
+    payload = verify_token(token)
+    self.tokens.set(key, payload)
+    return payload
+
+  def get_user(self, db: Session, email: str) -> Optional[UserPrincipal]:
+    """이메일로 사용자를 찾습니다. (캐시 적중 시 SQL 없음)"""
+    user = self.users.get(email)
+    if user is None:
+      user = load_principal(db, User.email == email)
+      if user is not None:
+        self.users.set(email, user)
+    return user
+
+  def invalidate_user(self, email: Optional[str]) -> None:
+    if email:
+      self.users.invalidate(email)
+
+  def clear(self) -> None:
+    self.tokens.clear()
+    self.users.clear()
+
+
+# 전역 인스턴스 생성
+auth_cache = AuthCache(maxsize=setting.AUTH_CACHE_MAX_ENTRIES, ttl=setting.AUTH_CACHE_TTL)
@@ -0,0 +1,246 @@
+"""
+브로드캐스트 백엔드
+워커(프로세스)마다 자기 연결만 알고 있으므로, 메시지를 다른 워커에도 전달하는 통로를 추상화합니다.
+채팅 웹소켓은 (project_id, channel_id), SSE 허브는 (토픽 종류, 토픽 키)를 (namespace, key)로 사용합니다.
+
+- InProcessBroadcastBackend: 단일 워커용. 이 워커의 연결에만 전달합니다.
+- RedisBroadcastBackend: Redis pub/sub으로 다른 워커에 전달합니다.
+  * 로컬 연결에는 바로 전달하고, 다른 워커로 가는 메시지는 같은 이벤트 루프 반복 안에서 모아
+    (namespace, key)당 한 번의 PUBLISH로 보냅니다. (max_batch개씩)
+  * 봉투(envelope)에 보낸 워커 ID를 넣어, 자기 자신이 보낸 메시지는 구독에서 다시 전달하지 않습니다.
+  * 로컬 구독자가 있는 (namespace, key)만 구독합니다.
+
+deliver 콜백은 (namespace, key, payloads)를 받아 이 워커의 연결에 순서대로 전달합니다.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.config import setting
+
+logger = logging.getLogger("broadcast_backend")
+
+DeliverFn = Callable[[str, str, List[str]], Awaitable[None]]
+
+
+class BroadcastBackend(ABC):
+    """메시지 전달 백엔드 인터페이스"""
+
+    def __init__(self, deliver: DeliverFn):
+        self._deliver = deliver
+
+    @abstractmethod
+    async def publish(self, namespace: str, key: str, payload: str) -> None:
+        """직렬화된 메시지를 모든 워커의 구독자에게 전달합니다."""
+
+    async def subscribe(self, namespace: str, key: str) -> None:
+        """이 워커에 (namespace, key)의 첫 로컬 구독자가 생겼을 때 호출됩니다."""
+
+    async def unsubscribe(self, namespace: str, key: str) -> None:
+        """이 워커에서 (namespace, key)의 마지막 로컬 구독자가 사라졌을 때 호출됩니다."""
+
+    async def close(self) -> None:
+        """보내지 못한 메시지를 정리하고 연결을 닫습니다."""
+
+
+class InProcessBroadcastBackend(BroadcastBackend):
+    """단일 워커용 백엔드"""
+
+    async def publish(self, namespace: str, key: str, payload: str) -> None:
+        await self._deliver(namespace, key, [payload])
+
+
+class RedisBroadcastBackend(BroadcastBackend):
+    """Redis pub/sub 기반 멀티 워커 백엔드"""
+
+    def __init__(self, deliver: DeliverFn, url: Optional[str] = None, client_factory: Optional[Callable[[], Any]] = None,
+                 prefix: str = "teamup:chat", max_batch: int = 100):
+        super().__init__(deliver)
+        self.url = url
+        self.prefix = prefix
+        self.max_batch = max_batch
+        self.worker_id = uuid.uuid4().hex
+        self._client_factory = client_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client = None
+        self._pubsub = None
+        self._subscribed: Set[str] = set()
+        self._buffers: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._flush_task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
+
+    def topic(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def _ensure_client(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 테스트처럼 이벤트 루프가 바뀐 경우 이전 루프의 연결 상태는 버립니다.
+            self._loop = loop
+            self._client = None
+            self._pubsub = None
+            self._subscribed = set()
+            self._buffers = defaultdict(list)
+            self._flush_task = None
+            self._listen_task = None
+        if self._client is None:
+            if self._client_factory is not None:
+                self._client = self._client_factory()
+            else:
+                import redis.asyncio as redis
+                self._client = redis.from_url(self.url or setting.REDIS_URL)
+        return self._client
+
+    async def publish(self, namespace: str, key: str, payload: str) -> None:
+        self._ensure_client()
+        self._buffers[(namespace, key)].append(payload)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+        # 로컬 구독자는 Redis 왕복 없이 바로 전달
+        await self._deliver(namespace, key, [payload])
+
+    async def _flush(self) -> None:
+        client = self._ensure_client()
+        while self._buffers:
+            buffers, self._buffers = self._buffers, defaultdict(list)
+            for (namespace, key), payloads in buffers.items():
+                for start in range(0, len(payloads), self.max_batch):
+                    envelope = json.dumps({
+                        "origin": self.worker_id,
+                        "namespace": namespace,
+                        "key": key,
+                        "payloads": payloads[start:start + self.max_batch],
+                    })
+                    try:
+                        await client.publish(self.topic(namespace, key), envelope)
+                    except Exception as e:
+                        logger.error(f"브로드캐스트 발행 실패: {namespace}:{key}, 오류={e}")
+
+    async def subscribe(self, namespace: str, key: str) -> None:
+        client = self._ensure_client()
+        topic = self.topic(namespace, key)
+        if topic in self._subscribed:
+            return
+        if self._pubsub is None:
+            self._pubsub = client.pubsub()
+        await self._pubsub.subscribe(topic)
+        self._subscribed.add(topic)
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.get_running_loop().create_task(self._listen())
+
+    async def unsubscribe(self, namespace: str, key: str) -> None:
+        if self._pubsub is None or self._loop is not asyncio.get_running_loop():
+            return
+        topic = self.topic(namespace, key)
+        if topic in self._subscribed:
+            self._subscribed.discard(topic)
+            await self._pubsub.unsubscribe(topic)
+
+    async def _listen(self) -> None:
+        pubsub = self._pubsub
+        while True:
+            try:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"브로드캐스트 구독 수신 오류: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if not message or message.get("type") != "message":
+                continue
+            try:
+                envelope = json.loads(message["data"])
+                if envelope.get("origin") == self.worker_id:
+                    continue
+                await self._deliver(envelope["namespace"], envelope["key"], envelope["payloads"])
+            except Exception as e:
+                logger.error(f"브로드캐스트 메시지 전달 오류: {e}")
+
+    async def close(self) -> None:
+        if self._loop is not asyncio.get_running_loop():
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+        self._loop = None
+
+
+class InMemoryBroker:
+    """
+    Redis pub/sub 대역 (테스트, 벤치마크용)
+    redis.asyncio 클라이언트 중 이 모듈이 쓰는 publish/pubsub만 흉내 내며,
+    client()로 만든 클라이언트들이 같은 브로커를 공유합니다.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set["_InMemoryPubSub"]] = defaultdict(set)
+        self.published = 0
+
+    def client(self) -> "_InMemoryClient":
+        return _InMemoryClient(self)
+
+
+class _InMemoryClient:
+    def __init__(self, broker: InMemoryBroker):
+        self._broker = broker
+
+    async def publish(self, topic: str, data: str) -> int:
+        self._broker.published += 1
+        subscribers = list(self._broker._subscribers.get(topic, ()))
+        for pubsub in subscribers:
+            pubsub._queue.put_nowait({"type": "message", "channel": topic, "data": data})
+        return len(subscribers)
+
+    def pubsub(self) -> "_InMemoryPubSub":
+        return _InMemoryPubSub(self._broker)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _InMemoryPubSub:
+    def __init__(self, broker: InMemoryBroker):
+        self._broker = broker
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._topics: Set[str] = set()
+
+    async def subscribe(self, *topics: str) -> None:
+        for topic in topics:
+            self._topics.add(topic)
+            self._broker._subscribers[topic].add(self)
+
+    async def unsubscribe(self, *topics: str) -> None:
+        for topic in topics:
+            self._topics.discard(topic)
+            self._broker._subscribers[topic].discard(self)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: Optional[float] = 0.0):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        await self.unsubscribe(*list(self._topics))
+
+
+def create_broadcast_backend(deliver: DeliverFn, prefix: str = "teamup:chat") -> BroadcastBackend:
+    """설정(BROADCAST_BACKEND)에 맞는 백엔드를 생성합니다."""
+    if setting.BROADCAST_BACKEND == "redis":
+        return RedisBroadcastBackend(deliver, url=setting.REDIS_URL, prefix=prefix)
+    return InProcessBroadcastBackend(deliver)
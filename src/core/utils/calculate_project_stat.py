@@ -1,26 +1,28 @@
-from src.api.v1.models.project.project import Project
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-def calculate_project_stat(project: Project) -> Dict[str, Any]:
-  total_tasks = len(project.tasks) if hasattr(project, 'tasks') else 0
-  completed_tasks = sum(1 for task in project.tasks if task.status == 'completed') if hasattr(project, 'tasks') else 0
-  total_milestones = len(project.milestones) if hasattr(project, 'milestones') else 0
-  completed_milestones = sum(1 for milestone in project.milestones if milestone.status == 'completed') if hasattr(project, 'milestones') else 0
+def calculate_project_stat(counts: Dict[str, int], end_date: Optional[datetime] = None) -> Dict[str, Any]:
+  """
+  프로젝트 통계 카운터로 통계 정보를 계산합니다.
+  """
+  total_tasks = counts.get("total_tasks", 0)
+  completed_tasks = counts.get("completed_tasks", 0)
   
   progress_percentage = 0
   if total_tasks > 0:
     progress_percentage = round((completed_tasks / total_tasks) * 100, 2)
     
   days_remaining = None
-  if project.end_date:
-    days_remaining = (project.end_date - datetime.now()).days
+  if end_date:
+    days_remaining = (end_date - datetime.now()).days
   
   return {
     "total_tasks": total_tasks,
     "completed_tasks": completed_tasks,
-    "total_milestones": total_milestones,
-    "completed_milestones": completed_milestones,
+    "total_milestones": counts.get("total_milestones", 0),
+    "completed_milestones": counts.get("completed_milestones", 0),
+    "total_subtasks": counts.get("total_subtasks", 0),
+    "completed_subtasks": counts.get("completed_subtasks", 0),
     "progress_percentage": progress_percentage,
     "days_remaining": days_remaining
-  }
\ No newline at end of file
+  }
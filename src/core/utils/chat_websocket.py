@@ -1,16 +1,18 @@
 import json
 import asyncio
 import logging
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set
 from sqlalchemy.orm import Session
-from src.api.v1.services.project.chat_service import ChatService
 from src.api.v1.schemas.project.chat_schema import ChatCreate, ChatDetail
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect, status, Depends
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
-from src.api.v1.services.user.user_service import UserService
-from src.core.database.database import get_db
+from src.core.utils.user_brief_cache import user_brief_cache, get_user_brief
+from src.core.utils.heartbeat import heartbeat_scheduler
+from src.core.utils.chat_writer import ChatQueueFull, PendingChat, chat_writer
+from src.core.config import setting
+from src.core.utils.broadcast_backend import create_broadcast_backend
 
 load_dotenv()
 
@@ -27,6 +29,22 @@ active_connections: Dict[str, Dict[str, Dict[str, WebSocket]]] = {}
 # 사용자별 채널 관리: {user_id: Set[(project_id, channel_id)]}
 user_channels: Dict[str, Set[tuple]] = {}
 
+# 소켓별 전송 타임아웃 (초)
+SEND_TIMEOUT = 5.0
+
+_NOT_CACHED = object()
+
+PING_PAYLOAD = json.dumps({"type": "ping"})
+
+# 완료될 때까지 참조를 유지해야 하는 백그라운드 태스크
+_background_tasks: Set[asyncio.Task] = set()
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
 
 
 async def get_channel_connections(project_id: str, channel_id: str) -> Dict[str, WebSocket]:
@@ -63,6 +81,10 @@ async def register_connection(project_id: str, channel_id: str, user_id: str, we
         active_connections[project_id][channel_id][user_id] = websocket
         user_channels[user_id].add((project_id, channel_id))
         
+        # 이 워커의 첫 연결이면 다른 워커의 채널 메시지 구독
+        if len(active_connections[project_id][channel_id]) == 1:
+            await broadcast_backend.subscribe(project_id, channel_id)
+        
         # 현재 채널 연결 정보 로깅
         users = await get_channel_users(project_id, channel_id)
         logger.info(f"프로젝트 {project_id}, 채널 {channel_id} 연결 등록 완료. 현재 사용자: {users} (총 {len(users)}명)")
@@ -84,6 +106,7 @@ async def unregister_connection(project_id: str, channel_id: str, user_id: str)
             if not active_connections[project_id][channel_id]:
                 del active_connections[project_id][channel_id]
                 logger.info(f"프로젝트 {project_id}, 채널 {channel_id}에 연결된 사용자가 없어 채널 정리됨")
+                await broadcast_backend.unsubscribe(project_id, channel_id)
                 
                 # 빈 프로젝트 정리
                 if not active_connections[project_id]:
@@ -105,55 +128,86 @@ async def unregister_connection(project_id: str, channel_id: str, user_id: str)
     except Exception as e:
         logger.error(f"연결 해제 오류: {e}")
 
-async def broadcast_message(new_chat: ChatDetail) -> None:
-    """채널 내 모든 연결된 사용자에게 메시지를 브로드캐스트합니다."""
-    if new_chat.project_id not in active_connections or new_chat.channel_id not in active_connections[new_chat.project_id]:
+async def _get_sender_brief(chat) -> Optional[dict]:
+    """보낸 사람의 brief를 JSON 직렬화 가능한 dict로 반환합니다. (캐시 우선)"""
+    user = getattr(chat, "user", None)
+    if user is not None:
+        brief = user.model_dump(mode="json")
+        user_brief_cache.set(int(chat.user_id), brief)
+        return brief
+    if not chat.user_id:
+        return None
+    brief = user_brief_cache.get(int(chat.user_id), _NOT_CACHED)
+    if brief is _NOT_CACHED:
+        # 캐시 미스일 때만 DB 조회 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        brief = await asyncio.to_thread(get_user_brief, chat.user_id)
+    return brief
+
+async def _send_payload(user_id: str, websocket: WebSocket, payload: str) -> bool:
+    """한 소켓에 메시지를 전송합니다. 느린 소켓은 SEND_TIMEOUT 후 실패로 처리합니다."""
+    try:
+        await asyncio.wait_for(websocket.send_text(payload), timeout=SEND_TIMEOUT)
+        return True
+    except asyncio.TimeoutError:
+        logger.warning(f"사용자 {user_id} 메시지 전송 시간 초과 ({SEND_TIMEOUT}초)")
+    except Exception as e:
+        logger.error(f"사용자 {user_id}에게 메시지 전송 실패: {e}")
+    return False
+
+async def send_to_channel(project_id: str, channel_id: str, payload: str) -> None:
+    """직렬화된 메시지를 채널의 모든 연결에 동시에 전송하고, 실패한 연결은 정리합니다."""
+    connections = list((await get_channel_connections(project_id, channel_id)).items())
+    if not connections:
         return
     
-    disconnected_users = []
+    results = await asyncio.gather(*(
+        _send_payload(user_id, websocket, payload) for user_id, websocket in connections
+    ))
     
-    # 메시지 브로드캐스트 및 연결 유효성 확인
-    for user_id, websocket in list(active_connections[new_chat.project_id][new_chat.channel_id].items()):
+    # 연결이 끊겼거나 응답이 느린 사용자 정리 (그 사이 재연결된 소켓은 유지)
+    for (user_id, websocket), sent in zip(connections, results):
+        if sent:
+            continue
+        if (await get_channel_connections(project_id, channel_id)).get(user_id) is websocket:
+            await unregister_connection(project_id, channel_id, user_id)
         try:
-            # Chat 객체를 JSON으로 변환하여 전송            
-            # Get user brief and convert to dict with serializable values
-            user_brief = UserService(db=next(get_db())).get_user_brief(user_id=new_chat.user_id)
-            
-            # Convert all datetime objects to ISO format strings
-            def convert_datetime(obj):
-                if hasattr(obj, 'isoformat'):
-                    return obj.isoformat()
-                elif isinstance(obj, dict):
-                    return {k: convert_datetime(v) for k, v in obj.items()}
-                elif isinstance(obj, (list, tuple)):
-                    return [convert_datetime(item) for item in obj]
-                return obj
-            
-            user_dict = None
-            if user_brief:
-                user_dict = user_brief.model_dump()
-                user_dict = convert_datetime(user_dict)
-            
-            # Get current timestamp in ISO format
-            current_time = datetime.now().isoformat()
-            
-            chat_data = {
-                "id": new_chat.id,
-                "project_id": new_chat.project_id,
-                "channel_id": new_chat.channel_id,
-                "user_id": new_chat.user_id,
-                "message": new_chat.message,
-                "timestamp": current_time,
-                "user": user_dict
-            }
-            await websocket.send_text(json.dumps(chat_data))
-        except Exception as e:
-            logger.error(f"사용자 {user_id}에게 메시지 전송 실패: {e}")
-            disconnected_users.append(user_id)
-    
-    # 연결이 끊긴 사용자 정리
-    for user_id in disconnected_users:
-        await unregister_connection(new_chat.project_id, new_chat.channel_id, user_id)
+            await asyncio.wait_for(websocket.close(code=status.WS_1011_INTERNAL_ERROR), timeout=1.0)
+        except Exception:
+            pass
+
+async def _deliver_local(project_id: str, channel_id: str, payloads: List[str]) -> None:
+    """브로드캐스트 백엔드가 전달한 메시지를 이 워커의 채널 소켓에 순서대로 전송합니다."""
+    for payload in payloads:
+        await send_to_channel(project_id, channel_id, payload)
+
+# 워커 간 채널 메시지 전달 (설정: BROADCAST_BACKEND)
+broadcast_backend = create_broadcast_backend(_deliver_local)
+
+async def broadcast_message(new_chat: ChatDetail) -> None:
+    """채널 내 모든 연결된 사용자(다른 워커 포함)에게 메시지를 브로드캐스트합니다."""
+    # 보낸 사람 정보 조회와 JSON 직렬화는 메시지당 한 번만 수행
+    chat_data = {
+        "id": new_chat.id,
+        "project_id": new_chat.project_id,
+        "channel_id": new_chat.channel_id,
+        "user_id": new_chat.user_id,
+        "message": new_chat.message,
+        "timestamp": datetime.now().isoformat(),
+        "user": await _get_sender_brief(new_chat)
+    }
+    provisional_id = getattr(new_chat, "provisional_id", None)
+    if provisional_id is not None:
+        chat_data["provisional_id"] = provisional_id
+    await broadcast_backend.publish(new_chat.project_id, new_chat.channel_id, json.dumps(chat_data))
+
+async def _confirm_chat(pending: PendingChat) -> None:
+    """임시 ID로 브로드캐스트한 메시지의 저장 결과(실제 ID 또는 실패)를 채널에 알립니다."""
+    if pending.committed:
+        payload = {"type": "chat_confirmed", "provisional_id": pending.provisional_id, "id": pending.id}
+    else:
+        logger.error(f"채팅 메시지 저장 실패: {pending.provisional_id}, 오류={pending.future.exception()}")
+        payload = {"type": "chat_failed", "provisional_id": pending.provisional_id}
+    await broadcast_backend.publish(pending.project_id, pending.channel_id, json.dumps(payload))
 
 async def publish_system_message(project_id: str, channel_id: str, message: str) -> None:
     """시스템 메시지를 채널에 직접 브로드캐스트합니다."""
@@ -171,8 +225,99 @@ async def publish_system_message(project_id: str, channel_id: str, message: str)
     except Exception as e:
         logger.error(f"시스템 메시지 발행 오류: {e}")
 
+async def _handle_client_message(websocket: WebSocket, data: str, project_id: str, channel_id: str, user_id: int) -> None:
+    """클라이언트가 보낸 메시지 하나를 처리합니다."""
+    try:
+        # 메시지 파싱 및 검증
+        message_data = json.loads(data)
+        
+        # 핑-퐁 응답 처리
+        if message_data.get("type") == "pong":
+            logger.debug(f"퐁 응답 수신: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
+            return
+        
+        # 필드 검증 로직 수정 - 클라이언트가 보내는 형식과 일치시킴
+        if not all(k in message_data for k in ["project_id", "channel_id", "message"]):
+            logger.warning(f"잘못된 메시지 형식: {data[:100]}...")
+            return
+        
+        # 프로젝트 ID와 채널 ID 일치 확인
+        if message_data["project_id"] != project_id or message_data["channel_id"] != channel_id:
+            logger.warning(f"메시지의 프로젝트/채널 ID 불일치: 요청={project_id}/{channel_id}, 메시지={message_data['project_id']}/{message_data['channel_id']}")
+            return
+        
+        # 로깅 - 메시지 내용은 보안상 일부만 표시
+        msg_preview = message_data.get("message", "")[:50]
+        if len(message_data.get("message", "")) > 50:
+            msg_preview += "..."
+        
+        logger.info(
+            f"메시지 수신: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}, "
+            f"내용={msg_preview}"
+        )
+        
+        # === DB에 채팅 메시지 저장 (쓰기 큐를 통해 이벤트 루프 밖에서 배치 저장) ===
+        chat = ChatCreate(project_id=str(project_id), channel_id=str(channel_id), message=message_data.get("message", ""))
+        try:
+            pending = await chat_writer.submit(chat.project_id, chat.channel_id, int(user_id), chat.message)
+        except ChatQueueFull as e:
+            logger.warning(f"채팅 쓰기 대기열 초과: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
+            await _send_payload(str(user_id), websocket, json.dumps({"type": "error", "code": "chat_queue_full", "message": str(e)}))
+            return
+        
+        try:
+            if setting.CHAT_DURABLE_WRITES:
+                # 내구성 모드: 커밋이 끝난 뒤 실제 ID로 브로드캐스트
+                await pending.future
+                await broadcast_message(pending)
+            else:
+                # 임시 ID로 즉시 브로드캐스트하고, 커밋되면 실제 ID를 알림
+                await broadcast_message(pending)
+                pending.future.add_done_callback(lambda _: _spawn(_confirm_chat(pending)))
+        except Exception as e:
+            logger.error(f"채팅 메시지 DB 저장 오류: {e}")
+        # === DB 저장 끝 ===
+
+        # # 채널의 다른 사용자에게 알림 전송
+        # try:
+        #     channel_members = ChannelCRUD.get_channel_by_channel_id(db, channel_id).member_id
+        #     sender_id = int(user_id)
+        #     sender_name = message_data.get("user", "알 수 없는 사용자")
+        #     logger.info(f"{message_data}")
+        
+        #     notification_tasks = []
+        #     for member_id in channel_members:
+        #         if member_id != sender_id:
+        #             notification_id = int(datetime.now().timestamp() * 1000)
+        #             notification_tasks.append(
+        #                 send_notification(
+        #                     db=db,
+        #                     id=notification_id,
+        #                     title=f"{sender_name}님의 새로운 메시지",
+        #                     message=message_data.get("message", ""),
+        #                     type="chat",
+        #                     isRead=False,
+        #                     sender_id=sender_id,
+        #                     receiver_id=member_id,
+        #                     project_id=project_id
+        #                 )
+        #             )
+        
+        #     if notification_tasks:
+        #         await asyncio.gather(*notification_tasks)
+        #         logger.info(f"{len(notification_tasks)}명에게 알림을 전송했습니다.")
+
+        # except Exception as e:
+        #     logger.error(f"알림 전송 중 오류 발생: {e}")
+        
+    except json.JSONDecodeError:
+        logger.error(f"잘못된 JSON 형식: {data[:100]}...")
+    except Exception as e:
+        logger.error(f"메시지 처리 오류: {e}")
+
 async def websocket_handler(websocket: WebSocket, channel_id: str, project_id: str, user_id: int, db: Session) -> None:
     """웹소켓 연결을 처리합니다."""
+    heartbeat = None
     
     try:
         # WebSocket 연결 수락
@@ -186,130 +331,33 @@ async def websocket_handler(websocket: WebSocket, channel_id: str, project_id: s
             await websocket.close(code=status.WS_1011_INTERNAL_ERROR, reason="연결 등록 실패")
             return
         
-        # 클라이언트로부터 메시지 수신 대기
-        try:
-            # 핑-퐁 메시지 주기
-            ping_interval = 30  # 30초마다 핑
-            last_ping_time = asyncio.get_event_loop().time()
-            
-            while True:
-                # 핑-퐁 메시지와 일반 메시지 수신을 동시에 처리
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_ping_time > ping_interval:
-                    try:
-                        # 핑 메시지 전송으로 연결 유지
-                        logger.debug(f"핑 메시지 전송: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
-                        await websocket.send_text(json.dumps({"type": "ping"}))
-                        last_ping_time = current_time
-                    except Exception as e:
-                        logger.error(f"핑 메시지 전송 실패: {e}")
-                        break
-                
-                # 타임아웃과 함께 메시지 수신 대기
-                try:
-                    # 1초 타임아웃으로 receive_text 호출
-                    data = await asyncio.wait_for(
-                        websocket.receive_text(),
-                        timeout=1.0
-                    )
-                    
-                    # 메시지 처리
-                    try:
-                        # 메시지 파싱 및 검증
-                        message_data = json.loads(data)
-                        
-                        # 핑-퐁 응답 처리
-                        if message_data.get("type") == "pong":
-                            logger.debug(f"퐁 응답 수신: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
-                            continue
-                        
-                        # 필드 검증 로직 수정 - 클라이언트가 보내는 형식과 일치시킴
-                        if not all(k in message_data for k in ["project_id", "channel_id", "message"]):
-                            logger.warning(f"잘못된 메시지 형식: {data[:100]}...")
-                            continue
-                        
-                        # 프로젝트 ID와 채널 ID 일치 확인
-                        if message_data["project_id"] != project_id or message_data["channel_id"] != channel_id:
-                            logger.warning(f"메시지의 프로젝트/채널 ID 불일치: 요청={project_id}/{channel_id}, 메시지={message_data['project_id']}/{message_data['channel_id']}")
-                            continue
-                        
-                        # 로깅 - 메시지 내용은 보안상 일부만 표시
-                        msg_preview = message_data.get("message", "")[:50]
-                        if len(message_data.get("message", "")) > 50:
-                            msg_preview += "..."
-                        
-                        logger.info(
-                            f"메시지 수신: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}, "
-                            f"내용={msg_preview}"
-                        )
-                        
-
-                        # === DB에 채팅 메시지 저장 ===
-                        try:
-                            # user_id, projectId, channelId는 str일 수 있으므로 타입 변환
-                            db_user_id = int(user_id)
-                            db_project_id = str(project_id)
-                            db_channel_id = str(channel_id)
-                            db_message = message_data.get("message", "")
-                            
-                            service = ChatService(db)
-                            new_chat = service.create(project_id, channel_id, db_user_id, ChatCreate(project_id=db_project_id, channel_id=db_channel_id, message=db_message))
-                            
-                            # 메시지 직접 브로드캐스트
-                            await broadcast_message(new_chat)
-                        except Exception as e:
-                            logger.error(f"채팅 메시지 DB 저장 오류: {e}")
-                        # === DB 저장 끝 ===
-
-                        # # 채널의 다른 사용자에게 알림 전송
-                        # try:
-                        #     channel_members = ChannelCRUD.get_channel_by_channel_id(db, channel_id).member_id
-                        #     sender_id = int(user_id)
-                        #     sender_name = message_data.get("user", "알 수 없는 사용자")
-                        #     logger.info(f"{message_data}")
-                            
-                        #     notification_tasks = []
-                        #     for member_id in channel_members:
-                        #         if member_id != sender_id:
-                        #             notification_id = int(datetime.now().timestamp() * 1000)
-                        #             notification_tasks.append(
-                        #                 send_notification(
-                        #                     db=db,
-                        #                     id=notification_id,
-                        #                     title=f"{sender_name}님의 새로운 메시지",
-                        #                     message=message_data.get("message", ""),
-                        #                     type="chat",
-                        #                     isRead=False,
-                        #                     sender_id=sender_id,
-                        #                     receiver_id=member_id,
-                        #                     project_id=project_id
-                        #                 )
-                        #             )
-                            
-                        #     if notification_tasks:
-                        #         await asyncio.gather(*notification_tasks)
-                        #         logger.info(f"{len(notification_tasks)}명에게 알림을 전송했습니다.")
-
-                        # except Exception as e:
-                        #     logger.error(f"알림 전송 중 오류 발생: {e}")
-                        
-                    except json.JSONDecodeError:
-                        logger.error(f"잘못된 JSON 형식: {data[:100]}...")
-                    except Exception as e:
-                        logger.error(f"메시지 처리 오류: {e}")
-                
-                except asyncio.TimeoutError:
-                    # 타임아웃은 정상 - 핑 체크를 위한 루프 계속
-                    pass
-                except WebSocketDisconnect:
-                    logger.info(f"웹소켓 연결 끊김: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
-                    break
-                except Exception as e:
-                    logger.error(f"웹소켓 수신 오류: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}, 오류={e}")
-                    break
+        # 핑은 공용 하트비트 스케줄러가 전송 (연결마다 타이머를 두지 않음)
+        async def send_ping() -> None:
+            logger.debug(f"핑 메시지 전송: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
+            await websocket.send_text(PING_PAYLOAD)
         
-        except Exception as e:
-            logger.error(f"메시지 루프 오류: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}, 오류={e}")
+        async def on_ping_failure(error: Exception) -> None:
+            # 소켓을 닫으면 아래 receive_text가 끝나면서 연결이 정리됩니다.
+            logger.error(f"핑 메시지 전송 실패: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}, 오류={error!r}")
+            try:
+                await asyncio.wait_for(websocket.close(code=status.WS_1011_INTERNAL_ERROR), timeout=1.0)
+            except Exception:
+                pass
+        
+        heartbeat = heartbeat_scheduler.register(send_ping, on_ping_failure)
+        
+        # 클라이언트로부터 메시지 수신 대기 (메시지가 올 때만 깨어남)
+        while True:
+            try:
+                data = await websocket.receive_text()
+            except WebSocketDisconnect:
+                logger.info(f"웹소켓 연결 끊김: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
+                break
+            except Exception as e:
+                logger.error(f"웹소켓 수신 오류: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}, 오류={e}")
+                break
+            
+            await _handle_client_message(websocket, data, project_id, channel_id, user_id)
     
     except WebSocketDisconnect:
         logger.info(f"웹소켓 연결이 클라이언트에 의해 종료됨: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
@@ -318,8 +366,9 @@ async def websocket_handler(websocket: WebSocket, channel_id: str, project_id: s
     
     finally:
         logger.info(f"연결 종료 처리 시작: 프로젝트={project_id}, 채널={channel_id}, 사용자={user_id}")
-        # 연결 종료 처리
-        if user_id:
+        heartbeat_scheduler.unregister(heartbeat)
+        # 연결 종료 처리 (그 사이 재연결된 소켓은 유지)
+        if user_id and (await get_channel_connections(project_id, channel_id)).get(str(user_id)) is websocket:
             await unregister_connection(project_id, channel_id, str(user_id))
             
             # # 퇴장 메시지
@@ -0,0 +1,219 @@
+"""
+채팅 메시지 쓰기 파이프라인
+웹소켓 수신 루프에서 DB 커밋을 기다리지 않도록 메시지를 큐에 넣고, 별도 태스크가 모아서 저장합니다.
+
+- submit()은 임시 ID(provisional_id)를 가진 PendingChat을 바로 반환합니다.
+- 쓰기 태스크는 큐에 쌓인 메시지를 최대 batch_size개씩 꺼내 스레드에서 다중 행 INSERT 한 번으로 저장하고,
+  각 PendingChat.future에 실제 ID를 채웁니다. (저장 중에 들어온 메시지는 다음 배치로 묶임)
+- 큐가 max_pending개로 가득 차면 enqueue_timeout 동안 기다린 뒤 ChatQueueFull을 발생시킵니다.
+- 일시적인 연결 오류(OperationalError, DisconnectionError)는 max_retries번까지 다시 시도합니다.
+  그 밖의 오류(제약 조건 위반 등)로 배치 저장이 실패하면 배치를 반으로 나눠 다시 저장하므로,
+  실패한 메시지만 예외를 받고 같은 배치의 다른 메시지는 저장됩니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Union
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DisconnectionError, OperationalError
+from sqlalchemy.orm import Session
+
+from src.api.v1.models.project.chat import Chat
+from src.core.config import setting
+
+logger = logging.getLogger("chat_writer")
+
+# 다시 시도하면 성공할 수 있는 오류 (배치를 나눠도 소용없음)
+TRANSIENT_ERRORS = (OperationalError, DisconnectionError)
+
+
+class ChatQueueFull(Exception):
+    """쓰기 대기열이 가득 차 메시지를 받을 수 없음"""
+
+
+class PendingChat:
+    """저장 대기 중인 채팅 메시지"""
+    __slots__ = ("provisional_id", "project_id", "channel_id", "user_id", "message", "timestamp", "future")
+
+    _sequence = itertools.count(1)
+    _prefix = uuid.uuid4().hex[:8]
+
+    def __init__(self, project_id: str, channel_id: str, user_id: int, message: str):
+        self.provisional_id = f"pending_{self._prefix}_{next(self._sequence)}"
+        self.project_id = project_id
+        self.channel_id = channel_id
+        self.user_id = user_id
+        self.message = message
+        self.timestamp = datetime.utcnow()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    @property
+    def id(self):
+        """커밋된 뒤에는 실제 ID, 그 전에는 임시 ID"""
+        return self.future.result() if self.committed else self.provisional_id
+
+    @property
+    def committed(self) -> bool:
+        return self.future.done() and not self.future.cancelled() and self.future.exception() is None
+
+    def row(self) -> Dict:
+        return {
+            "project_id": self.project_id,
+            "channel_id": self.channel_id,
+            "user_id": self.user_id,
+            "message": self.message,
+            "timestamp": self.timestamp,
+        }
+
+
+class ChatWriter:
+    """채팅 메시지를 배치로 저장하는 비동기 쓰기 큐"""
+
+    def __init__(self, batch_size: int = 100, max_pending: int = 10000, enqueue_timeout: float = 1.0,
+                 max_retries: int = 2, retry_delay: float = 0.1,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.enqueue_timeout = enqueue_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._session_factory = session_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """큐에 남아 있는 메시지 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _ensure_started(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 테스트처럼 이벤트 루프가 바뀐 경우 이전 루프의 큐는 버립니다.
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return self._queue
+
+    async def submit(self, project_id: str, channel_id: str, user_id: int, message: str) -> PendingChat:
+        """
+        메시지를 쓰기 큐에 넣고 PendingChat을 반환합니다.
+
+        Raises:
+            ChatQueueFull: enqueue_timeout 안에 큐에 자리가 나지 않은 경우
+        """
+        queue = self._ensure_started()
+        pending = PendingChat(project_id, channel_id, user_id, message)
+        try:
+            queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(queue.put(pending), timeout=self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                raise ChatQueueFull(f"채팅 쓰기 대기열이 가득 찼습니다. ({self.max_pending}개)")
+        return pending
+
+    async def flush(self) -> None:
+        """지금까지 받은 메시지가 모두 처리될 때까지 기다립니다."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """남은 메시지를 저장하고 쓰기 태스크를 종료합니다."""
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[PendingChat]) -> None:
+        try:
+            results = await asyncio.to_thread(self._insert_isolated, [pending.row() for pending in batch])
+        except Exception as e:
+            logger.error(f"채팅 메시지 배치 저장 실패 ({len(batch)}건): {e}")
+            results = [e] * len(batch)
+        for pending, result in zip(batch, results):
+            if pending.future.done():
+                continue
+            if isinstance(result, Exception):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(result)
+
+    def _insert_isolated(self, rows: List[Dict]) -> List[Union[int, Exception]]:
+        """
+        행마다 실제 ID 또는 저장 실패 예외를 반환합니다.
+        일시적이지 않은 오류는 배치를 반으로 나눠 다시 저장해 실패한 행만 골라냅니다.
+        """
+        try:
+            return self._insert_with_retry(rows)
+        except TRANSIENT_ERRORS as e:
+            logger.error(f"채팅 메시지 저장 실패, 재시도 초과 ({len(rows)}건): {e}")
+            return [e] * len(rows)
+        except Exception as e:
+            if len(rows) == 1:
+                logger.error(f"채팅 메시지 저장 실패: channel={rows[0]['channel_id']}, user={rows[0]['user_id']}, 오류={e}")
+                return [e]
+            middle = len(rows) // 2
+            return self._insert_isolated(rows[:middle]) + self._insert_isolated(rows[middle:])
+
+    def _insert_with_retry(self, rows: List[Dict]) -> List[int]:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._insert_batch(rows)
+            except TRANSIENT_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"채팅 메시지 저장 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+                time.sleep(self.retry_delay * (attempt + 1))
+
+    def _insert_batch(self, rows: List[Dict]) -> List[int]:
+        if self._session_factory is None:
+            # 웹소켓 트래픽이 REST 풀을 고갈시키지 않도록 스트리밍 풀 사용
+            from src.core.database.database import StreamSessionLocal
+            self._session_factory = StreamSessionLocal
+        db = self._session_factory()
+        try:
+            # 다중 행 INSERT ... RETURNING, 입력 순서대로 ID 반환
+            # (PostgreSQL은 배치 단위 INSERT, SQLite는 한 트랜잭션 안에서 행 단위 INSERT로 처리됨)
+            ids = db.scalars(insert(Chat).returning(Chat.id, sort_by_parameter_order=True), rows).all()
+            db.commit()
+            return list(ids)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+# 전역 인스턴스 생성
+chat_writer = ChatWriter(
+    batch_size=setting.CHAT_WRITE_BATCH_SIZE,
+    max_pending=setting.CHAT_WRITE_MAX_PENDING
+)
@@ -1,20 +1,36 @@
 from sqlalchemy.orm import Session
 from src.api.v1.models.association_tables import project_members
 from src.api.v1.models.user.user import User
-from typing import Dict, Any
+from typing import Dict, Any, List
 from src.api.v1.schemas.brief import UserBrief
 
-def format_member_details(db: Session, project_id: str, member: User) -> Dict[str, Any]:
+def format_members_by_project(db: Session, project_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
     """
-    프로젝트 멤버의 상세 정보를 포맷팅합니다.
+    여러 프로젝트의 멤버 상세 정보를 한 번의 쿼리로 포맷팅합니다.
     """
-    # Get the association data from the association table
-    stmt = project_members.select().where(
-        (project_members.c.project_id == project_id) & 
-        (project_members.c.user_id == member.id)
+    result: Dict[str, List[Dict[str, Any]]] = {project_id: [] for project_id in project_ids}
+    if not project_ids:
+        return result
+    
+    # 멤버와 연관 테이블 정보를 한 번에 조회
+    rows = (
+        db.query(User, project_members)
+        .join(project_members, project_members.c.user_id == User.id)
+        .filter(project_members.c.project_id.in_(project_ids))
+        .all()
     )
-    assoc = db.execute(stmt).first()
     
+    for row in rows:
+        member = row[0]
+        assoc = row._mapping
+        result[assoc["project_id"]].append(_build_member_details(member, assoc))
+    
+    return result
+
+def _build_member_details(member: User, assoc) -> Dict[str, Any]:
+    """
+    사용자와 연관 테이블 행으로 멤버 상세 정보를 구성합니다.
+    """
     # Create UserBrief instance and explicitly set links
     user_brief = UserBrief.model_validate(member, from_attributes=True)
     
@@ -30,17 +46,17 @@ def format_member_details(db: Session, project_id: str, member: User) -> Dict[st
     # Determine the role based on is_leader and is_manager flags
     role = None
     if assoc:
-        if assoc.is_leader == 1:
+        if assoc["is_leader"] == 1:
             role = "leader"
-        elif assoc.is_manager == 1:
+        elif assoc["is_manager"] == 1:
             role = "manager"
         else:
-            role = getattr(assoc, 'role', 'member')  # Default to 'member' if role is not set
+            role = assoc.get("role", "member")  # Default to 'member' if role is not set
     
     return {
         "user": user_brief,
         "role": role,
-        "is_leader": bool(assoc.is_leader) if assoc else False,
-        "is_manager": bool(assoc.is_manager) if assoc else False,
-        "joined_at": getattr(assoc, 'joined_at', None) if assoc else None
-    }
\ No newline at end of file
+        "is_leader": bool(assoc["is_leader"]) if assoc else False,
+        "is_manager": bool(assoc["is_manager"]) if assoc else False,
+        "joined_at": assoc.get("joined_at") if assoc else None
+    }
@@ -0,0 +1,137 @@
+"""
+응답 조각(fragment) 캐시
+여러 사용자에게 똑같이 나가는 응답 부분(커뮤니티 인기 태그, 최신 게시글 등)을
+직렬화된 JSON bytes로 보관하고, 라우트에서 다른 조각과 이어 붙여 그대로 응답합니다.
+
+- 조각마다 TTL과 태그("posts", "post_reactions" 등)를 가집니다. 쓰기 경로는 커밋 후
+  invalidate_tags()로 해당 태그의 조각을 모두 제거합니다.
+- 캐시 미스인 조각은 스레드 풀에서 새 세션으로 렌더링하므로, 요청 스레드는 그동안
+  사용자별 부분을 계산할 수 있습니다. 같은 조각의 동시 미스는 렌더링 한 번을 공유합니다.
+- 렌더링 도중 태그가 무효화되면 결과는 이번 응답에만 쓰고 저장하지 않습니다.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("fragment_cache")
+
+RenderFn = Callable[[Session], bytes]
+
+
+class _Fragment:
+    __slots__ = ("body", "tags", "expires_at")
+
+    def __init__(self, body: bytes, tags: Tuple[str, ...], ttl: float):
+        self.body = body
+        self.tags = tags
+        self.expires_at = time.monotonic() + ttl
+
+
+class FragmentCache:
+    """직렬화된 응답 조각 저장소 (키별 TTL, 태그 무효화)"""
+
+    def __init__(self, maxsize: int = 256, max_workers: int = 2,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        self.maxsize = maxsize
+        self._session_factory = session_factory
+        self._fragments: "OrderedDict[str, _Fragment]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._generation = 0
+        self._rendering: Dict[str, Tuple[Future, Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fragment")
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """만료되지 않은 조각을 반환합니다."""
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is None:
+                return None
+            if fragment.expires_at <= time.monotonic():
+                del self._fragments[key]
+                return None
+            self._fragments.move_to_end(key)
+            return fragment.body
+
+    def render_async(self, key: str, render: RenderFn, ttl: float, tags: Iterable[str] = ()) -> "Future[bytes]":
+        """
+        조각을 Future로 반환합니다.
+        캐시에 있으면 완료된 Future, 없으면 스레드 풀에서 render(세션) 결과를 저장합니다.
+        """
+        body = self.get(key)
+        if body is not None:
+            future: "Future[bytes]" = Future()
+            future.set_result(body)
+            return future
+
+        tags = tuple(tags)
+        with self._lock:
+            rendering = self._rendering.get(key)
+            if rendering is not None:
+                return rendering[0]
+            versions = {tag: self._versions.get(tag, 0) for tag in tags}
+            future = self._executor.submit(self._render, key, render, ttl, tags, self._generation, versions)
+            self._rendering[key] = (future, tags)
+        future.add_done_callback(lambda _: self._discard_rendering(key, future))
+        return future
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """태그가 붙은 조각을 제거합니다. 진행 중인 렌더링 결과도 저장되지 않습니다."""
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+            for key in [key for key, fragment in self._fragments.items() if set(fragment.tags).intersection(tags)]:
+                del self._fragments[key]
+            # 무효화 전에 시작한 렌더링은 이후 요청이 공유하지 않도록 분리
+            for key in [key for key, (_, rendering_tags) in self._rendering.items() if set(rendering_tags).intersection(tags)]:
+                del self._rendering[key]
+
+    def clear(self) -> None:
+        """모든 조각을 제거합니다."""
+        with self._lock:
+            self._generation += 1
+            self._fragments.clear()
+            self._rendering.clear()
+
+    def _discard_rendering(self, key: str, future: Future) -> None:
+        with self._lock:
+            rendering = self._rendering.get(key)
+            if rendering is not None and rendering[0] is future:
+                del self._rendering[key]
+
+    def _render(self, key: str, render: RenderFn, ttl: float, tags: Tuple[str, ...],
+                generation: int, versions: Dict[str, int]) -> bytes:
+        if self._session_factory is None:
+            from src.core.database.database import SessionLocal
+            self._session_factory = SessionLocal
+        db = self._session_factory()
+        try:
+            body = render(db)
+        except Exception:
+            logger.exception("Failed to render fragment %s", key)
+            raise
+        finally:
+            db.close()
+
+        with self._lock:
+            if generation == self._generation and all(
+                self._versions.get(tag, 0) == version for tag, version in versions.items()
+            ):
+                self._fragments[key] = _Fragment(body, tags, ttl)
+                self._fragments.move_to_end(key)
+                while len(self._fragments) > self.maxsize:
+                    self._fragments.popitem(last=False)
+        return body
+
+
+# 전역 인스턴스 생성
+fragment_cache = FragmentCache()
@@ -0,0 +1,119 @@
+"""
+웹소켓 공용 하트비트 스케줄러 (타이밍 휠)
+연결마다 타이머를 두지 않고, 이벤트 루프당 하나의 태스크가 tick마다 휠의 한 칸만 처리합니다.
+
+- 연결은 등록된 칸에 놓이고, 휠이 한 바퀴(interval) 돌 때마다 ping을 받습니다.
+- 연결이 없으면 태스크는 tick 없이 대기하므로 유휴 상태에서 깨어나지 않습니다.
+- ping 전송이 실패하거나 send_timeout을 넘기면 연결을 휠에서 빼고 on_failure를 호출합니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger("heartbeat")
+
+PingFn = Callable[[], Awaitable[None]]
+FailureFn = Callable[[Exception], Awaitable[None]]
+
+
+class _Entry:
+    __slots__ = ("ping", "on_failure", "slot")
+
+    def __init__(self, ping: PingFn, on_failure: Optional[FailureFn], slot: int):
+        self.ping = ping
+        self.on_failure = on_failure
+        self.slot = slot
+
+
+class HeartbeatScheduler:
+    """모든 연결이 공유하는 ping 스케줄러"""
+
+    def __init__(self, interval: float = 30.0, tick: float = 1.0, send_timeout: float = 5.0):
+        self.interval = interval
+        self.tick = tick
+        self.send_timeout = send_timeout
+        self._slot_count = max(1, math.ceil(interval / tick))
+        self._ids = itertools.count(1)
+        self._reset(None)
+
+    def _reset(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        self._loop = loop
+        self._wheel: List[Dict[int, _Entry]] = [{} for _ in range(self._slot_count)]
+        self._entries: Dict[int, _Entry] = {}
+        self._position = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event() if loop is not None else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def register(self, ping: PingFn, on_failure: Optional[FailureFn] = None) -> int:
+        """
+        연결을 휠에 등록합니다. 첫 ping은 interval 뒤에 전송됩니다.
+
+        Args:
+            ping: ping 메시지를 보내는 코루틴 함수
+            on_failure: ping 실패 시 호출할 코루틴 함수 (예외를 인자로 받음)
+
+        Returns:
+            int: unregister()에 넘길 핸들
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 테스트처럼 이벤트 루프가 바뀐 경우 이전 루프의 상태는 버립니다.
+            self._reset(loop)
+
+        handle = next(self._ids)
+        entry = _Entry(ping, on_failure, self._position)
+        self._entries[handle] = entry
+        self._wheel[entry.slot][handle] = entry
+
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        self._wakeup.set()
+        return handle
+
+    def unregister(self, handle: Optional[int]) -> None:
+        """연결을 휠에서 제거합니다. (이미 제거된 핸들은 무시)"""
+        entry = self._entries.pop(handle, None)
+        if entry is not None:
+            self._wheel[entry.slot].pop(handle, None)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.tick
+        while True:
+            if not self._entries:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                next_tick = loop.time() + self.tick
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            next_tick += self.tick
+            self._position = (self._position + 1) % self._slot_count
+            due = self._wheel[self._position]
+            if due:
+                # 같은 칸에 그대로 두면 한 바퀴 뒤에 다시 ping을 받습니다.
+                await self._ping_all(list(due.items()))
+
+    async def _ping_all(self, due: List[tuple]) -> None:
+        results = await asyncio.gather(
+            *(asyncio.wait_for(entry.ping(), timeout=self.send_timeout) for _, entry in due),
+            return_exceptions=True
+        )
+        for (handle, entry), result in zip(due, results):
+            if not isinstance(result, Exception):
+                continue
+            self.unregister(handle)
+            if entry.on_failure is None:
+                continue
+            try:
+                await entry.on_failure(result)
+            except Exception as e:
+                logger.error(f"하트비트 실패 처리 오류: {e}")
+
+
+# 전역 인스턴스 생성
+heartbeat_scheduler = HeartbeatScheduler()
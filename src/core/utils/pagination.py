@@ -0,0 +1,28 @@
+import base64
+import json
+from typing import Any, Dict, Optional
+from fastapi import HTTPException
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+  """
+  키셋 페이지네이션 커서 인코딩
+  """
+  raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+  return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+  """
+  키셋 페이지네이션 커서 디코딩
+  잘못된 커서는 400 에러를 발생시킵니다.
+  """
+  if not cursor:
+    return None
+  
+  try:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    if not isinstance(payload, dict):
+      raise ValueError("cursor payload must be an object")
+    return payload
+  except Exception:
+    raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
@@ -0,0 +1,119 @@
+"""
+프로젝트 변경 이벤트
+업무, 마일스톤, 일정, 멤버가 바뀔 때 바뀐 필드만 담은 이벤트를 프로젝트 SSE 스트림으로 보냅니다.
+
+    {"type": "task.updated", "project_id": "PRJ001", "version": 12,
+     "entity": "task", "action": "updated", "id": 5, "data": {"status": "completed"}}
+
+- 저장소는 커밋 전에 record_project_event()를 호출합니다. 같은 트랜잭션에서 projects.version을
+  1 올리고, 이벤트는 세션에 보관했다가 커밋된 뒤에만 발행합니다. (롤백되면 버림)
+- version은 프로젝트마다 이벤트 하나당 1씩 증가합니다. 클라이언트는 받은 version이
+  마지막 version + 1이 아니면 스냅샷(ProjectDetail.version 포함)을 다시 받아야 합니다.
+- 저장소는 스레드 풀에서 동기로 실행되므로, 발행은 이벤트 루프로 넘겨서 처리합니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, inspect, update
+from sqlalchemy.orm import Session
+
+from src.api.v1.models.project.project import Project
+
+logger = logging.getLogger("project_events")
+
+_SESSION_KEY = "project_events"
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+def entity_fields(obj: Any) -> Dict[str, Any]:
+    """ORM 객체의 컬럼 값을 JSON 직렬화 가능한 dict로 반환합니다. (관계 제외)"""
+    return jsonable_encoder({attr.key: getattr(obj, attr.key) for attr in inspect(type(obj)).column_attrs})
+
+
+def record_project_event(db: Session, project_id: str, entity: str, action: str, entity_id: Any,
+                         data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    프로젝트 변경 이벤트를 기록합니다. 커밋 전에 호출해야 합니다.
+
+    Args:
+        db: 변경을 커밋할 세션
+        project_id: 프로젝트 ID
+        entity: task | milestone | schedule | member
+        action: created | updated | deleted
+        entity_id: 변경된 항목의 ID (멤버는 사용자 ID)
+        data: 생성 시 전체 필드, 수정 시 바뀐 필드만 (삭제 시 생략)
+    """
+    version = db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(version=Project.version + 1)
+        .returning(Project.version)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    change = {
+        "type": f"{entity}.{action}",
+        "project_id": project_id,
+        "version": version,
+        "entity": entity,
+        "action": action,
+        "id": entity_id,
+        "data": jsonable_encoder(data or {}),
+    }
+    db.info.setdefault(_SESSION_KEY, []).append(change)
+    return change
+
+
+class ProjectEventPublisher:
+    """커밋된 변경 이벤트를 SSE 허브로 발행"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 발행 태스크 참조 유지 (참조가 없으면 끝나기 전에 GC될 수 있음)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """스레드 풀에서 커밋된 이벤트를 넘길 이벤트 루프를 지정합니다. (앱 시작 시)"""
+        self._loop = loop
+
+    def dispatch(self, changes: List[Dict[str, Any]]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            task = loop.create_task(self.publish(changes))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        elif self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.publish(changes), self._loop)
+
+    async def publish(self, changes: List[Dict[str, Any]]) -> None:
+        from src.core.utils.sse_manager import sse_hub
+
+        for change in changes:
+            try:
+                await sse_hub.publish("project", change["project_id"], change)
+            except Exception as e:
+                logger.error(f"프로젝트 이벤트 발행 실패: {change['type']} ({change['project_id']}), 오류={e}")
+
+
+project_event_publisher = ProjectEventPublisher()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    changes = session.info.pop(_SESSION_KEY, None)
+    if changes:
+        project_event_publisher.dispatch(changes)
+
+
+# SAVEPOINT 롤백에서도 모두 버립니다. (버전 증가도 함께 롤백되므로, 놓친 이벤트는 클라이언트가 버전 공백으로 감지)
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_SESSION_KEY, None)
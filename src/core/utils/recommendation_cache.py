@@ -0,0 +1,171 @@
+"""
+유저별 팔로우 추천 캐시
+유저마다 상위 K개의 추천 결과와 계산 시각을 보관합니다.
+
+- 캐시가 없으면 요청 세션으로 즉시 계산해 저장합니다.
+- ttl이 지난 항목은 그대로 반환하고, 스레드 풀에서 새 세션으로 다시 계산합니다.
+- 팔로우 관계나 프로필(기술 스택, 관심분야, 협업 선호도)이 바뀌면 invalidate()로 그 유저의 항목과,
+  그 유저를 추천 목록에 담고 있는 다른 유저의 항목을 함께 제거합니다. (추천 대상 -> 조회 유저 역색인)
+- 프로필 변경으로 다른 유저의 top-K에 새로 들어가야 하는 경우는 역색인으로 알 수 없으므로,
+  해당 유저 항목의 ttl이 지나 백그라운드에서 다시 계산될 때 반영됩니다.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("recommendation_cache")
+
+ComputeFn = Callable[[Session, int], List[Dict[str, Any]]]
+
+
+class _Entry:
+    __slots__ = ("recommendations", "computed_at", "computed_monotonic")
+
+    def __init__(self, recommendations: List[Dict[str, Any]]):
+        self.recommendations = recommendations
+        self.computed_at = datetime.now(timezone.utc)
+        self.computed_monotonic = time.monotonic()
+
+
+class RecommendationCache:
+    """유저별 top-K 추천 저장소 (백그라운드 갱신)"""
+
+    # 추천 요청의 최대 limit (RecommendationRequest.limit <= 50)
+    TOP_K = 50
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10000, max_workers: int = 2,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._session_factory = session_factory
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._viewers: Dict[int, Set[int]] = {}  # 추천 대상 유저 -> 그 유저가 포함된 항목의 유저
+        self._refreshing: Set[int] = set()
+        self._futures: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recommendation")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, db: Session, user_id: int, compute: ComputeFn) -> Tuple[List[Dict[str, Any]], datetime]:
+        """
+        유저의 추천 목록과 계산 시각을 반환합니다.
+
+        Args:
+            db: 캐시 미스 시 계산에 사용할 요청 세션
+            user_id: 추천을 받을 유저 ID
+            compute: (세션, 유저 ID) -> 추천 목록 (TOP_K개, 유사도 내림차순)
+
+        Returns:
+            Tuple[List[Dict], datetime]: (추천 목록, 계산 시각)
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                self._entries.move_to_end(user_id)
+            version = self._versions.get(user_id, 0)
+
+        if entry is None:
+            entry = self._store(user_id, version, compute(db, user_id))
+            return entry.recommendations, entry.computed_at
+
+        if time.monotonic() - entry.computed_monotonic > self.ttl:
+            self.refresh_async(user_id, compute)
+        return entry.recommendations, entry.computed_at
+
+    def refresh_async(self, user_id: int, compute: ComputeFn) -> None:
+        """스레드 풀에서 유저의 추천을 다시 계산합니다. (이미 갱신 중이면 무시)"""
+        with self._lock:
+            if user_id in self._refreshing:
+                return
+            self._refreshing.add(user_id)
+            version = self._versions.get(user_id, 0)
+            future = self._executor.submit(self._refresh, user_id, version, compute)
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+
+    def warm(self, user_ids: Iterable[int], compute: ComputeFn) -> None:
+        """여러 유저의 추천을 백그라운드에서 미리 계산합니다."""
+        for user_id in user_ids:
+            self.refresh_async(user_id, compute)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        유저의 추천 항목과 그 유저가 추천 목록에 포함된 항목을 제거합니다.
+        진행 중인 백그라운드 결과도 버려집니다.
+        """
+        with self._lock:
+            for viewer_id in {user_id} | self._viewers.get(user_id, set()):
+                self._remove(viewer_id)
+                self._versions[viewer_id] = self._versions.get(viewer_id, 0) + 1
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            for user_id in list(self._entries):
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._entries.clear()
+            self._viewers.clear()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """진행 중인 백그라운드 갱신이 끝날 때까지 기다립니다."""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def _discard_future(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _store(self, user_id: int, version: int, recommendations: List[Dict[str, Any]]) -> _Entry:
+        """계산 시작 이후 invalidate되지 않았다면 저장합니다."""
+        entry = _Entry(recommendations)
+        with self._lock:
+            if self._versions.get(user_id, 0) != version:
+                return entry
+            self._remove(user_id)
+            self._entries[user_id] = entry
+            for recommendation in recommendations:
+                self._viewers.setdefault(recommendation["user_id"], set()).add(user_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+        return entry
+
+    def _remove(self, user_id: int) -> None:
+        """항목과 역색인 연결을 제거합니다. (self._lock 안에서 호출)"""
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return
+        for recommendation in entry.recommendations:
+            viewers = self._viewers.get(recommendation["user_id"])
+            if viewers is not None:
+                viewers.discard(user_id)
+                if not viewers:
+                    del self._viewers[recommendation["user_id"]]
+
+    def _refresh(self, user_id: int, version: int, compute: ComputeFn) -> None:
+        if self._session_factory is None:
+            from src.core.database.database import SessionLocal
+            self._session_factory = SessionLocal
+        db = self._session_factory()
+        try:
+            self._store(user_id, version, compute(db, user_id))
+        except Exception:
+            logger.exception("Failed to refresh recommendations for user %s", user_id)
+        finally:
+            db.close()
+            with self._lock:
+                self._refreshing.discard(user_id)
+
+
+# 전역 인스턴스 생성
+recommendation_cache = RecommendationCache()
@@ -1,5 +1,5 @@
 from src.api.v1.schemas.user import NotificationCreate
-from src.core.utils.sse_manager import notification_sse_manager
+from src.core.utils.sse_manager import sse_hub
 import json
 from sqlalchemy.orm import Session
 from src.api.v1.models.user.user import User as UserModel
@@ -47,10 +47,7 @@ async def send_notification(
   
   receiver_model_instance.notification = processed_notifications_list
 
-  await notification_sse_manager.send_event(
-    receiver_id,
-    json.dumps(notification_sse_manager.convert_to_dict(receiver_model_instance.notification))
-  )
+  await sse_hub.publish("notification", receiver_id, receiver_model_instance.notification)
   
   db.query(UserModel).filter(UserModel.id == receiver_id).update(
     {'notification': receiver_model_instance.notification}, 
@@ -0,0 +1,500 @@
+"""
+유저 유사도 벡터 인덱스
+모든 유저의 tech_stacks, interests, collaboration preference를 희소 벡터/코드 배열로 압축해 두고
+NumPy 연산과 부분 정렬(top-k)로 추천 후보를 계산합니다.
+
+점수 계산 규칙과 가중치는 UserSimilarityCalculator와 동일하며,
+같은 입력에 대해 같은 순위를 반환합니다.
+"""
+
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from src.api.v1.models.association_tables import user_follows
+from src.api.v1.models.user.collaboration_preference import CollaborationPreference
+from src.api.v1.models.user.interest import UserInterest
+from src.api.v1.models.user.tech_stack import UserTechStack
+from src.api.v1.models.user.user import User
+from src.core.utils.similarity_calculator import similarity_calculator
+
+
+# 문자열 비교 필드 (UserSimilarityCalculator의 비교 순서와 동일)
+STRING_FIELDS = ("collaboration_style", "preferred_project_type", "preferred_role")
+LENGTH_FIELD = "preferred_project_length"
+TIMEZONE_FIELD = "available_time_zone"
+
+
+class UserFeatures:
+    """유사도 계산에 필요한 유저 특성"""
+
+    __slots__ = ("techs", "interests", "preference")
+
+    def __init__(self, techs: Optional[Dict[str, int]] = None,
+                 interests: Optional[Iterable[Tuple[str, str]]] = None,
+                 preference: Optional[Dict[str, object]] = None):
+        self.techs = techs or {}
+        self.interests: FrozenSet[Tuple[str, str]] = frozenset(interests or ())
+        self.preference = preference
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserFeatures":
+        """ORM User 객체에서 특성을 추출합니다."""
+        pref = user.collaboration_preference
+        return cls(
+            techs={stack.tech: stack.level or 0 for stack in user.tech_stacks},
+            interests={(interest.interest_category, interest.interest_name) for interest in user.interests},
+            preference=_preference_dict(pref) if pref else None,
+        )
+
+
+def _preference_dict(pref) -> Dict[str, object]:
+    return {
+        "collaboration_style": pref.collaboration_style,
+        "preferred_project_type": pref.preferred_project_type,
+        "preferred_role": pref.preferred_role,
+        "available_time_zone": pref.available_time_zone,
+        "work_hours_start": pref.work_hours_start,
+        "work_hours_end": pref.work_hours_end,
+        "preferred_project_length": pref.preferred_project_length,
+    }
+
+
+def load_features(db: Session, user_ids: Optional[Iterable[int]] = None) -> Dict[int, UserFeatures]:
+    """
+    유저 특성을 집합 쿼리로 조회합니다. (테이블당 1회)
+
+    Args:
+        db: 데이터베이스 세션
+        user_ids: 조회할 유저 ID 목록 (None이면 전체)
+
+    Returns:
+        Dict[int, UserFeatures]: 존재하는 유저의 특성
+    """
+    ids = None if user_ids is None else list(set(user_ids))
+    if ids is not None and not ids:
+        return {}
+
+    def scoped(query, column):
+        return query if ids is None else query.filter(column.in_(ids))
+
+    features = {
+        user_id: UserFeatures()
+        for (user_id,) in scoped(db.query(User.id), User.id)
+    }
+
+    for user_id, tech, level in scoped(
+        db.query(UserTechStack.user_id, UserTechStack.tech, UserTechStack.level), UserTechStack.user_id
+    ):
+        if user_id in features:
+            features[user_id].techs[tech] = level or 0
+
+    interests: Dict[int, Set[Tuple[str, str]]] = {}
+    for user_id, category, name in scoped(
+        db.query(UserInterest.user_id, UserInterest.interest_category, UserInterest.interest_name),
+        UserInterest.user_id
+    ):
+        interests.setdefault(user_id, set()).add((category, name))
+    for user_id, values in interests.items():
+        if user_id in features:
+            features[user_id].interests = frozenset(values)
+
+    for pref in scoped(db.query(CollaborationPreference), CollaborationPreference.user_id):
+        if pref.user_id in features:
+            features[pref.user_id].preference = _preference_dict(pref)
+
+    return features
+
+
+class _Segment:
+    """불변 압축 특성 블록 (유저 ID 오름차순)"""
+
+    def __init__(self, features: Dict[int, UserFeatures], candidates: bool = False):
+        user_ids = sorted(features)
+        self.user_ids = np.asarray(user_ids, dtype=np.int64)
+        self.rows = {user_id: row for row, user_id in enumerate(user_ids)}
+        self.alive = np.ones(len(user_ids), dtype=bool)
+        n = len(user_ids)
+
+        self.tech_sizes = np.zeros(n, dtype=np.float64)
+        self.interest_sizes = np.zeros(n, dtype=np.float64)
+        self.has_preference = np.zeros(n, dtype=bool)
+        self.work_start = np.full(n, np.nan)
+        self.work_end = np.full(n, np.nan)
+
+        tech_rows: Dict[str, List[int]] = {}
+        tech_levels: Dict[str, List[int]] = {}
+        interest_rows: Dict[Tuple[str, str], List[int]] = {}
+        field_names = STRING_FIELDS + (TIMEZONE_FIELD, LENGTH_FIELD)
+        self.vocab: Dict[str, List[str]] = {field: [] for field in field_names}
+        vocab_index: Dict[str, Dict[str, int]] = {field: {} for field in field_names}
+        codes = {field: np.full(n, -1, dtype=np.int32) for field in field_names}
+
+        for row, user_id in enumerate(user_ids):
+            feature = features[user_id]
+            self.tech_sizes[row] = len(feature.techs)
+            for tech, level in feature.techs.items():
+                tech_rows.setdefault(tech, []).append(row)
+                tech_levels.setdefault(tech, []).append(level)
+
+            self.interest_sizes[row] = len(feature.interests)
+            for key in feature.interests:
+                interest_rows.setdefault(key, []).append(row)
+
+            pref = feature.preference
+            if not pref:
+                continue
+            self.has_preference[row] = True
+            for field in field_names:
+                value = pref.get(field)
+                if not value:
+                    continue
+                # 문자열 필드는 대소문자/공백을 정규화한 값으로 코드화 (시간대는 원본 비교)
+                key = value if field == TIMEZONE_FIELD else value.lower().strip()
+                index = vocab_index[field].get(key)
+                if index is None:
+                    index = vocab_index[field][key] = len(self.vocab[field])
+                    self.vocab[field].append(key)
+                codes[field][row] = index
+            if pref.get("work_hours_start") is not None and pref.get("work_hours_end") is not None:
+                self.work_start[row] = pref["work_hours_start"]
+                self.work_end[row] = pref["work_hours_end"]
+
+        self.codes = codes
+        self.tech_postings = {
+            tech: (np.asarray(rows, dtype=np.int64), np.asarray(tech_levels[tech], dtype=np.float64))
+            for tech, rows in tech_rows.items()
+        }
+        self.interest_postings = {
+            key: np.asarray(rows, dtype=np.int64) for key, rows in interest_rows.items()
+        }
+        self.has_candidates = False
+        if candidates:
+            self._build_profile_groups()
+
+    def _build_profile_groups(self) -> None:
+        """
+        협업 선호도 값이 완전히 같은 유저를 프로필 그룹으로 묶습니다.
+        협업 유사도는 그룹마다 한 번만 계산하면 되므로 후보 생성에 사용합니다.
+        """
+        columns = [self.has_preference.astype(np.int64)]
+        columns.extend(self.codes[field].astype(np.int64) for field in STRING_FIELDS + (TIMEZONE_FIELD, LENGTH_FIELD))
+        columns.append(np.nan_to_num(self.work_start, nan=-1).astype(np.int64))
+        columns.append(np.nan_to_num(self.work_end, nan=-1).astype(np.int64))
+        _, inverse = np.unique(np.stack(columns, axis=1), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        # 그룹별 행 목록 (그룹 안에서는 행 = 유저 ID 오름차순)
+        self.profile_rows = np.argsort(inverse, kind="stable")
+        sizes = np.bincount(inverse)
+        self.profile_offsets = np.concatenate(([0], np.cumsum(sizes)))
+        self.profile_first_rows = self.profile_rows[self.profile_offsets[:-1]]
+        self.has_candidates = True
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def components(self, target: UserFeatures,
+                   rows: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """대상 유저와 세그먼트 내 유저(rows가 주어지면 해당 행만)의 (협업, 기술, 관심분야) 유사도 벡터"""
+        tech = self._tech_scores(target)
+        interests = self._interest_scores(target)
+        if rows is not None:
+            tech, interests = tech[rows], interests[rows]
+        return self._collaboration_scores(target, rows), tech, interests
+
+    def candidate_rows(self, target: UserFeatures, max_candidates: int) -> np.ndarray:
+        """
+        정확 점수를 계산할 후보 행을 반환합니다.
+
+        1. 기술 스택/관심분야 역색인: 하나라도 겹치는 유저 (겹친 수가 많은 순으로 최대 max_candidates명)
+        2. 협업 프로필 그룹: 그룹별 협업 유사도가 높은 순으로 최대 max_candidates명
+
+        겹치는 기술/관심분야가 없는 유저의 점수는 협업 유사도만으로 정해지므로,
+        1번이 잘리지 않으면 두 집합의 합집합만 점수화해도 정확한 순위와 같습니다.
+        """
+        parts = [self.tech_postings[tech][0] for tech in target.techs if tech in self.tech_postings]
+        parts.extend(self.interest_postings[key] for key in target.interests if key in self.interest_postings)
+        overlap_rows = np.empty(0, dtype=np.int64)
+        if parts:
+            overlap_rows, hits = np.unique(np.concatenate(parts), return_counts=True)
+            if len(overlap_rows) > max_candidates:
+                keep = np.argpartition(-hits, max_candidates - 1)[:max_candidates]
+                overlap_rows = np.sort(overlap_rows[keep])
+
+        profile_rows = []
+        remaining = max_candidates
+        group_scores = self._collaboration_scores(target, self.profile_first_rows)
+        for group in np.argsort(-group_scores, kind="stable"):
+            if remaining <= 0 or group_scores[group] <= 0:
+                break
+            rows = self.profile_rows[self.profile_offsets[group]:self.profile_offsets[group + 1]][:remaining]
+            profile_rows.append(rows)
+            remaining -= len(rows)
+
+        if not profile_rows:
+            return overlap_rows
+        return np.union1d(overlap_rows, np.concatenate(profile_rows))
+
+    def _tech_scores(self, target: UserFeatures) -> np.ndarray:
+        n = len(self)
+        if not target.techs or n == 0:
+            return np.zeros(n)
+        common = np.zeros(n)
+        level_sum = np.zeros(n)
+        for tech, level in target.techs.items():
+            posting = self.tech_postings.get(tech)
+            if posting is None:
+                continue
+            rows, levels = posting
+            common[rows] += 1
+            level_sum[rows] += np.maximum(0, 1 - (np.abs(levels - level) / 2))
+        union = len(target.techs) + self.tech_sizes - common
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = (common / union + level_sum / common) / 2
+        return np.where(common > 0, scores, 0.0)
+
+    def _interest_scores(self, target: UserFeatures) -> np.ndarray:
+        n = len(self)
+        if not target.interests or n == 0:
+            return np.zeros(n)
+        common = np.zeros(n)
+        for key in target.interests:
+            rows = self.interest_postings.get(key)
+            if rows is not None:
+                common[rows] += 1
+        union = len(target.interests) + self.interest_sizes - common
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = common / union
+        return np.where(common > 0, scores, 0.0)
+
+    def _collaboration_scores(self, target: UserFeatures, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        def take(values: np.ndarray) -> np.ndarray:
+            return values if rows is None else values[rows]
+
+        n = len(self) if rows is None else len(rows)
+        pref = target.preference
+        if not pref or n == 0:
+            return np.zeros(n)
+        total = np.zeros(n)
+        count = np.zeros(n)
+
+        def add_lookup(field, similarity):
+            value = pref.get(field)
+            if not value or not self.vocab[field]:
+                return
+            lookup = np.asarray([similarity(value, other) for other in self.vocab[field]])
+            codes = take(self.codes[field])
+            present = codes >= 0
+            total[present] += lookup[codes[present]]
+            count[present] += 1
+
+        # UserSimilarityCalculator와 동일한 순서로 누적 (부동소수점 합 순서 유지)
+        for field in STRING_FIELDS:
+            add_lookup(field, similarity_calculator._string_similarity)
+        add_lookup(TIMEZONE_FIELD, similarity_calculator._timezone_similarity)
+
+        start, end = pref.get("work_hours_start"), pref.get("work_hours_end")
+        if start is not None and end is not None:
+            work_start, work_end = take(self.work_start), take(self.work_end)
+            present = ~np.isnan(work_start)
+            other_start = work_start[present]
+            other_end = work_end[present]
+            overlap_start = np.maximum(start, other_start)
+            overlap_end = np.minimum(end, other_end)
+            overlap = overlap_end - overlap_start
+            other_total = other_end - other_start
+            ratio1 = overlap / (end - start) if end - start > 0 else np.zeros(len(overlap))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio2 = np.where(other_total > 0, overlap / other_total, 0.0)
+            total[present] += np.where(overlap_start >= overlap_end, 0.0, (ratio1 + ratio2) / 2)
+            count[present] += 1
+
+        add_lookup(LENGTH_FIELD, similarity_calculator._string_similarity)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = total / count
+        return np.where(take(self.has_preference) & (count > 0), scores, 0.0)
+
+
+def similarity_components(target: UserFeatures, others: Dict[int, UserFeatures]) -> Dict[int, Tuple[float, float, float]]:
+    """
+    대상 유저와 여러 유저의 구성요소별 유사도를 한 번에 계산합니다.
+
+    Returns:
+        Dict[int, Tuple[float, float, float]]: 유저 ID -> (협업, 기술 스택, 관심분야) 유사도
+    """
+    if not others:
+        return {}
+    segment = _Segment(others)
+    collaboration, tech, interests = segment.components(target)
+    return {
+        user_id: (float(collaboration[row]), float(tech[row]), float(interests[row]))
+        for user_id, row in segment.rows.items()
+    }
+
+
+class UserSimilarityIndex:
+    """
+    추천 후보 계산용 인메모리 유사도 인덱스
+
+    전체 유저를 한 번 압축(base 세그먼트)해 두고, 특성이 변경된 유저는 invalidate()로 표시합니다.
+    다음 조회 시 변경된 유저만 다시 읽어 작은 세그먼트로 추가하며,
+    세그먼트가 많아지거나 max_age가 지나면 전체를 다시 빌드합니다.
+
+    유저 수가 ann_min_users 이상이면 base 세그먼트에 후보 생성용 구조(역색인 + 협업 프로필 그룹)를
+    함께 만들고, 정확 점수 계산 전에 후보를 줄입니다 (단계별 최대 max_candidates명).
+    max_candidates를 키우면 recall이, 줄이면 속도가 올라갑니다.
+    """
+
+    MAX_SEGMENTS = 8
+
+    def __init__(self, max_age: Optional[float] = 600.0, max_candidates: Optional[int] = 5000,
+                 ann_min_users: int = 50000):
+        self.max_age = max_age
+        self.max_candidates = max_candidates
+        self.ann_min_users = ann_min_users
+        self._segments: List[_Segment] = []
+        self._locations: Dict[int, _Segment] = {}
+        self._pending: Set[int] = set()
+        self._built_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def build(self, features: Dict[int, UserFeatures]) -> None:
+        """특성 사전으로 인덱스를 새로 빌드합니다."""
+        candidates = self.max_candidates is not None and len(features) >= self.ann_min_users
+        segment = _Segment(features, candidates=candidates)
+        with self._lock:
+            self._segments = [segment]
+            self._locations = {user_id: segment for user_id in features}
+            self._pending.clear()
+            self._built_at = time.monotonic()
+
+    def rebuild(self, db: Session) -> None:
+        """데이터베이스에서 전체 유저 특성을 읽어 인덱스를 다시 빌드합니다."""
+        self.build(load_features(db))
+
+    def invalidate(self, user_id: int) -> None:
+        """유저의 tech_stacks / interests / 협업 선호도 변경(또는 생성, 삭제)을 표시합니다."""
+        with self._lock:
+            self._pending.add(user_id)
+
+    def clear(self) -> None:
+        """인덱스를 비웁니다. 다음 조회 시 전체를 다시 빌드합니다."""
+        with self._lock:
+            self._segments = []
+            self._locations = {}
+            self._pending.clear()
+            self._built_at = None
+
+    def upsert(self, features: Dict[int, UserFeatures], removed: Iterable[int] = ()) -> None:
+        """변경된 유저 특성을 새 세그먼트로 반영하고 이전 행을 무효화합니다."""
+        with self._lock:
+            for user_id in list(features) + list(removed):
+                segment = self._locations.pop(user_id, None)
+                if segment is not None:
+                    segment.alive[segment.rows[user_id]] = False
+            if features:
+                segment = _Segment(features)
+                self._segments.append(segment)
+                for user_id in features:
+                    self._locations[user_id] = segment
+
+    def sync(self, db: Session) -> None:
+        """빌드되지 않았거나 오래된 경우 재빌드하고, 변경 표시된 유저를 반영합니다."""
+        with self._lock:
+            expired = self.max_age is not None and self._built_at is not None and \
+                time.monotonic() - self._built_at > self.max_age
+            if not self.is_built or expired or len(self._segments) >= self.MAX_SEGMENTS:
+                self.rebuild(db)
+                return
+            if not self._pending:
+                return
+            pending = set(self._pending)
+            self._pending.clear()
+            features = load_features(db, pending)
+            self.upsert(features, removed=pending - set(features))
+
+    def top_k(self, target_id: int, target: UserFeatures, limit: int = 10,
+              exclude_ids: Iterable[int] = (), exact: bool = False,
+              max_candidates: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        대상 유저와 가장 유사한 유저를 반환합니다.
+
+        UserSimilarityCalculator.get_top_similar_users와 같은 규칙을 따릅니다:
+        자기 자신과 exclude_ids는 제외하고, 유사도가 0보다 큰 유저만 점수 내림차순
+        (동점이면 유저 ID 오름차순)으로 최대 limit명을 반환합니다.
+
+        Args:
+            exact: True면 후보 생성 없이 모든 유저를 점수화
+            max_candidates: 후보 생성 단계별 상한 (None이면 인덱스 기본값)
+
+        Returns:
+            List[Tuple[int, float]]: (유저 ID, 유사도) 튜플 리스트
+        """
+        if limit <= 0:
+            return []
+        excluded = np.fromiter(set(exclude_ids) | {target_id}, dtype=np.int64)
+        if not exact and max_candidates is None:
+            max_candidates = self.max_candidates
+
+        candidates: List[Tuple[int, float]] = []
+        with self._lock:
+            segments = list(self._segments)
+        for segment in segments:
+            if not len(segment):
+                continue
+            rows = None
+            if not exact and max_candidates is not None and segment.has_candidates:
+                rows = segment.candidate_rows(target, max_candidates)
+                if not len(rows):
+                    continue
+            collaboration, tech, interests = segment.components(target, rows)
+            if rows is None:
+                rows = np.arange(len(segment))
+            raw = (
+                collaboration * similarity_calculator.COLLABORATION_WEIGHT +
+                tech * similarity_calculator.TECH_STACK_WEIGHT +
+                interests * similarity_calculator.INTERESTS_WEIGHT
+            )
+            scores = np.round(raw, 4)
+            mask = segment.alive[rows] & (raw > 0) & ~np.isin(segment.user_ids[rows], excluded)
+            positions = np.flatnonzero(mask)
+            if len(positions) > limit:
+                # 부분 선택: limit번째 점수 이상인 행만 남김
+                # (경계 동점과 np.round/round 차이를 흡수하도록 반올림 단위만큼 여유를 둠)
+                threshold = np.partition(scores[positions], len(positions) - limit)[len(positions) - limit]
+                positions = positions[scores[positions] >= threshold - 1e-4]
+            candidates.extend(zip(segment.user_ids[rows[positions]].tolist(), raw[positions].tolist()))
+
+        # 후보만 파이썬 round로 확정해 계산기와 같은 점수/순서를 보장
+        results = [(user_id, round(score, 4)) for user_id, score in candidates]
+        results = [item for item in results if item[1] > 0]
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results[:limit]
+
+    def recommend(self, db: Session, user_id: int, limit: int = 10,
+                  exclude_following: bool = True) -> List[Tuple[int, float]]:
+        """인덱스를 동기화한 뒤 유저에게 추천할 (유저 ID, 유사도) 목록을 반환합니다."""
+        self.sync(db)
+        target = load_features(db, [user_id]).get(user_id, UserFeatures())
+        following_ids: Set[int] = set()
+        if exclude_following:
+            following_ids = {
+                followed_id for (followed_id,) in
+                db.query(user_follows.c.followed_id).filter(user_follows.c.follower_id == user_id)
+            }
+        return self.top_k(user_id, target, limit=limit, exclude_ids=following_ids)
+
+
+# 전역 인스턴스 생성
+similarity_index = UserSimilarityIndex()
@@ -1,91 +1,287 @@
-from typing import List, Dict
+"""
+SSE 허브
+프로젝트(/projects/{id}/sse)와 알림(/users/{id}/notifications/sse) 스트림이 함께 쓰는 구독 관리자입니다.
+
+- 토픽은 (namespace, key) 쌍입니다. 예: ("project", "PRJ001"), ("notification", "1")
+- 구독자마다 크기가 제한된 대기열을 두고, 가득 차면 정책에 따라 처리합니다.
+  * drop_oldest: 가장 오래된 이벤트를 버림 (변경 이벤트 스트림)
+  * coalesce: 대기 중인 이벤트를 최신 이벤트 하나로 합침 (전체 목록 스냅샷 스트림)
+- 발행은 구독자 대기열에 넣기만 하므로 느린 구독자가 발행자를 막지 않습니다.
+- 워커 간 전달은 브로드캐스트 백엔드(설정: BROADCAST_BACKEND)를 사용합니다.
+
+이벤트는 발행 시점에 한 번만 `id: ...\ndata: <JSON>\n\n` 프레임으로 직렬화되고,
+모든 구독자(다른 워커 포함)가 같은 바이트를 그대로 받습니다.
+토픽마다 최근 replay_size개 프레임을 링 버퍼에 보관해, Last-Event-ID로 재연결한 클라이언트에는
+그보다 ID가 큰 이벤트를 다시 보냅니다. (버퍼에 없는 ID면 스냅샷부터 다시 보냄)
+이벤트 ID는 발행한 워커의 시각이라 워커마다 버퍼에 도착한 순서가 다를 수 있으므로,
+버퍼 위치가 아니라 ID로 비교하고 Last-Event-ID 직전 replay_overlap초 안의 이벤트도 함께 다시 보냅니다.
+(클라이언트는 이벤트 ID로 중복을 걸러냄) 시계 차이가 그보다 커서 순서를 판단할 수 없으면 스냅샷부터 다시 보냅니다.
+"""
+
+from collections import deque
 from datetime import datetime
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple
 import asyncio
+import json
+import time
 
-class ProjectSSEManager:
-  def __init__(self):
-    self.connections: Dict[str, List[asyncio.Queue]] = {}
-      
-  def convert_to_dict(self, obj):
-    if isinstance(obj, datetime):
-      return obj.isoformat()
-    elif hasattr(obj, '__dict__'):
-      return {
-        key: self.convert_to_dict(value)
-        for key, value in obj.__dict__.items()
-        if not key.startswith('_')
-      }
-    elif isinstance(obj, (list, tuple)):
-      return [self.convert_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-      return {key: self.convert_to_dict(value) for key, value in obj.items()}
-    else:
-      return obj
+from src.core.utils.broadcast_backend import BroadcastBackend, DeliverFn, create_broadcast_backend
+
+DROP_OLDEST = "drop_oldest"
+COALESCE = "coalesce"
+
+
+def convert_to_dict(obj: Any) -> Any:
+  """ORM/Pydantic 객체를 JSON 직렬화 가능한 값으로 변환합니다."""
+  if isinstance(obj, datetime):
+    return obj.isoformat()
+  elif hasattr(obj, '__dict__'):
+    return {
+      key: convert_to_dict(value)
+      for key, value in obj.__dict__.items()
+      if not key.startswith('_')
+    }
+  elif isinstance(obj, (list, tuple)):
+    return [convert_to_dict(item) for item in obj]
+  elif isinstance(obj, dict):
+    return {key: convert_to_dict(value) for key, value in obj.items()}
+  else:
+    return obj
+
+
+def serialize(data: Any) -> str:
+  """이벤트 데이터를 JSON 문자열로 직렬화합니다. (문자열은 이미 직렬화된 JSON으로 간주)"""
+  if isinstance(data, str):
+    return data
+  if hasattr(data, "model_dump_json"):
+    return data.model_dump_json()
+  return json.dumps(convert_to_dict(data))
+
+
+def format_event(payload: str, event_id: Optional[int] = None) -> str:
+  """SSE 프레임 문자열을 만듭니다."""
+  if event_id is None:
+    return f"data: {payload}\n\n"
+  return f"id: {event_id}\ndata: {payload}\n\n"
+
+
+def _frame_id(frame: str) -> Optional[str]:
+  if not frame.startswith("id: "):
+    return None
+  return frame[4:frame.index("\n")]
+
+
+class SSESubscription:
+  """한 SSE 연결의 이벤트 대기열"""
+  __slots__ = ("topic", "policy", "maxsize", "dropped", "resumed", "last_event_id", "_events", "_ready")
+
+  def __init__(self, topic: Tuple[str, str], maxsize: int, policy: str):
+    self.topic = topic
+    self.policy = policy
+    self.maxsize = maxsize
+    self.dropped = 0
+    # Last-Event-ID 이후 이벤트를 버퍼에서 이어 받았는지 (False면 스냅샷 필요)
+    self.resumed = False
+    # 구독 시점의 토픽 마지막 이벤트 ID (스냅샷 프레임의 ID로 사용)
+    self.last_event_id: Optional[str] = None
+    self._events: deque = deque(maxlen=1 if policy == COALESCE else maxsize)
+    self._ready = asyncio.Event()
+
+  def __len__(self) -> int:
+    return len(self._events)
+
+  def push(self, frame: bytes) -> None:
+    """이벤트를 넣습니다. (대기열이 가득 차면 정책에 따라 오래된 이벤트를 버림)"""
+    if len(self._events) == self._events.maxlen:
+      self.dropped += 1
+    self._events.append(frame)
+    self._ready.set()
 
-  async def connect(self, project_id: str):
-    queue = asyncio.Queue()
-    self.connections.setdefault(project_id, []).append(queue)
-    return queue
+  async def get(self) -> bytes:
+    while not self._events:
+      self._ready.clear()
+      await self._ready.wait()
+    return self._events.popleft()
 
-  async def disconnect(self, project_id: str, queue: asyncio.Queue):
-    self.connections[project_id].remove(queue)
-    if not self.connections[project_id]:
-      del self.connections[project_id]
 
-  async def send_event(self, project_id: str, data: str):
-    for queue in self.connections.get(project_id, []):
-      await queue.put(data)
+class _TopicBuffer:
+  """토픽별 최근 이벤트 링 버퍼 (id, 프레임)"""
+  __slots__ = ("events", "evicted", "cleanup")
 
-  async def event_generator(self, project_id: str, queue: asyncio.Queue):
+  def __init__(self, size: int):
+    self.events: deque = deque(maxlen=size)
+    # 버퍼에서 밀려난 이벤트 중 가장 큰 ID
+    self.evicted = 0
+    self.cleanup: Optional[asyncio.TimerHandle] = None
+
+  def append(self, event_id: int, frame: bytes) -> None:
+    if len(self.events) == self.events.maxlen:
+      self.evicted = max(self.evicted, self.events[0][0])
+    self.events.append((event_id, frame))
+
+  def last_id(self) -> Optional[str]:
+    return str(max(event_id for event_id, _ in self.events)) if self.events else None
+
+  def since(self, event_id: str, overlap: int = 0) -> Optional[List[bytes]]:
+    """
+    event_id보다 ID가 큰 이벤트와, event_id 직전 overlap(마이크로초) 안의 이벤트를 도착 순서대로 반환합니다.
+    다음 경우에는 어디까지 받았는지 알 수 없으므로 None (스냅샷 필요)
+    - 버퍼에 event_id가 없거나, 그 구간의 이벤트가 이미 밀려남
+    - event_id 뒤에 도착한 이벤트 중 overlap보다 오래된 ID가 있음 (워커 간 시계 차이)
+    """
     try:
-      while True:
-        data = await queue.get()
-        yield f"data: {self.convert_to_dict(data)}\n\n"
-    except asyncio.CancelledError:
-      await self.disconnect(project_id, queue)
-            
-            
-class NotificationSSEManager:
-  def __init__(self):
-    self.connections: Dict[str, List[asyncio.Queue]] = {}
-        
-  def convert_to_dict(self, obj):
-    if isinstance(obj, datetime):
-      return obj.isoformat()
-    elif hasattr(obj, '__dict__'):
-      return {
-        key: self.convert_to_dict(value)
-        for key, value in obj.__dict__.items()
-        if not key.startswith('_')
-      }
-    elif isinstance(obj, (list, tuple)):
-      return [self.convert_to_dict(item) for item in obj]
-    elif isinstance(obj, dict):
-      return {key: self.convert_to_dict(value) for key, value in obj.items()}
+      last = int(event_id)
+    except ValueError:
+      return None
+    floor = last - overlap
+    if self.evicted > floor:
+      return None
+    position = next((index for index, (buffered_id, _) in enumerate(self.events) if buffered_id == last), None)
+    if position is None:
+      return None
+    if any(buffered_id <= floor for buffered_id, _ in islice(self.events, position + 1, None)):
+      return None
+    return [frame for buffered_id, frame in self.events if buffered_id > floor and buffered_id != last]
+
+
+class SSEHub:
+  """모든 SSE 스트림이 공유하는 구독/발행 허브"""
+
+  def __init__(self, max_queue: int = 100, replay_size: int = 256, retention: float = 60.0,
+               replay_overlap: float = 1.0,
+               backend_factory: Optional[Callable[[DeliverFn], BroadcastBackend]] = None):
+    """
+    Args:
+      max_queue: 구독자별 대기열 크기
+      replay_size: 토픽별 재전송용 링 버퍼 크기
+      replay_overlap: 재연결 시 Last-Event-ID 직전 몇 초 안의 이벤트까지 다시 보낼지 (워커 간 도착 순서 차이 허용)
+      retention: 마지막 구독자가 떠난 뒤 버퍼(와 워커 간 구독)를 유지하는 시간(초)
+      backend_factory: deliver 콜백을 받아 브로드캐스트 백엔드를 만드는 함수
+    """
+    self.max_queue = max_queue
+    self.replay_size = replay_size
+    self.retention = retention
+    self.replay_overlap = int(replay_overlap * 1_000_000)
+    self._topics: Dict[Tuple[str, str], Set[SSESubscription]] = {}
+    self._buffers: Dict[Tuple[str, str], _TopicBuffer] = {}
+    self._last_id = 0
+    if backend_factory is None:
+      self.backend = create_broadcast_backend(self._deliver, prefix="teamup:sse")
     else:
-      return obj
+      self.backend = backend_factory(self._deliver)
+
+  def subscriber_count(self, namespace: str, key: Any) -> int:
+    return len(self._topics.get((namespace, str(key)), ()))
+
+  async def subscribe(self, namespace: str, key: Any, policy: str = DROP_OLDEST, maxsize: Optional[int] = None,
+                      last_event_id: Optional[str] = None) -> SSESubscription:
+    """
+    토픽을 구독합니다. 이 워커의 첫 구독자면 다른 워커의 이벤트도 구독합니다.
+    last_event_id가 버퍼에 있으면 그보다 ID가 크거나 replay_overlap 안에 있는 이벤트를 대기열에 미리 넣고 resumed=True로 표시합니다.
+    """
+    topic = (namespace, str(key))
+    subscription = SSESubscription(topic, maxsize or self.max_queue, policy)
+    subscribers = self._topics.get(topic)
+    if subscribers is None:
+      subscribers = self._topics[topic] = set()
+      if topic not in self._buffers:
+        self._buffers[topic] = _TopicBuffer(self.replay_size)
+        await self.backend.subscribe(*topic)
+    subscribers.add(subscription)
 
-  async def connect(self, member_id: str):
-    queue = asyncio.Queue()
-    self.connections.setdefault(member_id, []).append(queue)
-    return queue
+    buffer = self._buffers[topic]
+    if buffer.cleanup is not None:
+      buffer.cleanup.cancel()
+      buffer.cleanup = None
+    subscription.last_event_id = buffer.last_id()
+    if last_event_id:
+      missed = buffer.since(last_event_id, self.replay_overlap)
+      if missed is not None:
+        subscription.resumed = True
+        for frame in missed:
+          subscription.push(frame)
+    return subscription
 
-  async def disconnect(self, member_id: str, queue: asyncio.Queue):
-    self.connections[member_id].remove(queue)
-    if not self.connections[member_id]:
-      del self.connections[member_id]
+  async def unsubscribe(self, subscription: SSESubscription) -> None:
+    """구독을 해제합니다. (이미 해제된 구독은 무시)"""
+    subscribers = self._topics.get(subscription.topic)
+    if subscribers is None or subscription not in subscribers:
+      return
+    subscribers.discard(subscription)
+    if not subscribers:
+      del self._topics[subscription.topic]
+      # 곧 재연결하는 클라이언트를 위해 retention 동안 버퍼와 구독을 유지
+      buffer = self._buffers.get(subscription.topic)
+      if buffer is not None:
+        buffer.cleanup = asyncio.get_running_loop().call_later(
+          self.retention, lambda: asyncio.ensure_future(self._expire(subscription.topic))
+        )
 
-  async def send_event(self, member_id: str, data: str):
-    for queue in self.connections.get(member_id, []):
-      await queue.put(data)
+  async def _expire(self, topic: Tuple[str, str]) -> None:
+    if topic in self._topics or topic not in self._buffers:
+      return
+    del self._buffers[topic]
+    await self.backend.unsubscribe(*topic)
 
-  async def event_generator(self, member_id: str, queue: asyncio.Queue):
+  def _next_id(self) -> int:
+    # 마이크로초 단위 시각 기반: 워커 간에도 사실상 고유하고, 한 워커 안에서는 항상 증가
+    self._last_id = max(time.time_ns() // 1000, self._last_id + 1)
+    return self._last_id
+
+  async def publish(self, namespace: str, key: Any, data: Any) -> int:
+    """
+    이벤트를 한 번 직렬화해 모든 워커의 구독자에게 발행합니다.
+
+    Args:
+      data: 직렬화된 JSON 문자열, Pydantic 모델 또는 convert_to_dict로 변환 가능한 객체
+
+    Returns:
+      int: 이벤트 ID
+    """
+    event_id = self._next_id()
+    await self.backend.publish(namespace, str(key), format_event(serialize(data), event_id))
+    return event_id
+
+  async def _deliver(self, namespace: str, key: str, frames: List[str]) -> None:
+    topic = (namespace, key)
+    buffer = self._buffers.get(topic)
+    if buffer is None:
+      return
+    subscribers = list(self._topics.get(topic, ()))
+    for frame in frames:
+      encoded = frame.encode()
+      event_id = _frame_id(frame)
+      if event_id is not None:
+        buffer.append(int(event_id), encoded)
+      for subscription in subscribers:
+        subscription.push(encoded)
+
+  def snapshot(self, subscription: SSESubscription, data: Any) -> bytes:
+    """
+    구독 시점 스냅샷 프레임을 만듭니다.
+    토픽의 마지막 이벤트 ID를 붙여, 재연결 시 스냅샷 이후 이벤트만 받을 수 있게 합니다.
+    """
+    return format_event(serialize(data), subscription.last_event_id).encode()
+
+  async def stream(self, subscription: SSESubscription, initial: Iterable[bytes] = ()) -> AsyncIterator[bytes]:
+    """
+    SSE 응답 본문을 생성합니다. 연결이 끊기면(제너레이터 종료) 구독을 해제합니다.
+
+    Args:
+      subscription: subscribe()로 받은 구독
+      initial: 구독 직후 먼저 보낼 프레임 (예: snapshot())
+    """
     try:
+      for frame in initial:
+        yield frame
       while True:
-        data = await queue.get()
-        yield f"data: {self.convert_to_dict(data)}\n\n"
-    except asyncio.CancelledError:
-      await self.disconnect(member_id, queue)
+        yield await subscription.get()
+    finally:
+      await self.unsubscribe(subscription)
+
+  async def close(self) -> None:
+    await self.backend.close()
+
 
-project_sse_manager = ProjectSSEManager()
-notification_sse_manager = NotificationSSEManager()
\ No newline at end of file
+sse_hub = SSEHub()
@@ -0,0 +1,95 @@
+"""
+사용자 간략 정보(UserBrief) 캐시
+채팅 브로드캐스트처럼 같은 사용자의 brief를 반복해서 읽는 경로에서 사용합니다.
+JSON으로 바로 직렬화할 수 있는 dict 형태로 보관합니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from sqlalchemy.orm import Session
+
+_MISSING = object()
+
+
+class TTLCache:
+    """크기 제한(LRU)과 만료 시간(TTL)이 있는 스레드 안전 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """캐시에 없으면 loader 결과를 저장하고 반환합니다."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+user_brief_cache = TTLCache(maxsize=4096, ttl=60.0)
+
+
+def _load_user_brief(user_id: int, db: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+    from src.api.v1.models.user.user import User
+    from src.api.v1.schemas.brief import UserBrief
+    from src.core.utils.user_projection import load_principal
+
+    own_session = db is None
+    if own_session:
+        from src.core.database.database import SessionLocal
+        db = SessionLocal()
+    try:
+        principal = load_principal(db, User.id == user_id)
+        if principal is None:
+            return None
+        return UserBrief.model_validate(principal, from_attributes=True).model_dump(mode="json")
+    finally:
+        if own_session:
+            db.close()
+
+
+def get_user_brief(user_id: int, db: Optional[Session] = None) -> Optional[Dict[str, Any]]:
+    """
+    사용자 brief를 JSON 직렬화 가능한 dict로 반환합니다. (없는 사용자는 None)
+
+    Args:
+        user_id: 사용자 ID
+        db: 캐시 미스 시 사용할 세션 (없으면 짧은 세션을 열고 닫음)
+    """
+    return user_brief_cache.get_or_load(int(user_id), lambda: _load_user_brief(int(user_id), db))
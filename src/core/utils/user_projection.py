@@ -0,0 +1,68 @@
+"""
+사용자 경량 조회(projection)
+인증 사용자나 UserBrief처럼 기본 컬럼만 필요한 경로에서 User 엔티티 전체(알림 설정, OAuth 토큰,
+관계 등) 대신 필요한 컬럼만 SELECT해서 __slots__ 객체로 받습니다.
+
+- UserPrincipal은 UserBrief.model_validate(..., from_attributes=True)에 그대로 넘길 수 있습니다.
+- 세션에 속하지 않으므로 관계 로딩이나 변경 추적이 없습니다. 수정이 필요하면 User를 조회하세요.
+- 다른 테이블과 조인할 때는 select(*PRINCIPAL_COLUMNS, 추가 컬럼)으로 조회하고
+  UserPrincipal.from_row(row)로 앞쪽 컬럼만 읽습니다.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from src.api.v1.models.user.user import User
+
+PRINCIPAL_COLUMNS = (
+    User.id,
+    User.name,
+    User.email,
+    User.profile_image,
+    User.job,
+    User.status,
+    User.created_at,
+    User.updated_at,
+)
+
+
+class UserPrincipal:
+    """사용자 기본 컬럼만 담은 가벼운 객체"""
+
+    __slots__ = ("id", "name", "email", "profile_image", "job", "status", "created_at", "updated_at")
+
+    def __init__(self, id: int, name: str, email: str, profile_image: Optional[str] = None,
+                 job: Optional[str] = None, status: Optional[str] = None,
+                 created_at: Any = None, updated_at: Any = None):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.profile_image = profile_image
+        self.job = job
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "UserPrincipal":
+        return cls(*row[:len(cls.__slots__)])
+
+    def __repr__(self) -> str:
+        return f"UserPrincipal(id={self.id!r}, email={self.email!r})"
+
+
+def select_principals(*criteria: Any) -> Select:
+    """사용자 기본 컬럼만 조회하는 SELECT 문"""
+    return select(*PRINCIPAL_COLUMNS).where(*criteria)
+
+
+def load_principals(db: Session, *criteria: Any) -> List[UserPrincipal]:
+    return [UserPrincipal.from_row(row) for row in db.execute(select_principals(*criteria))]
+
+
+def load_principal(db: Session, *criteria: Any) -> Optional[UserPrincipal]:
+    row = db.execute(select_principals(*criteria).limit(1)).first()
+    return UserPrincipal.from_row(row) if row is not None else None
@@ -0,0 +1,143 @@
+"""
+조회수 쓰기 버퍼 (write-behind)
+조회 요청마다 DB에 쓰지 않고 대상별 증가분을 메모리에 모았다가, flush_interval초마다
+종류별로 한 번에 반영합니다. 인기 게시글도 조회 수와 관계없이 주기마다 쓰기 몇 번으로 끝납니다.
+
+- 저장소는 register()로 종류("post", "whiteboard")별 반영 함수를 등록하고, 조회 시 add()만 호출합니다.
+  반영 함수는 (session, {대상 ID: 증가분})을 받아 원자적 UPDATE(col = col + delta)로 반영합니다.
+- 응답의 조회수는 DB 값에 pending()(아직 반영되지 않은 증가분)을 더해 보여줍니다.
+- 대상이 max_keys개를 넘으면 그 자리에서 반영합니다. 반영에 실패한 증가분은 다음 주기에 다시 시도합니다.
+- 워커 프로세스마다 따로 모으며, 종료 시(close) 남은 증가분을 반영합니다.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from src.core.config import setting
+
+logger = logging.getLogger("view_counter")
+
+Flusher = Callable[[Session, Dict[int, int]], None]
+
+
+class ViewCounterBuffer:
+    """대상별 조회수 증가분을 모아 주기적으로 반영하는 버퍼"""
+
+    def __init__(self, flush_interval: float = 5.0, max_keys: int = 10000,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self._session_factory = session_factory
+        self._flushers: Dict[str, Flusher] = {}
+        self._pending: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._inflight: Dict[str, Dict[int, int]] = {}
+        self._keys = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, kind: str, flusher: Flusher) -> None:
+        self._flushers[kind] = flusher
+
+    def add(self, kind: str, object_id: int, delta: int = 1) -> None:
+        with self._lock:
+            counts = self._pending[kind]
+            if object_id not in counts:
+                self._keys += 1
+            counts[object_id] += delta
+            overflow = self._keys >= self.max_keys
+        if overflow:
+            self.flush()
+
+    def pending(self, kind: str, object_id: int) -> int:
+        """아직 반영되지 않은 증가분 (반영 중인 증가분 포함)"""
+        with self._lock:
+            total = 0
+            for source in (self._pending, self._inflight):
+                counts = source.get(kind)
+                if counts:
+                    total += counts.get(object_id, 0)
+            return total
+
+    def clear(self) -> None:
+        """반영하지 않고 모인 증가분을 버립니다."""
+        with self._lock:
+            self._pending = defaultdict(lambda: defaultdict(int))
+            self._keys = 0
+
+    def flush(self) -> int:
+        """모인 증가분을 종류별로 반영하고, 반영한 대상 수를 반환합니다."""
+        with self._flush_lock:
+            with self._lock:
+                batches, self._pending = self._pending, defaultdict(lambda: defaultdict(int))
+                self._inflight = batches
+                self._keys = 0
+            flushed = 0
+            try:
+                for kind, deltas in batches.items():
+                    if not deltas:
+                        continue
+                    try:
+                        self._apply(kind, dict(deltas))
+                        flushed += len(deltas)
+                        failed = {}
+                    except Exception as e:
+                        logger.error(f"조회수 반영 실패: {kind} ({len(deltas)}개), 오류={e}")
+                        failed = deltas
+                    with self._lock:
+                        batches[kind] = {}
+                        for object_id, delta in failed.items():
+                            if object_id not in self._pending[kind]:
+                                self._keys += 1
+                            self._pending[kind][object_id] += delta
+            finally:
+                with self._lock:
+                    self._inflight = {}
+            return flushed
+
+    def _apply(self, kind: str, deltas: Dict[int, int]) -> None:
+        if self._session_factory is None:
+            from src.core.database.database import SessionLocal
+            self._session_factory = SessionLocal
+        db = self._session_factory()
+        try:
+            self._flushers[kind](db, deltas)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def start(self) -> None:
+        """flush_interval초마다 반영하는 태스크를 시작합니다. (앱 시작 시)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """주기 태스크를 멈추고 남은 증가분을 반영합니다."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await asyncio.to_thread(self.flush)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error(f"조회수 반영 태스크 오류: {e}")
+
+
+# 전역 인스턴스 생성
+view_counter = ViewCounterBuffer(flush_interval=setting.VIEW_FLUSH_INTERVAL, max_keys=setting.VIEW_BUFFER_MAX_KEYS)
@@ -8,7 +8,9 @@ import os
 from typing import Generator
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool
 from unittest.mock import Mock
 
 # 테스트용 데이터베이스 설정
@@ -23,6 +25,10 @@ test_engine = create_engine(
 # 테스트용 세션 팩토리
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
+# 테스트용 비동기 엔진 (TestClient가 요청마다 다른 이벤트 루프를 쓸 수 있어 연결을 재사용하지 않음)
+test_async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestAsyncSessionLocal = async_sessionmaker(test_async_engine, autoflush=False, expire_on_commit=False)
+
 
 @pytest.fixture(scope="session")
 def test_db():
@@ -54,7 +60,7 @@ def db_session(test_db) -> Generator[Session, None, None]:
 def client(db_session) -> TestClient:
     """FastAPI 테스트 클라이언트 fixture"""
     from main import app
-    from src.core.database.database import get_db
+    from src.core.database.database import get_db, get_async_db, get_stream_db, get_async_stream_db
 
     # 테스트용 설정 오버라이드
     test_app = app
@@ -66,7 +72,14 @@ def client(db_session) -> TestClient:
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestAsyncSessionLocal() as session:
+            yield session
+
     test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_async_db] = override_get_async_db
+    test_app.dependency_overrides[get_stream_db] = override_get_db
+    test_app.dependency_overrides[get_async_stream_db] = override_get_async_db
 
     return TestClient(test_app)
 
@@ -215,7 +228,12 @@ def cleanup():
     """테스트 후 정리"""
     yield
     # 각 테스트 후 실행할 정리 작업들
-    pass
+    from src.core.security.auth_cache import auth_cache
+    from src.core.utils.fragment_cache import fragment_cache
+    from src.core.utils.view_counter import view_counter
+    auth_cache.clear()
+    fragment_cache.clear()
+    view_counter.clear()
 
 
 # 비동기 테스트 지원을 위한 이벤트 루프 fixture
@@ -5,6 +5,10 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 import json
+from sqlalchemy import event
+
+import src.api.v1.models  # noqa: F401
+from src.api.v1.repositories.community.post_stat_repository import PostStatRepository
 
 
 class TestCommunityAPI:
@@ -206,3 +210,698 @@ class TestCommunityInteractions:
         # 실제 API에는 신고나 기타 상호작용 엔드포인트가 구현되어 있지 않음
         # 추후 구현 시 해당 테스트들을 활성화하면 됩니다.
         pass
+
+
+@pytest.fixture
+def seeded_session(db_session, test_db):
+    """테이블 생성 후 세션 반환"""
+    import src.api.v1.models  # noqa: F401
+    from src.core.database.database import Base
+
+    Base.metadata.create_all(bind=test_db)
+    return db_session
+
+
+def _seed_users(session, count: int, seed: int = 7):
+    """기술 스택, 관심분야, 협업 선호도가 무작위로 채워진 유저 생성"""
+    import random
+    from src.api.v1.models.user.user import User
+    from src.api.v1.models.user.tech_stack import UserTechStack
+    from src.api.v1.models.user.interest import UserInterest
+    from src.api.v1.models.user.collaboration_preference import CollaborationPreference
+
+    rng = random.Random(seed)
+    techs = ["Python", "React", "Go", "Java", "Docker", "Kotlin"]
+    interests = [("개발", "웹"), ("개발", "AI"), ("디자인", "UX"), ("기획", "PM"), ("개발", "게임")]
+    styles = ["적극적", "소극적", " 적극적 ", "Active", None]
+    project_types = ["웹", "모바일", "웹 서비스", None]
+    roles = ["프론트엔드", "백엔드", "프론트엔드 개발자", None]
+    time_zones = ["Asia/Seoul", "Asia/Tokyo", "UTC", "Europe/London", "Mars/Base", None]
+    hours = [(9, 18), (10, 19), (13, 22), (20, 2), (9, 9), (None, None)]
+    lengths = ["짧음", "중간", "김", None]
+
+    users = []
+    for i in range(count):
+        user = User(name=f"sim-user-{i}", email=f"sim-user-{i}@example.com", job="developer")
+        session.add(user)
+        session.flush()
+        for tech in rng.sample(techs, rng.randint(0, 3)):
+            session.add(UserTechStack(user_id=user.id, tech=tech, level=rng.randint(0, 2)))
+        for category, name in rng.sample(interests, rng.randint(0, 3)):
+            session.add(UserInterest(user_id=user.id, interest_category=category, interest_name=name))
+        if rng.random() < 0.8:
+            start, end = rng.choice(hours)
+            session.add(CollaborationPreference(
+                user_id=user.id,
+                collaboration_style=rng.choice(styles),
+                preferred_project_type=rng.choice(project_types),
+                preferred_role=rng.choice(roles),
+                available_time_zone=rng.choice(time_zones),
+                work_hours_start=start,
+                work_hours_end=end,
+                preferred_project_length=rng.choice(lengths),
+            ))
+        users.append(user)
+    session.flush()
+    return users
+
+
+def _count_queries(session, fn):
+    """fn 실행 중 발생한 SQL 쿼리 수 반환"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+    return result, len(statements)
+
+
+class TestSimilarityIndex:
+    """벡터 유사도 인덱스 테스트"""
+
+    def test_rankings_match_calculator(self, seeded_session):
+        """인덱스 순위와 점수가 기존 계산기 결과와 같은지 테스트"""
+        from src.api.v1.models.user.user import User
+        from src.core.utils.similarity_calculator import similarity_calculator
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        _seed_users(seeded_session, 60)
+        all_users = seeded_session.query(User).order_by(User.id).all()
+        index = UserSimilarityIndex()
+
+        for target in all_users[:15]:
+            expected = similarity_calculator.get_top_similar_users(
+                target_user=target,
+                all_users=all_users,
+                exclude_following=True,
+                limit=10
+            )
+            actual = index.recommend(seeded_session, target.id, limit=10)
+            assert actual == [(user.id, score) for user, score in expected]
+
+    def test_invalidate_reflects_tech_stack_change(self, seeded_session, monkeypatch):
+        """기술 스택 변경 후 변경된 유저만 다시 반영되는지 테스트"""
+        from src.api.v1.models.user.user import User
+        from src.api.v1.repositories.user import tech_stack_repository
+        from src.api.v1.schemas.user.tech_stack_schema import TechStackCreate
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        viewer = User(name="viewer", email="sim-viewer@example.com")
+        other = User(name="other", email="sim-other@example.com")
+        seeded_session.add_all([viewer, other])
+        seeded_session.flush()
+
+        index = UserSimilarityIndex()
+        monkeypatch.setattr(tech_stack_repository, "similarity_index", index)
+        repository = tech_stack_repository.TechStackRepository(seeded_session)
+
+        repository.create_tech_stack(viewer.id, TechStackCreate(tech="Rust", level=1))
+        assert index.recommend(seeded_session, viewer.id) == []
+
+        repository.create_tech_stack(other.id, TechStackCreate(tech="Rust", level=1))
+        assert index.recommend(seeded_session, viewer.id) == [(other.id, 0.35)]
+        # 전체 재빌드 없이 변경된 유저만 새 세그먼트로 추가
+        assert len(index._segments) == 2
+
+    def test_partial_top_k_keeps_id_order_on_ties(self):
+        """경계 동점이 있어도 유저 ID 순서로 상위 k개를 고르는지 테스트"""
+        from src.core.utils.similarity_index import UserFeatures, UserSimilarityIndex
+
+        index = UserSimilarityIndex()
+        features = {user_id: UserFeatures(techs={"Python": 1}) for user_id in range(1, 21)}
+        features[21] = UserFeatures(techs={"Python": 1, "Go": 0})
+        features[22] = UserFeatures(techs={"Python": 0})
+        index.build(features)
+
+        result = index.top_k(1, features[1], limit=5, exclude_ids=[2])
+        assert [user_id for user_id, _ in result] == [3, 4, 5, 6, 7]
+        assert all(score == 0.35 for _, score in result)
+
+    def test_follow_recommendations_use_index(self, seeded_session):
+        """추천 API 저장소가 인덱스 결과로 응답을 구성하고 팔로우 유저를 제외하는지 테스트"""
+        from src.api.v1.models.association_tables import user_follows
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        users = _seed_users(seeded_session, 30)
+        target = users[0]
+        repository = RecommendationRepository(seeded_session, index=UserSimilarityIndex())
+        before = repository.get_follow_recommendations(target.id, limit=5, min_similarity=0.0)
+        assert before
+        assert all(item["role"] == "developer" for item in before)
+
+        followed_id = before[0]["user_id"]
+        seeded_session.execute(user_follows.insert().values(follower_id=target.id, followed_id=followed_id))
+        after = repository.get_follow_recommendations(target.id, limit=5, min_similarity=0.0)
+        assert followed_id not in [item["user_id"] for item in after]
+
+
+class TestRecommendationCache:
+    """유저별 추천 캐시 테스트"""
+
+    def test_cached_read_reuses_entry(self, seeded_session):
+        """두 번째 조회는 다시 계산하지 않고 같은 계산 시각을 반환하는지 테스트"""
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+        from src.core.utils.recommendation_cache import RecommendationCache
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        users = _seed_users(seeded_session, 20)
+        repository = RecommendationRepository(seeded_session, index=UserSimilarityIndex(), cache=RecommendationCache())
+
+        first, computed_at = repository.get_cached_follow_recommendations(users[0].id, limit=5, min_similarity=0.0)
+        (second, second_computed_at), queries = _count_queries(
+            seeded_session,
+            lambda: repository.get_cached_follow_recommendations(users[0].id, limit=5, min_similarity=0.0)
+        )
+
+        assert first == second
+        assert computed_at == second_computed_at
+        assert queries == 0
+        assert first == repository.get_follow_recommendations(users[0].id, limit=5, min_similarity=0.0)
+
+    def test_follow_invalidates_entry(self, seeded_session, monkeypatch):
+        """팔로우 생성 시 팔로워의 추천 항목이 제거되는지 테스트"""
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+        from src.api.v1.repositories.user import follow_repository
+        from src.api.v1.schemas.user.follow_schema import FollowCreate
+        from src.core.utils.recommendation_cache import RecommendationCache
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        users = _seed_users(seeded_session, 20)
+        cache = RecommendationCache()
+        monkeypatch.setattr(follow_repository, "recommendation_cache", cache)
+        repository = RecommendationRepository(seeded_session, index=UserSimilarityIndex(), cache=cache)
+
+        before, _ = repository.get_cached_follow_recommendations(users[0].id, limit=5, min_similarity=0.0)
+        followed_id = before[0]["user_id"]
+        follow_repository.FollowRepository(seeded_session).create(
+            FollowCreate(follower_id=users[0].id, followed_id=followed_id)
+        )
+        assert len(cache) == 0
+
+        after, _ = repository.get_cached_follow_recommendations(users[0].id, limit=5, min_similarity=0.0)
+        assert followed_id not in [item["user_id"] for item in after]
+
+    def test_invalidate_drops_entries_recommending_user(self):
+        """프로필이 바뀐 유저를 추천 목록에 담은 다른 유저의 항목도 제거되는지 테스트"""
+        from src.core.utils.recommendation_cache import RecommendationCache
+
+        recommended = {1: [2, 3], 4: [3], 5: [6]}
+        compute = lambda db, user_id: [{"user_id": target, "similarity_score": 0.5} for target in recommended[user_id]]
+        cache = RecommendationCache(session_factory=Mock)
+        for user_id in recommended:
+            cache.get(Mock(), user_id, compute)
+
+        cache.invalidate(3)
+        assert len(cache) == 1
+        cache.invalidate(6)
+        assert len(cache) == 0
+        assert cache._viewers == {}
+
+    def test_profile_edit_drops_other_viewers_entries(self, seeded_session, monkeypatch):
+        """추천된 유저의 이름이 바뀌면 그 유저를 담은 다른 유저의 항목이 제거되는지 테스트"""
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+        from src.api.v1.repositories.user import user_repository
+        from src.api.v1.schemas.user.user_schema import UserUpdate
+        from src.core.utils.recommendation_cache import RecommendationCache
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        users = _seed_users(seeded_session, 20)
+        viewer_id = users[0].id
+        cache = RecommendationCache()
+        monkeypatch.setattr(user_repository, "recommendation_cache", cache)
+        repository = RecommendationRepository(seeded_session, index=UserSimilarityIndex(), cache=cache)
+
+        before, _ = repository.get_cached_follow_recommendations(viewer_id, limit=5, min_similarity=0.0)
+        target_id = before[0]["user_id"]
+        user_repository.UserRepository(seeded_session).update(target_id, UserUpdate(name="바뀐 이름"))
+        assert len(cache) == 0
+
+        after, _ = repository.get_cached_follow_recommendations(viewer_id, limit=20, min_similarity=0.0)
+        assert {item["user_id"]: item["name"] for item in after}[target_id] == "바뀐 이름"
+
+    def test_stale_entry_refreshed_in_background(self):
+        """만료된 항목은 즉시 반환하고 백그라운드에서 갱신하는지 테스트"""
+        from src.core.utils.recommendation_cache import RecommendationCache
+
+        calls = []
+
+        def compute(db, user_id):
+            calls.append(db)
+            return [{"user_id": len(calls), "similarity_score": 0.5}]
+
+        cache = RecommendationCache(ttl=0, session_factory=Mock)
+        request_session = Mock()
+        first, first_at = cache.get(request_session, 1, compute)
+        stale, stale_at = cache.get(request_session, 1, compute)
+        cache.wait(timeout=5)
+        fresh, fresh_at = cache.get(request_session, 1, compute)
+        cache.wait(timeout=5)
+
+        assert stale == first and stale_at == first_at
+        assert fresh[0]["user_id"] == 2 and fresh_at > first_at
+        assert calls[0] is request_session and calls[1] is not request_session
+        calls[1].close.assert_called_once()
+
+    def test_invalidate_discards_in_flight_refresh(self):
+        """갱신 중 invalidate되면 백그라운드 결과를 저장하지 않는지 테스트"""
+        import threading
+        from src.core.utils.recommendation_cache import RecommendationCache
+
+        started, release = threading.Event(), threading.Event()
+
+        def compute(db, user_id):
+            started.set()
+            release.wait(5)
+            return [{"user_id": 9, "similarity_score": 0.9}]
+
+        cache = RecommendationCache(session_factory=Mock)
+        cache.refresh_async(1, compute)
+        assert started.wait(5)
+        cache.invalidate(1)
+        release.set()
+        cache.wait(timeout=5)
+        assert len(cache) == 0
+
+
+class TestSimilarityBreakdownBatch:
+    """일괄 유사도 분석 테스트"""
+
+    def test_batch_matches_calculator(self, seeded_session):
+        """일괄 분석 결과가 기존 계산기의 구성요소/전체 점수와 같은지 테스트"""
+        from src.api.v1.models.user.user import User
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+        from src.core.utils.similarity_calculator import similarity_calculator
+
+        users = _seed_users(seeded_session, 25)
+        viewer, targets = users[0], users[1:]
+        repository = RecommendationRepository(seeded_session)
+
+        breakdowns = repository.get_similarity_breakdowns(viewer.id, [user.id for user in targets])
+        assert [item["target_user_id"] for item in breakdowns] == [user.id for user in targets]
+
+        for item in breakdowns:
+            target = seeded_session.get(User, item["target_user_id"])
+            assert item["total_similarity"] == similarity_calculator.calculate_similarity(viewer, target)
+            breakdown = item["breakdown"]
+            assert breakdown["collaboration_preference"]["similarity"] == pytest.approx(
+                similarity_calculator._calculate_collaboration_similarity(viewer, target))
+            assert breakdown["tech_stacks"]["similarity"] == pytest.approx(
+                similarity_calculator._calculate_tech_stack_similarity(viewer, target))
+            assert breakdown["interests"]["similarity"] == pytest.approx(
+                similarity_calculator._calculate_interests_similarity(viewer, target))
+            common_techs = {tech["tech"] for tech in item["common_elements"]["tech_stacks"]}
+            assert common_techs == {s.tech for s in viewer.tech_stacks} & {s.tech for s in target.tech_stacks}
+
+    def test_batch_query_count_is_constant(self, seeded_session):
+        """대상 수와 관계없이 쿼리 수가 일정한지 테스트"""
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+
+        users = _seed_users(seeded_session, 30)
+        repository = RecommendationRepository(seeded_session)
+
+        _, few = _count_queries(seeded_session, lambda: repository.get_similarity_breakdowns(users[0].id, [users[1].id]))
+        _, many = _count_queries(
+            seeded_session,
+            lambda: repository.get_similarity_breakdowns(users[0].id, [user.id for user in users[1:]])
+        )
+        assert few == many
+
+    def test_batch_skips_missing_targets(self, seeded_session):
+        """존재하지 않는 대상은 제외하고, 기준 유저가 없으면 404인지 테스트"""
+        from fastapi import HTTPException
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+
+        users = _seed_users(seeded_session, 3)
+        repository = RecommendationRepository(seeded_session)
+
+        result = repository.get_similarity_breakdowns(users[0].id, [users[1].id, 999999, users[1].id])
+        assert [item["target_user_id"] for item in result] == [users[1].id]
+
+        with pytest.raises(HTTPException) as exc:
+            repository.get_similarity_breakdown(999999, users[1].id)
+        assert exc.value.status_code == 404
+
+    def test_batch_endpoint_requires_auth(self, client: TestClient):
+        """일괄 유사도 분석 엔드포인트 인증 테스트"""
+        response = client.post(
+            "/api/v1/community/recommendation/similarity-analysis/batch",
+            json={"target_user_ids": [1, 2, 3]}
+        )
+        assert response.status_code == 401
+
+
+class TestSimilarityCandidateGeneration:
+    """추천 후보 생성(역색인 + 협업 프로필 그룹) 테스트"""
+
+    @staticmethod
+    def _features(count: int, seed: int = 11):
+        import random
+        from src.core.utils.similarity_index import UserFeatures
+
+        rng = random.Random(seed)
+        techs = [f"tech-{i}" for i in range(30)]
+        interests = [("개발", f"interest-{i}") for i in range(20)]
+        features = {}
+        for user_id in range(1, count + 1):
+            preference = None
+            if rng.random() < 0.8:
+                start = rng.choice([9, 10, 13, None])
+                preference = {
+                    "collaboration_style": rng.choice(["적극적", "소극적", None]),
+                    "preferred_project_type": rng.choice(["웹", "웹 서비스", "모바일", None]),
+                    "preferred_role": rng.choice(["프론트엔드", "백엔드", None]),
+                    "available_time_zone": rng.choice(["Asia/Seoul", "Asia/Tokyo", "UTC", None]),
+                    "work_hours_start": start,
+                    "work_hours_end": None if start is None else start + 8,
+                    "preferred_project_length": rng.choice(["짧음", "김", None]),
+                }
+            features[user_id] = UserFeatures(
+                techs={tech: rng.randint(0, 2) for tech in rng.sample(techs, rng.randint(0, 4))},
+                interests=rng.sample(interests, rng.randint(0, 3)),
+                preference=preference,
+            )
+        return features
+
+    def test_large_budget_matches_exact(self):
+        """후보 상한이 충분하면 정확 순위와 같은지 테스트"""
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        features = self._features(500)
+        index = UserSimilarityIndex(ann_min_users=0, max_candidates=500)
+        index.build(features)
+        assert index._segments[0].has_candidates
+
+        for target_id in range(1, 30):
+            exact = index.top_k(target_id, features[target_id], limit=10, exact=True)
+            assert index.top_k(target_id, features[target_id], limit=10) == exact
+
+    def test_small_budget_limits_scored_rows(self):
+        """후보 상한이 작으면 점수화하는 행 수가 줄어드는지 테스트"""
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        features = self._features(500)
+        index = UserSimilarityIndex(ann_min_users=0)
+        index.build(features)
+        segment = index._segments[0]
+
+        rows = segment.candidate_rows(features[1], max_candidates=20)
+        assert len(rows) <= 40
+        assert len(index.top_k(1, features[1], limit=10, max_candidates=20)) <= 10
+
+    def test_small_index_skips_candidate_generation(self):
+        """유저 수가 ann_min_users 미만이면 후보 생성 구조를 만들지 않는지 테스트"""
+        from src.core.utils.similarity_index import UserSimilarityIndex
+
+        index = UserSimilarityIndex()
+        index.build(self._features(50))
+        assert not index._segments[0].has_candidates
+
+
+class TestPostFeedReactions:
+    """게시글 목록 반응 일괄 조회 테스트"""
+
+    @pytest.fixture
+    def posts(self, db_session):
+        from src.api.v1.models.community.post import Post, PostComment, PostReaction
+        from src.api.v1.models.user.user import User
+
+        users = [User(name=f"독자{i}", email=f"feed-reader{i}@example.com") for i in range(30)]
+        db_session.add_all(users)
+        db_session.flush()
+        posts = [Post(content=f"게시글 {i}", user_id=users[0].id) for i in range(3)]
+        db_session.add_all(posts)
+        db_session.flush()
+        for user in users:
+            db_session.add(PostReaction(reaction_type="view", user_id=user.id, post_id=posts[0].id))
+        for user in users[:3]:
+            db_session.add(PostReaction(reaction_type="like", user_id=user.id, post_id=posts[0].id))
+        db_session.add(PostReaction(reaction_type="share", user_id=users[1].id, post_id=posts[1].id))
+        for i in range(25):
+            db_session.add(PostComment(content=f"댓글 {i}", user_id=users[i].id, post_id=posts[0].id))
+        db_session.flush()
+        PostStatRepository(db_session).reconcile()
+        db_session.commit()
+        return posts, users
+
+    @staticmethod
+    def _count_statements(db_session, func):
+        statements = []
+        engine = db_session.get_bind().engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            return func(), statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    def test_feed_uses_fixed_number_of_queries(self, db_session, posts):
+        """게시글 수와 관계없이 반응을 세 번의 쿼리로 조회하는지 테스트"""
+        from src.api.v1.repositories.community.post_repository import PostRepository
+
+        repository = PostRepository(db_session)
+        post_ids = [post.id for post in posts[0]]
+        reactions, statements = self._count_statements(db_session, lambda: repository._load_reactions(post_ids))
+        assert len(statements) == 3
+
+        first, second, third = (reactions[post_id] for post_id in post_ids)
+        assert first["view"]["count"] == 30
+        assert len(first["view"]["users"]) == PostRepository.REACTION_USER_SAMPLE
+        assert [u.name for u in first["like"]["users"]] == ["독자0", "독자1", "독자2"]
+        assert first["comment"]["count"] == 25
+        assert len(first["comment"]["comments"]) == PostRepository.COMMENT_SAMPLE
+        assert first["comment"]["comments"][0]["content"] == "댓글 0"
+        assert second["share"]["count"] == 1
+        assert third["view"] == {"count": 0, "users": []}
+
+    def test_post_detail_shapes(self, db_session, posts):
+        """목록은 일부, 상세는 댓글 전체를 포함하는지 테스트"""
+        from src.api.v1.repositories.community.post_repository import PostRepository
+
+        repository = PostRepository(db_session)
+        feed = {post.id: post for post in repository.get_all()}
+        first = feed[posts[0][0].id]
+        assert first.reaction.views.count == 30
+        assert first.reaction.comments_count == 25
+        assert len(first.reaction.comments) == PostRepository.COMMENT_SAMPLE
+
+        detail = repository.get_by_id(posts[0][0].id)
+        assert len(detail.reaction.comments) == 25
+        assert detail.reaction.comments[0].user.name == "독자0"
+
+    def test_reaction_writes_update_counters(self, db_session, posts):
+        """좋아요/댓글 쓰기가 카운터를 갱신하고, 조회는 반응 행 없이 버퍼에 쌓이는지 테스트"""
+        from src.api.v1.models.community.post import PostReaction
+        from src.api.v1.repositories.community.post_repository import PostRepository
+        from src.api.v1.schemas.community.post_schema import CommentCreate
+
+        users = posts[1]
+        post_id = posts[0][2].id
+        repository = PostRepository(db_session)
+
+        repository.like(post_id, users[5].id)
+        repository.create_comment(post_id, users[5].id, CommentCreate(content="새 댓글"))
+        detail = repository.delete_like(post_id, users[5].id)
+        assert detail.reaction.likes.count == 0
+        assert detail.reaction.comments_count == 1
+
+        rows_before = db_session.query(PostReaction).filter(PostReaction.post_id == post_id).count()
+        for user in users[:3]:
+            detail = repository.view(post_id, user.id)
+        assert detail.reaction.views.count == 3
+        assert db_session.query(PostReaction).filter(PostReaction.post_id == post_id).count() == rows_before
+
+
+    def test_write_ack_responses(self, db_session, posts):
+        """fields=ack 쓰기 응답이 카운터와 요청자 상태만 담고 반응 사용자를 조회하지 않는지 테스트"""
+        from src.api.v1.repositories.community.post_repository import PostRepository
+        from src.api.v1.schemas.community.post_schema import CommentCreate, PostReactionAck
+        from fastapi import HTTPException
+
+        users = posts[1]
+        post_id = posts[0][0].id
+        user_id = users[29].id
+        repository = PostRepository(db_session)
+
+        ack, statements = self._count_statements(db_session, lambda: repository.like(post_id, user_id, fields="ack"))
+        assert isinstance(ack, PostReactionAck)
+        assert (ack.likes, ack.views, ack.comments_count) == (4, 30, 25)
+        assert ack.my_reaction == "like"
+        assert ack.bookmarked is False
+        assert len(statements) <= 6
+        assert not any("FROM users" in statement for statement in statements)
+
+        ack = repository.bookmark(post_id, user_id, fields="ack")
+        assert ack.bookmarked is True
+        ack = repository.bookmark(post_id, user_id, fields="ack")
+        assert ack.bookmarked is True
+
+        ack = repository.create_comment(post_id, user_id, CommentCreate(content="짧은 응답"), fields="ack")
+        assert ack.comments_count == 26
+        assert ack.comment.content == "짧은 응답"
+
+        ack = repository.delete_like(post_id, user_id, fields="ack")
+        assert (ack.likes, ack.my_reaction) == (3, None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            repository.like(10 ** 9, user_id, fields="ack")
+        assert exc_info.value.status_code == 404
+
+
+class TestPostTags:
+    """게시글 태그 색인 테스트"""
+
+    @pytest.fixture
+    def tagged_posts(self, db_session):
+        from src.api.v1.models.user.user import User
+        from src.api.v1.repositories.community.post_repository import PostRepository
+        from src.api.v1.schemas.community.post_schema import PostCreate
+
+        user = User(name="작성자", email="tag-writer@example.com")
+        db_session.add(user)
+        db_session.commit()
+        repository = PostRepository(db_session)
+        tag_sets = [["python", "fastapi"], ["python", " python ", ""], ["react"], None]
+        return [repository.create(PostCreate(content=f"게시글 {i}", user_id=user.id, tags=tags)).id for i, tags in enumerate(tag_sets)]
+
+    def test_tags_follow_post_writes(self, db_session, tagged_posts):
+        """게시글 생성/수정/삭제가 태그 집계에 반영되는지 테스트"""
+        from src.api.v1.repositories.community.community_repository import CommunityRepository
+        from src.api.v1.repositories.community.post_repository import PostRepository
+        from src.api.v1.schemas.community.post_schema import PostUpdate
+
+        community = CommunityRepository(db_session)
+        assert community.get_all_tags(limit=2) == [{"tag": "python", "count": 2}, {"tag": "fastapi", "count": 1}]
+
+        repository = PostRepository(db_session)
+        repository.update(tagged_posts[0], PostUpdate(tags=["react"]))
+        repository.delete(tagged_posts[1])
+        assert community.get_all_tags() == [{"tag": "react", "count": 2}]
+
+        posts = repository.get_all(tag="react")
+        assert sorted(post.id for post in posts) == sorted([tagged_posts[0], tagged_posts[2]])
+
+    def test_windowed_counts(self, db_session, tagged_posts):
+        """기간별 집계가 태그가 붙은 시각 기준인지 테스트"""
+        from datetime import datetime, timedelta
+        from src.api.v1.models.community.post_tag import PostTag
+        from src.api.v1.repositories.community.post_tag_repository import PostTagRepository
+
+        db_session.query(PostTag).filter(PostTag.post_id == tagged_posts[0]).update(
+            {PostTag.created_at: datetime.utcnow() - timedelta(days=3)}
+        )
+        db_session.commit()
+
+        repository = PostTagRepository(db_session)
+        assert repository.get_hot_tags(window="24h") == [{"tag": "python", "count": 1}, {"tag": "react", "count": 1}]
+        assert repository.get_hot_tags(window="7d")[0] == {"tag": "python", "count": 2}
+
+    def test_rebuild_from_json(self, db_session, tagged_posts):
+        """posts.tags JSON에서 색인을 다시 만드는지 테스트"""
+        from src.api.v1.models.community.post_tag import PostTag
+        from src.api.v1.repositories.community.post_tag_repository import PostTagRepository
+
+        db_session.query(PostTag).delete()
+        repository = PostTagRepository(db_session)
+        assert repository.rebuild(tagged_posts) == 4
+        assert repository.get_hot_tags() == [
+            {"tag": "python", "count": 2}, {"tag": "fastapi", "count": 1}, {"tag": "react", "count": 1}
+        ]
+
+
+class TestCommunityFragments:
+    """커뮤니티 홈 응답 조각 캐시 테스트"""
+
+    def test_fragment_cache_tags(self):
+        """조각을 한 번만 렌더링하고 태그 무효화 후 다시 렌더링하는지 테스트"""
+        from src.core.utils.fragment_cache import FragmentCache
+
+        renders = []
+        cache = FragmentCache(session_factory=Mock)
+
+        def render(db):
+            renders.append(1)
+            return b"[%d]" % len(renders)
+
+        assert cache.render_async("a", render, ttl=60, tags=("posts",)).result() == b"[1]"
+        assert cache.render_async("a", render, ttl=60, tags=("posts",)).result() == b"[1]"
+        cache.invalidate_tags("post_reactions")
+        assert cache.get("a") == b"[1]"
+        cache.invalidate_tags("posts")
+        assert cache.get("a") is None
+        assert cache.render_async("a", render, ttl=60, tags=("posts",)).result() == b"[2]"
+
+    def test_invalidated_render_is_not_stored(self):
+        """렌더링 중 무효화된 결과는 저장하지 않는지 테스트"""
+        import threading
+        from src.core.utils.fragment_cache import FragmentCache
+
+        started, release = threading.Event(), threading.Event()
+        cache = FragmentCache(session_factory=Mock)
+
+        def render(db):
+            started.set()
+            release.wait(5)
+            return b"[]"
+
+        future = cache.render_async("a", render, ttl=60, tags=("posts",))
+        started.wait(5)
+        cache.invalidate_tags("posts")
+        release.set()
+        assert future.result() == b"[]"
+        assert cache.get("a") is None
+
+    def test_community_info_uses_cached_fragments(self, db_session, monkeypatch):
+        """사용자 무관 조각을 캐시에서 읽고, 게시글 반응이 바뀌면 다시 렌더링하는지 테스트"""
+        from datetime import datetime, timezone
+        from src.api.v1.models.user.user import User
+        from src.api.v1.repositories.community import community_repository, post_repository
+        from src.api.v1.repositories.community.community_repository import CommunityRepository
+        from src.api.v1.repositories.community.post_repository import PostRepository
+        from src.api.v1.repositories.community.recommendation_repository import RecommendationRepository
+        from src.api.v1.schemas.community.post_schema import PostCreate
+        from src.core.utils.fragment_cache import FragmentCache
+        from tests.conftest import TestSessionLocal
+
+        cache = FragmentCache(session_factory=lambda: TestSessionLocal(bind=db_session.connection()))
+        monkeypatch.setattr(community_repository, "fragment_cache", cache)
+        monkeypatch.setattr(post_repository, "fragment_cache", cache)
+        computed_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        monkeypatch.setattr(
+            RecommendationRepository, "get_cached_follow_recommendations",
+            lambda self, user_id, limit: ([{"user_id": 1, "similarity_score": 0.5}], computed_at)
+        )
+
+        user = User(name="작성자", email="fragment-writer@example.com")
+        db_session.add(user)
+        db_session.commit()
+        user_id = user.id
+        post_id = PostRepository(db_session).create(PostCreate(content="게시글", user_id=user_id, tags=["python"])).id
+
+        community = CommunityRepository(db_session)
+        info = json.loads(community.get_info(user_id))
+        assert info["hot_topic"] == [{"tag": "python", "count": 1}]
+        assert [post["id"] for post in info["posts"]] == [post_id]
+        assert info["recommended_follow"] == [{"user_id": 1, "similarity_score": 0.5}]
+        assert info["recommended_follow_computed_at"] == "2026-01-01T00:00:00+00:00"
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_session.get_bind().engine, "before_cursor_execute", listener)
+        try:
+            assert json.loads(community.get_info(user_id)) == info
+        finally:
+            event.remove(db_session.get_bind().engine, "before_cursor_execute", listener)
+        assert statements == []
+
+        PostRepository(db_session).like(post_id, user_id)
+        info = json.loads(community.get_info(user_id))
+        assert info["posts"][0]["reaction"]["likes"]["count"] == 1
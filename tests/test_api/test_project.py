@@ -5,6 +5,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 import json
+import asyncio
 
 
 class TestProjectAPI:
@@ -226,3 +227,364 @@ class TestProjectGitHub:
         }
         response = client.post("/api/v1/projects/1/github/issues", json=issue_data)
         assert response.status_code in [200, 401, 404]
+
+
+@pytest.fixture
+def seeded_session(db_session, test_db):
+    """테이블 생성 후 세션 반환"""
+    import src.api.v1.models  # noqa: F401
+    from src.core.database.database import Base
+
+    Base.metadata.create_all(bind=test_db)
+    return db_session
+
+
+def _seed_projects(session, count: int, offset: int = 0):
+    """프로젝트, 멤버, 업무, 마일스톤 생성"""
+    from src.api.v1.models.user.user import User
+    from src.api.v1.models.project.project import Project
+    from src.api.v1.models.project.task import Task
+    from src.api.v1.models.project.milestone import Milestone
+
+    projects = []
+    for i in range(offset, offset + count):
+        owner = User(name=f"owner{i}", email=f"owner{i}@hydration.test")
+        member = User(name=f"member{i}", email=f"member{i}@hydration.test")
+        project = Project(id=f"H{i:05d}", title=f"프로젝트 {i}", team_size=3, owner=owner)
+        project.members = [owner, member]
+        project.tasks = [
+            Task(title="완료된 업무", status="completed"),
+            Task(title="진행 중 업무", status="in_progress"),
+        ]
+        project.milestones = [Milestone(title="마일스톤", status="completed")]
+        session.add(project)
+        projects.append(project)
+    session.flush()
+    return projects
+
+def _count_queries(session, fn):
+    """fn 실행 중 발생한 SQL 쿼리 수 반환"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+    return result, len(statements)
+
+
+class TestProjectHydration:
+    """프로젝트 목록 일괄 조회(hydration) 테스트"""
+
+    def test_hydrated_project_matches_detail(self, seeded_session):
+        """일괄 조회 결과에 소유자, 멤버, 통계가 포함되는지 테스트"""
+        from src.api.v1.repositories.project.project_repository import ProjectRepository
+
+        project = _seed_projects(seeded_session, 1)[0]
+        seeded_session.expire_all()
+
+        detail = ProjectRepository(seeded_session).get(project.id)
+
+        assert detail.owner.id == project.owner_id
+        assert len(detail.members) == 2
+        assert detail.stats.total_tasks == 2
+        assert detail.stats.completed_tasks == 1
+        assert detail.stats.progress_percentage == 50.0
+        assert detail.stats.completed_milestones == 1
+
+    def test_query_count_is_constant(self, seeded_session):
+        """프로젝트 수가 늘어나도 쿼리 수가 일정한지 테스트"""
+        from src.api.v1.repositories.project.project_repository import ProjectRepository
+
+        repository = ProjectRepository(seeded_session)
+
+        _seed_projects(seeded_session, 2)
+        seeded_session.expire_all()
+        small, small_queries = _count_queries(seeded_session, repository.get_all_projects)
+
+        _seed_projects(seeded_session, 20, offset=2)
+        seeded_session.expire_all()
+        large, large_queries = _count_queries(seeded_session, repository.get_all_projects)
+
+        assert len(large) - len(small) == 20
+        assert small_queries == large_queries
+
+
+class TestProjectPagination:
+    """프로젝트 목록 커서 페이지네이션 테스트"""
+
+    def test_cursor_walks_all_projects_once(self, seeded_session):
+        """커서를 따라가면 모든 프로젝트를 중복 없이 조회하는지 테스트"""
+        from src.api.v1.repositories.project.project_repository import ProjectRepository
+
+        seeded = {project.id for project in _seed_projects(seeded_session, 5)}
+        repository = ProjectRepository(seeded_session)
+
+        seen = []
+        cursor = None
+        for _ in range(100):
+            items, cursor = repository.get_projects_page(limit=2, cursor=cursor)
+            assert len(items) <= 2
+            seen.extend(item.id for item in items)
+            if not cursor:
+                break
+
+        assert len(seen) == len(set(seen))
+        assert seeded <= set(seen)
+
+    def test_brief_mode_skips_expansion(self, seeded_session):
+        """brief 모드에서 멤버와 통계를 조회하지 않는지 테스트"""
+        from src.api.v1.repositories.project.project_repository import ProjectRepository
+        from src.api.v1.schemas.brief import ProjectBrief
+
+        _seed_projects(seeded_session, 3)
+        seeded_session.expire_all()
+        repository = ProjectRepository(seeded_session)
+
+        (items, _), queries = _count_queries(
+            seeded_session, lambda: repository.get_projects_page(limit=3, fields="brief")
+        )
+
+        assert len(items) == 3
+        assert all(isinstance(item, ProjectBrief) and item.members is None for item in items)
+        assert queries == 1
+
+    def test_invalid_cursor(self, client: TestClient):
+        """잘못된 커서 요청 테스트"""
+        response = client.get("/api/v1/projects/all", params={"cursor": "not-a-cursor"})
+        assert response.status_code in [400, 401]
+
+
+class TestProjectStatCounters:
+    """프로젝트 통계 카운터 테이블 테스트"""
+
+    def _counts(self, session, project_id):
+        from src.api.v1.repositories.project.project_stat_repository import ProjectStatRepository
+
+        return ProjectStatRepository(session).get_counts([project_id])[project_id]
+
+    def test_counters_follow_task_and_milestone_writes(self, seeded_session):
+        """업무/마일스톤 쓰기 시 카운터와 진행도가 갱신되는지 테스트"""
+        from src.api.v1.models.user.user import User
+        from src.api.v1.models.project.project import Project
+        from src.api.v1.models.project.milestone import Milestone
+        from src.api.v1.repositories.project.task_repository import TaskRepository
+        from src.api.v1.repositories.project.milestone_repository import MilestoneRepository
+        from src.api.v1.schemas.project.task_schema import TaskCreate, TaskUpdate, SubTaskCreate
+        from src.api.v1.schemas.project.milestone_schema import MilestoneCreate
+
+        owner = User(name="카운터", email="owner@counter.test")
+        seeded_session.add(Project(id="CNT001", title="카운터 프로젝트", team_size=2, owner=owner))
+        seeded_session.flush()
+
+        milestone = MilestoneRepository(seeded_session).create(
+            "CNT001", MilestoneCreate(title="마일스톤", project_id="CNT001")
+        )
+        tasks = TaskRepository(seeded_session)
+        first = tasks.create("CNT001", TaskCreate(
+            title="첫 업무", project_id="CNT001", milestone_id=milestone.id,
+            subtasks=[SubTaskCreate(title="하위", is_completed=True)]
+        ))
+        second = tasks.create("CNT001", TaskCreate(title="둘째 업무", project_id="CNT001", milestone_id=milestone.id))
+
+        tasks.update("CNT001", first.id, TaskUpdate(status="completed"))
+
+        counts = self._counts(seeded_session, "CNT001")
+        assert counts["total_tasks"] == 2
+        assert counts["completed_tasks"] == 1
+        assert counts["total_milestones"] == 1
+        assert counts["total_subtasks"] == 1
+        assert counts["completed_subtasks"] == 1
+        assert seeded_session.get(Milestone, milestone.id).progress == 50
+
+        tasks.delete("CNT001", second.id)
+
+        counts = self._counts(seeded_session, "CNT001")
+        assert counts["total_tasks"] == 1
+        assert counts["completed_tasks"] == 1
+        seeded_session.expire_all()
+        assert seeded_session.get(Milestone, milestone.id).progress == 100
+
+    def test_reconcile_rebuilds_counters(self, seeded_session):
+        """reconcile이 어긋난 카운터를 복구하는지 테스트"""
+        from sqlalchemy import update
+        from src.api.v1.models.project.project_stat import ProjectStat
+        from src.api.v1.repositories.project.project_stat_repository import ProjectStatRepository
+
+        project = _seed_projects(seeded_session, 1, offset=900)[0]
+        repository = ProjectStatRepository(seeded_session)
+        repository.reconcile([project.id])
+
+        seeded_session.execute(
+            update(ProjectStat).where(ProjectStat.project_id == project.id).values(total_tasks=99)
+        )
+        assert self._counts(seeded_session, project.id)["total_tasks"] == 99
+
+        assert repository.reconcile([project.id]) == 1
+        counts = self._counts(seeded_session, project.id)
+        assert counts["total_tasks"] == 2
+        assert counts["completed_tasks"] == 1
+        assert counts["completed_milestones"] == 1
+
+
+    def test_counter_row_insert_ignores_existing_row(self, seeded_session):
+        """동시에 만든 카운터 행이 이미 있어도 충돌 없이 기존 행을 유지하는지 테스트"""
+        from src.api.v1.models.project.project_stat import ProjectStat
+        from src.api.v1.repositories.project.project_stat_repository import PROJECT_COUNTERS, ProjectStatRepository
+        from src.core.database.upsert import insert_ignore
+
+        project = _seed_projects(seeded_session, 1, offset=950)[0]
+        ProjectStatRepository(seeded_session).reconcile([project.id])
+
+        # 다른 요청이 먼저 행을 만든 뒤 늦게 도착한 삽입
+        insert_ignore(seeded_session, ProjectStat, [{"project_id": project.id, **{counter: 0 for counter in PROJECT_COUNTERS}}])
+
+        assert seeded_session.query(ProjectStat).filter(ProjectStat.project_id == project.id).count() == 1
+        assert self._counts(seeded_session, project.id)["total_tasks"] == 2
+
+
+class TestProjectChangeEvents:
+    """프로젝트 변경 이벤트(SSE 델타) 테스트"""
+
+    @pytest.fixture
+    def published(self, monkeypatch):
+        """커밋 후 발행되는 이벤트를 기록"""
+        from src.core.utils.project_events import project_event_publisher
+
+        changes = []
+        monkeypatch.setattr(project_event_publisher, "dispatch", changes.extend)
+        return changes
+
+    def test_dispatch_keeps_task_reference(self, monkeypatch):
+        """이벤트 루프 안에서 발행 태스크를 끝날 때까지 참조하는지 테스트"""
+        import asyncio
+        from src.core.utils.project_events import ProjectEventPublisher
+
+        publisher = ProjectEventPublisher()
+        published = []
+
+        async def publish(changes):
+            await asyncio.sleep(0)
+            published.extend(changes)
+
+        monkeypatch.setattr(publisher, "publish", publish)
+
+        async def run():
+            publisher.dispatch([{"type": "task.created"}])
+            assert len(publisher._tasks) == 1
+            await asyncio.gather(*publisher._tasks)
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+        assert published == [{"type": "task.created"}]
+        assert publisher._tasks == set()
+
+    def _project(self, session, project_id):
+        from src.api.v1.models.user.user import User
+        from src.api.v1.models.project.project import Project
+
+        owner = User(name="이벤트", email=f"{project_id}@events.test")
+        session.add(Project(id=project_id, title="이벤트 프로젝트", team_size=2, owner=owner))
+        session.commit()
+        return owner
+
+    def test_events_carry_changed_fields_and_versions(self, seeded_session, published):
+        """변경된 필드만 담은 이벤트가 커밋 후 버전 순서대로 발행되는지 테스트"""
+        from src.api.v1.models.project.project import Project
+        from src.api.v1.repositories.project.task_repository import TaskRepository
+        from src.api.v1.repositories.project.milestone_repository import MilestoneRepository
+        from src.api.v1.schemas.project.task_schema import TaskCreate, TaskUpdate
+        from src.api.v1.schemas.project.milestone_schema import MilestoneCreate
+
+        self._project(seeded_session, "EVT001")
+        milestone = MilestoneRepository(seeded_session).create("EVT001", MilestoneCreate(title="마일스톤", project_id="EVT001"))
+        tasks = TaskRepository(seeded_session)
+        task = tasks.create("EVT001", TaskCreate(title="업무", project_id="EVT001", milestone_id=milestone.id))
+        tasks.update("EVT001", task.id, TaskUpdate(priority="high"))
+        tasks.delete("EVT001", task.id)
+
+        assert [change["type"] for change in published] == ["milestone.created", "task.created", "task.updated", "task.deleted"]
+        assert [change["version"] for change in published] == [1, 2, 3, 4]
+        assert published[1]["data"]["title"] == "업무"
+        assert published[2]["id"] == task.id
+        assert published[2]["data"] == {"priority": "high"}
+        assert published[3]["data"] == {}
+        seeded_session.expire_all()
+        assert seeded_session.get(Project, "EVT001").version == 4
+
+    def test_rolled_back_changes_are_not_published(self, seeded_session, published):
+        """롤백된 변경의 이벤트는 발행되지 않는지 테스트"""
+        from tests.conftest import TestSessionLocal
+        from src.core.utils.project_events import record_project_event
+
+        session = TestSessionLocal()
+        try:
+            record_project_event(session, "EVT002", "task", "deleted", 1)
+            session.rollback()
+            session.commit()
+        finally:
+            session.close()
+
+        assert published == []
+
+    def test_publisher_sends_events_to_project_stream(self, monkeypatch):
+        """발행기가 프로젝트 SSE 토픽으로 이벤트를 보내는지 테스트"""
+        from src.core.utils import sse_manager
+        from src.core.utils.broadcast_backend import InProcessBroadcastBackend
+        from src.core.utils.project_events import ProjectEventPublisher
+
+        hub = sse_manager.SSEHub(backend_factory=InProcessBroadcastBackend)
+        monkeypatch.setattr(sse_manager, "sse_hub", hub)
+        change = {"type": "task.updated", "project_id": "EVT003", "version": 7, "entity": "task",
+                  "action": "updated", "id": 1, "data": {"status": "completed"}}
+
+        async def run():
+            subscription = await hub.subscribe("project", "EVT003")
+            ProjectEventPublisher().dispatch([change])
+            return await asyncio.wait_for(subscription.get(), timeout=1)
+
+        frame = asyncio.run(run())
+        assert json.loads(frame.decode().split("data: ", 1)[1]) == change
+
+
+class TestAsyncProjectRepository:
+    """비동기 세션 프로젝트 조회 테스트"""
+
+    def test_async_reads_match_sync_repository(self):
+        """비동기 저장소가 동기 저장소와 같은 결과를 반환하는지 테스트"""
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import StaticPool
+        import src.api.v1.models  # noqa: F401
+        from src.core.database.database import Base
+        from src.api.v1.repositories.project.project_repository import ProjectRepository
+        from src.api.v1.services.project.project_service import AsyncProjectService
+
+        async def run():
+            engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                await session.run_sync(lambda sync_session: _seed_projects(sync_session, 3, offset=700))
+                await session.commit()
+
+                service = AsyncProjectService(session)
+                page, cursor = await service.get_projects_page(limit=2)
+                detail = await service.get_project("H00700")
+                members = await service.get_project_members("H00700")
+                expected = await session.run_sync(lambda sync_session: ProjectRepository(sync_session).get("H00700"))
+            await engine.dispose()
+            return page, cursor, detail, members, expected
+
+        page, cursor, detail, members, expected = asyncio.run(run())
+        assert [project.id for project in page] == ["H00700", "H00701"]
+        assert cursor is not None
+        assert detail == expected
+        assert detail.stats.total_tasks == 2
+        assert len(members) == 2
@@ -5,6 +5,14 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
 import json
+from sqlalchemy import event
+
+import src.api.v1.models  # noqa: F401
+from src.api.v1.models.association_tables import user_follows
+from src.api.v1.models.user.user import User
+from src.api.v1.repositories.user.follow_repository import FollowRepository
+from src.api.v1.repositories.user.user_repository import UserRepository
+from src.core.security.jwt import create_access_token
 
 class TestUserAPI:
     """사용자 관련 API 엔드포인트 테스트"""
@@ -138,3 +146,69 @@ class TestUserSessions:
         """세션 해제 테스트"""
         response = client.delete("/api/v1/users/1/sessions/session_123")
         assert response.status_code in [200, 401, 404]
+
+
+class TestFollowSummary:
+    """팔로워/팔로잉 수 요약과 페이지 조회 테스트"""
+
+    @pytest.fixture
+    def follow_graph(self, db_session):
+        star = User(name="스타", email="follow-star@example.com")
+        fans = [User(name=f"팬{i}", email=f"follow-fan{i}@example.com") for i in range(5)]
+        db_session.add_all([star, *fans])
+        db_session.flush()
+        db_session.execute(user_follows.insert(), [{"follower_id": fan.id, "followed_id": star.id} for fan in fans])
+        db_session.execute(user_follows.insert(), {"follower_id": star.id, "followed_id": fans[0].id})
+        db_session.commit()
+        return star, fans
+
+    def test_user_detail_carries_counts_only(self, db_session, follow_graph):
+        """사용자 상세는 팔로워 목록 없이 수만 담는지 테스트"""
+        star, _ = follow_graph
+        detail = UserRepository(db_session).get(star.id)
+        assert detail.followers.count == 5
+        assert detail.followers.users == []
+        assert detail.following.count == 1
+
+    def test_counts_for_many_users_in_one_query(self, db_session, follow_graph):
+        """여러 사용자의 수를 한 번의 쿼리로 조회하는지 테스트"""
+        star, fans = follow_graph
+        ids = [star.id] + [fan.id for fan in fans] + [999999]
+        statements = []
+        engine = db_session.get_bind().engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            counts = FollowRepository(db_session).get_counts(ids)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+        assert counts[star.id] == (1, 5)
+        assert counts[fans[0].id] == (1, 1)
+        assert counts[fans[1].id] == (1, 0)
+        assert counts[999999] == (0, 0)
+
+    def test_followers_endpoint_is_paginated(self, client: TestClient, follow_graph):
+        """팔로워 목록을 커서로 나눠 조회하는지 테스트"""
+        star, fans = follow_graph
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': star.email})}"}
+
+        first = client.get(
+            f"/api/v1/users/{star.id}/follow/followers?limit=3",
+            headers={**headers, "Origin": "https://team-up.kro.kr"}
+        )
+        assert first.status_code == 200
+        # 교차 출처 프론트엔드에서도 커서 헤더를 읽을 수 있어야 함
+        assert "x-next-cursor" in first.headers["access-control-expose-headers"].lower()
+        assert first.json()["count"] == 5
+        assert [u["id"] for u in first.json()["users"]] == [fan.id for fan in fans[:3]]
+
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get(f"/api/v1/users/{star.id}/follow/followers?limit=3&cursor={cursor}", headers=headers)
+        assert [u["id"] for u in second.json()["users"]] == [fan.id for fan in fans[3:]]
+        assert "X-Next-Cursor" not in second.headers
+
+        following = client.get(f"/api/v1/users/{star.id}/follow/following", headers=headers)
+        assert following.json() == {"count": 1, "users": [following.json()["users"][0]]}
+        assert following.json()["users"][0]["id"] == fans[0].id
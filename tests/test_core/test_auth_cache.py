@@ -0,0 +1,108 @@
+"""
+인증 사용자 캐시 테스트
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from src.api.v1.models.user.user import User
+from src.api.v1.repositories.user.user_repository import UserRepository
+from src.api.v1.schemas.brief import UserBrief
+from src.api.v1.schemas.user.user_schema import UserUpdate
+from src.core.security import auth_cache as auth_cache_module
+from src.core.security.auth import get_current_user
+from src.core.security.auth_cache import auth_cache
+from src.core.security.jwt import create_access_token
+from src.core.utils.user_projection import UserPrincipal
+
+
+@pytest.fixture
+def cached_user(db_session):
+    user = User(name="캐시사용자", email="auth-cache@example.com", status="active", auth_provider="local")
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def statements(db_session):
+    executed = []
+
+    def _record(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+class TestAuthCache:
+    """get_current_user 캐시 테스트"""
+
+    def test_cached_user_skips_query(self, db_session, cached_user, statements):
+        """두 번째 요청부터 users 조회 없이 같은 사용자를 반환하는지 테스트"""
+        token = create_access_token({"sub": cached_user.email})
+        first = get_current_user(db=db_session, token=token)
+        statements.clear()
+
+        second = get_current_user(db=db_session, token=token)
+        assert statements == []
+        assert second.id == first.id
+        assert second.name == "캐시사용자"
+
+    def test_token_verification_is_memoized(self, db_session, cached_user, monkeypatch):
+        """같은 토큰은 한 번만 디코드하는지 테스트"""
+        calls = []
+        original = auth_cache_module.verify_token
+
+        def _counting_verify(token):
+            calls.append(token)
+            return original(token)
+
+        monkeypatch.setattr(auth_cache_module, "verify_token", _counting_verify)
+        token = create_access_token({"sub": cached_user.email})
+        get_current_user(db=db_session, token=token)
+        get_current_user(db=db_session, token=token)
+        assert len(calls) == 1
+
+    def test_expired_memo_is_verified_again(self):
+        """exp가 지난 토큰은 캐시된 결과를 쓰지 않는지 테스트"""
+        token = create_access_token({"sub": "expired@example.com", "exp": 1})
+        key = auth_cache_module.hashlib.sha256(token.encode()).hexdigest()
+        auth_cache.tokens.set(key, {"sub": "expired@example.com", "exp": 1})
+
+        with pytest.raises(ValueError):
+            auth_cache.verify(token)
+        assert auth_cache.tokens.get(key) is None
+
+    def test_update_invalidates_cached_user(self, db_session, cached_user):
+        """사용자 수정 후에는 바뀐 정보를 반환하는지 테스트"""
+        token = create_access_token({"sub": cached_user.email})
+        get_current_user(db=db_session, token=token)
+
+        UserRepository(db_session).update(cached_user.id, UserUpdate(name="바뀐이름"))
+        assert get_current_user(db=db_session, token=token).name == "바뀐이름"
+
+    def test_remove_invalidates_cached_user(self, db_session, cached_user):
+        """사용자 삭제 후에는 인증에 실패하는지 테스트"""
+        token = create_access_token({"sub": cached_user.email})
+        get_current_user(db=db_session, token=token)
+
+        UserRepository(db_session).remove(cached_user.id)
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(db=db_session, token=token)
+        assert exc_info.value.status_code == 401
+
+    def test_returns_principal_projection(self, db_session, cached_user, statements):
+        """User 엔티티 대신 기본 컬럼만 조회한 UserPrincipal을 반환하는지 테스트"""
+        email = cached_user.email
+        statements.clear()
+        principal = get_current_user(db=db_session, token=create_access_token({"sub": email}))
+
+        assert isinstance(principal, UserPrincipal)
+        assert not hasattr(principal, "__dict__")
+        assert len(statements) == 1
+        assert "hashed_password" not in statements[0]
+        assert "notification_settings" not in statements[0]
+        assert UserBrief.model_validate(principal, from_attributes=True).email == email
@@ -0,0 +1,488 @@
+"""
+채팅 웹소켓 유틸리티 테스트
+"""
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeWebSocket:
+    """전송 내용을 기록하는 가짜 웹소켓"""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.closed = False
+
+    async def send_text(self, payload: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000, reason: str = ""):
+        self.closed = True
+
+
+@pytest.fixture
+def chat_module(monkeypatch):
+    """연결 상태와 brief 캐시를 비운 chat_websocket 모듈"""
+    from src.core.utils import chat_websocket
+    from src.core.utils.user_brief_cache import user_brief_cache
+
+    monkeypatch.setattr(chat_websocket, "active_connections", {})
+    monkeypatch.setattr(chat_websocket, "user_channels", {})
+    user_brief_cache.clear()
+    yield chat_websocket
+    user_brief_cache.clear()
+
+
+def _chat(user_id: int = 1, user=None):
+    return SimpleNamespace(
+        id=10, project_id="PRJ001", channel_id="general", user_id=user_id,
+        message="hello", timestamp=datetime.now(), user=user
+    )
+
+
+class TestChatBroadcast:
+    """채팅 브로드캐스트 테스트"""
+
+    def test_payload_serialized_once_and_shared(self, chat_module, monkeypatch):
+        """모든 수신자가 같은 직렬화 결과를 받고 brief 조회는 한 번인지 테스트"""
+        calls = []
+
+        def fake_get_user_brief(user_id, db=None):
+            calls.append(user_id)
+            return {"id": user_id, "name": "sender"}
+
+        monkeypatch.setattr(chat_module, "get_user_brief", fake_get_user_brief)
+        sockets = {str(i): FakeWebSocket() for i in range(50)}
+        chat_module.active_connections["PRJ001"] = {"general": dict(sockets)}
+
+        asyncio.run(chat_module.broadcast_message(_chat()))
+
+        payloads = {socket.sent[0] for socket in sockets.values()}
+        assert len(payloads) == 1
+        assert json.loads(payloads.pop())["user"] == {"id": 1, "name": "sender"}
+        assert calls == [1]
+
+    def test_brief_cache_reused_across_messages(self, chat_module, monkeypatch):
+        """두 번째 메시지부터는 캐시된 brief를 사용하는지 테스트"""
+        calls = []
+
+        def fake_get_user_brief(user_id, db=None):
+            calls.append(user_id)
+            brief = {"id": user_id, "name": "sender"}
+            chat_module.user_brief_cache.set(user_id, brief)
+            return brief
+
+        monkeypatch.setattr(chat_module, "get_user_brief", fake_get_user_brief)
+        chat_module.active_connections["PRJ001"] = {"general": {"2": FakeWebSocket()}}
+
+        async def run():
+            await chat_module.broadcast_message(_chat())
+            await chat_module.broadcast_message(_chat())
+
+        asyncio.run(run())
+        assert calls == [1]
+
+    def test_slow_and_broken_sockets_are_isolated(self, chat_module, monkeypatch):
+        """느린 소켓과 끊긴 소켓이 다른 수신자 전송을 막지 않고 정리되는지 테스트"""
+        monkeypatch.setattr(chat_module, "SEND_TIMEOUT", 0.05)
+        healthy, slow, broken = FakeWebSocket(), FakeWebSocket(delay=1.0), FakeWebSocket(fail=True)
+        chat_module.active_connections["PRJ001"] = {"general": {"1": healthy, "2": slow, "3": broken}}
+        chat_module.user_channels.update({"1": {("PRJ001", "general")}, "2": {("PRJ001", "general")}, "3": {("PRJ001", "general")}})
+
+        async def run():
+            started = asyncio.get_running_loop().time()
+            await chat_module.broadcast_message(_chat(user_id=0))
+            return asyncio.get_running_loop().time() - started
+
+        elapsed = asyncio.run(run())
+        assert elapsed < 0.5
+        assert len(healthy.sent) == 1 and json.loads(healthy.sent[0])["user"] is None
+        assert list(chat_module.active_connections["PRJ001"]["general"]) == ["1"]
+        assert slow.closed and broken.closed
+
+    def test_chat_detail_user_is_used_without_lookup(self, chat_module, monkeypatch):
+        """ChatDetail에 포함된 user가 있으면 DB 조회 없이 사용하는지 테스트"""
+        from src.api.v1.schemas.brief import UserBrief
+
+        def fail_lookup(user_id, db=None):
+            raise AssertionError("brief lookup should not run")
+
+        monkeypatch.setattr(chat_module, "get_user_brief", fail_lookup)
+        socket = FakeWebSocket()
+        chat_module.active_connections["PRJ001"] = {"general": {"1": socket}}
+        now = datetime.now()
+        user = UserBrief(id=1, name="sender", email="sender@example.com", created_at=now, updated_at=now)
+
+        asyncio.run(chat_module.broadcast_message(_chat(user=user)))
+        assert json.loads(socket.sent[0])["user"]["created_at"] == now.isoformat()
+
+
+class TestTTLCache:
+    """TTL/LRU 캐시 테스트"""
+
+    def test_lru_eviction_and_expiry(self, monkeypatch):
+        """크기 제한을 넘으면 가장 오래 안 쓴 항목을 버리고, 만료된 항목은 반환하지 않는지 테스트"""
+        from src.core.utils import user_brief_cache as module
+
+        now = [100.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        cache = module.TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None and cache.get("a") == 1
+
+        now[0] += 11
+        assert cache.get("a") is None
+        assert cache.get_or_load("a", lambda: 5) == 5
+
+
+class TestHeartbeatScheduler:
+    """공용 하트비트 스케줄러 테스트"""
+
+    def test_pings_once_per_interval_and_stops_after_unregister(self):
+        """등록된 연결이 interval마다 ping을 받고, 해제 후에는 받지 않는지 테스트"""
+        from src.core.utils.heartbeat import HeartbeatScheduler
+
+        scheduler = HeartbeatScheduler(interval=0.1, tick=0.02, send_timeout=0.05)
+        counts = {"a": 0, "b": 0}
+
+        def make_ping(key):
+            async def ping():
+                counts[key] += 1
+            return ping
+
+        async def run():
+            handle_a = scheduler.register(make_ping("a"))
+            scheduler.register(make_ping("b"))
+            await asyncio.sleep(0.35)
+            scheduler.unregister(handle_a)
+            pinged = counts["a"]
+            await asyncio.sleep(0.25)
+            return pinged
+
+        pinged = asyncio.run(run())
+        assert 2 <= pinged <= 4
+        assert counts["a"] == pinged
+        assert counts["b"] >= pinged + 1
+        assert len(scheduler) == 1
+
+    def test_failed_ping_is_removed_and_reported(self):
+        """ping 실패나 시간 초과 시 휠에서 빠지고 on_failure가 호출되는지 테스트"""
+        from src.core.utils.heartbeat import HeartbeatScheduler
+
+        scheduler = HeartbeatScheduler(interval=0.05, tick=0.01, send_timeout=0.02)
+        failures = []
+
+        async def broken():
+            raise RuntimeError("socket closed")
+
+        async def stuck():
+            await asyncio.sleep(1)
+
+        async def on_failure(error):
+            failures.append(type(error))
+
+        async def run():
+            scheduler.register(broken, on_failure)
+            scheduler.register(stuck, on_failure)
+            await asyncio.sleep(0.15)
+
+        asyncio.run(run())
+        assert sorted(f.__name__ for f in failures) == ["RuntimeError", "TimeoutError"]
+        assert len(scheduler) == 0
+
+
+class ScriptedWebSocket(FakeWebSocket):
+    """정해진 메시지를 받은 뒤 연결이 끊기는 가짜 웹소켓"""
+
+    def __init__(self, messages):
+        super().__init__()
+        self.messages = list(messages)
+        self.receives = 0
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self) -> str:
+        from fastapi import WebSocketDisconnect
+
+        self.receives += 1
+        await asyncio.sleep(0)
+        if not self.messages:
+            raise WebSocketDisconnect()
+        return self.messages.pop(0)
+
+
+class TestWebSocketHandler:
+    """웹소켓 수신 루프 테스트"""
+
+    def test_receive_loop_is_event_driven(self, chat_module):
+        """수신 루프가 메시지마다 한 번만 receive하고 종료 시 연결과 하트비트를 정리하는지 테스트"""
+        from src.core.utils.heartbeat import heartbeat_scheduler
+
+        websocket = ScriptedWebSocket([json.dumps({"type": "pong"}), "not json"])
+
+        async def run():
+            await chat_module.websocket_handler(websocket, "general", "PRJ001", 1, db=None)
+            return len(heartbeat_scheduler)
+
+        assert asyncio.run(run()) == 0
+        assert websocket.receives == 3
+        assert chat_module.active_connections == {}
+        assert chat_module.user_channels == {}
+
+
+@pytest.fixture
+def memory_session_factory():
+    """채팅 쓰기 테스트용 인메모리 DB 세션 팩토리"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from src.core.database.database import Base
+    import src.api.v1.models  # noqa: F401
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+class TestChatWriter:
+    """채팅 쓰기 파이프라인 테스트"""
+
+    def test_messages_are_saved_in_batches(self, memory_session_factory):
+        """큐에 쌓인 메시지가 배치 단위 커밋으로 저장되고 순서대로 ID를 받는지 테스트"""
+        from src.api.v1.models.project.chat import Chat
+        from src.core.utils.chat_writer import ChatWriter
+
+        sessions = []
+
+        def factory():
+            sessions.append(1)
+            return memory_session_factory()
+
+        writer = ChatWriter(batch_size=50, session_factory=factory)
+
+        async def run():
+            pending = [await writer.submit("PRJ001", "general", 1, f"message {i}") for i in range(120)]
+            assert all(isinstance(p.id, str) and p.id.startswith("pending_") for p in pending)
+            await writer.flush()
+            return pending
+
+        pending = asyncio.run(run())
+        assert len(sessions) == 3
+        ids = [p.id for p in pending]
+        assert ids == sorted(ids) and len(set(ids)) == 120
+
+        db = memory_session_factory()
+        saved = {chat.id: chat.message for chat in db.query(Chat).all()}
+        db.close()
+        assert [saved[p.id] for p in pending] == [f"message {i}" for i in range(120)]
+
+    def test_queue_full_raises_after_timeout(self, memory_session_factory):
+        """저장이 밀려 대기열이 가득 차면 ChatQueueFull이 발생하는지 테스트"""
+        import threading
+        from src.core.utils.chat_writer import ChatQueueFull, ChatWriter
+
+        release = threading.Event()
+
+        def blocking_factory():
+            release.wait(5)
+            return memory_session_factory()
+
+        writer = ChatWriter(batch_size=10, max_pending=2, enqueue_timeout=0.02, session_factory=blocking_factory)
+
+        async def run():
+            first = await writer.submit("PRJ001", "general", 1, "in flight")
+            await asyncio.sleep(0.02)
+            queued = [await writer.submit("PRJ001", "general", 1, f"queued {i}") for i in range(2)]
+            with pytest.raises(ChatQueueFull):
+                await writer.submit("PRJ001", "general", 1, "rejected")
+            release.set()
+            await writer.flush()
+            return [first] + queued
+
+        pending = asyncio.run(run())
+        assert all(p.committed for p in pending)
+
+    def test_failed_row_does_not_fail_batch(self, memory_session_factory):
+        """배치의 한 행이 제약 조건을 어기면 그 메시지만 실패하고 나머지는 저장되는지 테스트"""
+        from sqlalchemy.exc import IntegrityError
+        from src.api.v1.models.project.chat import Chat
+        from src.core.utils.chat_writer import ChatWriter
+
+        writer = ChatWriter(batch_size=50, session_factory=memory_session_factory)
+
+        async def run():
+            pending = [await writer.submit("PRJ001", "general", 1, f"message {i}") for i in range(10)]
+            # message는 NOT NULL
+            broken = await writer.submit("PRJ001", "general", 2, None)
+            pending += [await writer.submit("PRJ001", "general", 1, f"message {i}") for i in range(10, 20)]
+            await writer.flush()
+            return pending, broken
+
+        pending, broken = asyncio.run(run())
+        assert isinstance(broken.future.exception(), IntegrityError)
+        assert all(p.committed for p in pending)
+
+        db = memory_session_factory()
+        saved = {chat.id: chat.message for chat in db.query(Chat).all()}
+        db.close()
+        assert [saved[p.id] for p in pending] == [f"message {i}" for i in range(20)]
+
+    def test_transient_error_is_retried(self, memory_session_factory):
+        """일시적인 연결 오류는 다시 시도해 저장하는지 테스트"""
+        from sqlalchemy.exc import OperationalError
+        from src.core.utils.chat_writer import ChatWriter
+
+        attempts = []
+
+        def flaky_factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OperationalError("INSERT", {}, Exception("server closed the connection"))
+            return memory_session_factory()
+
+        writer = ChatWriter(batch_size=50, retry_delay=0, session_factory=flaky_factory)
+
+        async def run():
+            pending = [await writer.submit("PRJ001", "general", 1, f"message {i}") for i in range(5)]
+            await writer.flush()
+            return pending
+
+        pending = asyncio.run(run())
+        assert len(attempts) == 2
+        assert all(p.committed for p in pending)
+
+
+class TestChatPipelineHandler:
+    """웹소켓 핸들러와 쓰기 파이프라인 연동 테스트"""
+
+    def _run_handler(self, chat_module, monkeypatch, session_factory):
+        from src.core.utils.chat_writer import ChatWriter
+
+        writer = ChatWriter(session_factory=session_factory)
+        monkeypatch.setattr(chat_module, "chat_writer", writer)
+        monkeypatch.setattr(chat_module, "get_user_brief", lambda user_id, db=None: {"id": user_id})
+        receiver = FakeWebSocket()
+        sender = ScriptedWebSocket([json.dumps({"project_id": "PRJ001", "channel_id": "general", "message": "hi"})])
+
+        async def run():
+            chat_module.active_connections["PRJ001"] = {"general": {"2": receiver}}
+            await chat_module.websocket_handler(sender, "general", "PRJ001", 1, db=None)
+            await writer.flush()
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        asyncio.run(run())
+        return [json.loads(payload) for payload in receiver.sent]
+
+    def test_broadcast_with_provisional_id_then_confirm(self, chat_module, monkeypatch, memory_session_factory):
+        """기본 모드에서 임시 ID로 먼저 브로드캐스트하고 커밋 후 실제 ID를 알리는지 테스트"""
+        monkeypatch.setattr(chat_module.setting, "CHAT_DURABLE_WRITES", False)
+        message, confirmation = self._run_handler(chat_module, monkeypatch, memory_session_factory)
+
+        assert message["id"] == message["provisional_id"]
+        assert message["message"] == "hi"
+        assert confirmation == {"type": "chat_confirmed", "provisional_id": message["provisional_id"], "id": 1}
+
+    def test_durable_mode_broadcasts_after_commit(self, chat_module, monkeypatch, memory_session_factory):
+        """내구성 모드에서 커밋 후 실제 ID로 한 번만 브로드캐스트하는지 테스트"""
+        monkeypatch.setattr(chat_module.setting, "CHAT_DURABLE_WRITES", True)
+        payloads = self._run_handler(chat_module, monkeypatch, memory_session_factory)
+
+        assert len(payloads) == 1
+        assert payloads[0]["id"] == 1
+
+
+class TestBroadcastBackend:
+    """워커 간 브로드캐스트 백엔드 테스트 (인메모리 브로커)"""
+
+    def _worker(self, broker, received, name, max_batch=100):
+        from src.core.utils.broadcast_backend import RedisBroadcastBackend
+
+        async def deliver(project_id, channel_id, payloads):
+            received.setdefault(name, []).extend((channel_id, payload) for payload in payloads)
+
+        return RedisBroadcastBackend(deliver, client_factory=broker.client, max_batch=max_batch)
+
+    def test_publishes_are_batched_per_channel_and_not_echoed(self):
+        """같은 루프 반복에서 발행한 메시지를 채널당 한 번에 보내고, 보낸 워커에는 중복 전달하지 않는지 테스트"""
+        from src.core.utils.broadcast_backend import InMemoryBroker
+
+        broker = InMemoryBroker()
+        received = {}
+        workers = [self._worker(broker, received, name) for name in ("a", "b", "c")]
+
+        async def run():
+            for worker in workers:
+                await worker.subscribe("PRJ001", "general")
+            await asyncio.gather(*(workers[0].publish("PRJ001", "general", f"m{i}") for i in range(5)))
+            await workers[0].publish("PRJ001", "random", "other")
+            await asyncio.sleep(0.05)
+            for worker in workers:
+                await worker.close()
+
+        asyncio.run(run())
+        expected = [("general", f"m{i}") for i in range(5)]
+        assert received["a"] == expected + [("random", "other")]
+        assert received["b"] == expected
+        assert received["c"] == expected
+        assert broker.published == 2
+
+    def test_only_subscribed_workers_receive(self):
+        """로컬 소켓이 없는(구독 해제한) 워커에는 전달하지 않는지 테스트"""
+        from src.core.utils.broadcast_backend import InMemoryBroker
+
+        broker = InMemoryBroker()
+        received = {}
+        sender, listener = self._worker(broker, received, "sender", max_batch=2), self._worker(broker, received, "listener")
+
+        async def run():
+            await listener.subscribe("PRJ001", "general")
+            for i in range(3):
+                await sender.publish("PRJ001", "general", f"m{i}")
+            await asyncio.sleep(0.05)
+            await listener.unsubscribe("PRJ001", "general")
+            await sender.publish("PRJ001", "general", "after")
+            await asyncio.sleep(0.05)
+            await sender.close()
+            await listener.close()
+
+        asyncio.run(run())
+        assert received["listener"] == [("general", f"m{i}") for i in range(3)]
+        assert len(received["sender"]) == 4
+
+    def test_chat_sockets_receive_messages_from_other_workers(self, chat_module, monkeypatch):
+        """다른 워커에서 발행한 채팅이 이 워커의 채널 소켓에 전달되는지 테스트"""
+        from src.core.utils.broadcast_backend import InMemoryBroker, RedisBroadcastBackend
+
+        broker = InMemoryBroker()
+        local = RedisBroadcastBackend(chat_module._deliver_local, client_factory=broker.client)
+        monkeypatch.setattr(chat_module, "broadcast_backend", local)
+        remote = self._worker(broker, {}, "remote")
+        socket = FakeWebSocket()
+
+        async def run():
+            await chat_module.register_connection("PRJ001", "general", "1", socket)
+            await remote.publish("PRJ001", "general", json.dumps({"message": "from another worker"}))
+            await asyncio.sleep(0.05)
+            await chat_module.unregister_connection("PRJ001", "general", "1")
+            await remote.publish("PRJ001", "general", json.dumps({"message": "after leaving"}))
+            await asyncio.sleep(0.05)
+            await remote.close()
+            await local.close()
+
+        asyncio.run(run())
+        assert [json.loads(payload)["message"] for payload in socket.sent] == ["from another worker"]
@@ -63,6 +63,14 @@ class TestMiddleware:
         cors_middleware = CORSMiddleware
         assert cors_middleware is not None
 
+    def test_cors_exposes_pagination_cursor(self, client):
+        """교차 출처 응답에서 X-Next-Cursor 헤더를 읽을 수 있는지 테스트"""
+        response = client.get("/api/v1/community/", headers={"Origin": "http://localhost:3000"})
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        exposed = [header.strip().lower() for header in response.headers["access-control-expose-headers"].split(",")]
+        assert "x-next-cursor" in exposed
+        assert "x-recommendations-computed-at" in exposed
+
 
 class TestSecurity:
     """보안 관련 테스트"""
@@ -0,0 +1,67 @@
+"""
+커넥션 풀 지표 테스트
+"""
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+from src.core.database.pool_metrics import PoolMetrics, PoolMetricsRegistry, timed_pool_class
+
+
+class TestPoolMetrics:
+    """커넥션 풀 지표 테스트"""
+
+    def test_observe_fills_histogram(self):
+        """대기 시간이 알맞은 버킷에 기록되는지 테스트"""
+        metrics = PoolMetrics("rest")
+        metrics.observe(0.0005)
+        metrics.observe(0.02)
+        metrics.observe(60, timed_out=True)
+
+        engine = create_engine("sqlite://")
+        waits = metrics.snapshot(engine.pool)["waits"]
+        assert waits["count"] == 3
+        assert waits["timeouts"] == 1
+        assert waits["max_ms"] == 60000
+        assert waits["histogram"]["le_1ms"] == 1
+        assert waits["histogram"]["le_25ms"] == 1
+        assert waits["histogram"]["le_inf"] == 1
+
+    def test_timed_pool_records_checkouts_and_timeouts(self, tmp_path):
+        """풀에서 연결을 얻을 때와 타임아웃 시 지표가 기록되는지 테스트"""
+        registry = PoolMetricsRegistry()
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=timed_pool_class(QueuePool, registry.create("rest")),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        registry.register("rest", engine)
+
+        with engine.connect():
+            status = registry.snapshot()[0]
+            assert status["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        status = registry.snapshot()[0]
+        assert status["name"] == "rest"
+        assert status["size"] == 1
+        assert status["checked_out"] == 0
+        assert status["waits"]["count"] == 2
+        assert status["waits"]["timeouts"] == 1
+        assert status["waits"]["max_ms"] >= 50
+
+    def test_internal_endpoint_requires_token(self, client, monkeypatch):
+        """내부 지표 엔드포인트가 토큰으로 보호되는지 테스트"""
+        from src.core.config import setting
+
+        assert client.get("/api/v1/internal/db/pools").status_code == 403
+
+        monkeypatch.setattr(setting, "INTERNAL_METRICS_TOKEN", "metrics-token")
+        assert client.get("/api/v1/internal/db/pools", headers={"X-Internal-Token": "wrong"}).status_code == 403
+
+        response = client.get("/api/v1/internal/db/pools", headers={"X-Internal-Token": "metrics-token"})
+        assert response.status_code == 200
+        assert {pool["name"] for pool in response.json()} == {"rest", "rest_async", "stream", "stream_async"}
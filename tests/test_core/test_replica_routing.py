@@ -0,0 +1,83 @@
+"""
+읽기 복제본 라우팅 테스트
+기본 DB와 복제본을 서로 다른 SQLite 파일로 두고, 같은 ID의 사용자 이름을 다르게 저장해 어느 쪽에서 읽었는지 확인합니다.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import src.api.v1.models  # noqa: F401
+from src.api.v1.models.user.user import User
+from src.api.v1.repositories.user.user_repository import UserRepository
+from src.core.database.database import Base
+from src.core.database.routing import ReplicaRouter, RoutingSession
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def routed(tmp_path):
+    """기본 DB/복제본 SQLite 파일과 라우팅 세션 팩토리"""
+    engines = {}
+    for name in ("primary", "replica"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as session:
+            session.add(User(id=1, name=name, email=f"{name}@routing.test"))
+            session.commit()
+        engines[name] = engine
+
+    clock = FakeClock()
+    router = ReplicaRouter(window=5.0, clock=clock)
+    factory = sessionmaker(class_=RoutingSession, bind=engines["primary"], replica=engines["replica"], router=router)
+    yield factory, clock
+    for engine in engines.values():
+        engine.dispose()
+
+
+class TestReplicaRouting:
+    """읽기 복제본 라우팅 테스트"""
+
+    def test_replica_reads_and_primary_queries(self, routed):
+        """@replica_read 메서드만 복제본에서 읽는지 테스트"""
+        factory, _ = routed
+        with factory() as session:
+            assert UserRepository(session).get_user_brief(1).name == "replica"
+            assert session.query(User.name).filter(User.id == 1).scalar() == "primary"
+
+    def test_session_reads_primary_after_write(self, routed):
+        """세션에서 쓰기를 한 뒤에는 기본 DB에서 읽는지 테스트"""
+        factory, _ = routed
+        with factory() as session:
+            session.add(User(id=2, name="new", email="new@routing.test"))
+            session.commit()
+            assert UserRepository(session).get_user_brief(2).name == "new"
+            assert UserRepository(session).get_user_brief(1).name == "primary"
+
+    def test_sticky_window_after_commit(self, routed):
+        """쓰기를 커밋한 클라이언트만 일정 시간 기본 DB에서 읽는지 테스트"""
+        factory, clock = routed
+        with factory(sticky_key="writer") as session:
+            session.query(User).filter(User.id == 1).update({"job": "backend"})
+            session.commit()
+
+        with factory(sticky_key="writer") as session:
+            assert UserRepository(session).get_user_brief(1).name == "primary"
+        with factory(sticky_key="reader") as session:
+            assert UserRepository(session).get_user_brief(1).name == "replica"
+
+        clock.now = 6.0
+        with factory(sticky_key="writer") as session:
+            assert UserRepository(session).get_user_brief(1).name == "replica"
+
+    def test_without_replica_everything_uses_primary(self, routed):
+        """복제본이 없으면 기본 DB만 사용하는지 테스트"""
+        factory, _ = routed
+        with factory(replica=None) as session:
+            assert UserRepository(session).get_user_brief(1).name == "primary"
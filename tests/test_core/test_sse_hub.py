@@ -0,0 +1,218 @@
+"""
+SSE 허브 테스트
+"""
+import asyncio
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.core.utils.broadcast_backend import InMemoryBroker, InProcessBroadcastBackend, RedisBroadcastBackend
+from src.core.utils.sse_manager import COALESCE, SSEHub
+
+
+class RecordingBackend(InProcessBroadcastBackend):
+    """구독/해제 호출을 기록하는 단일 워커 백엔드"""
+
+    def __init__(self, deliver):
+        super().__init__(deliver)
+        self.calls = []
+
+    async def subscribe(self, namespace, key):
+        self.calls.append(("subscribe", namespace, key))
+
+    async def unsubscribe(self, namespace, key):
+        self.calls.append(("unsubscribe", namespace, key))
+
+
+def parse(frame: bytes) -> dict:
+    """SSE 프레임을 {"id": ..., "data": ...}로 나눕니다."""
+    fields = {}
+    for line in frame.decode().strip().split("\n"):
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    return fields
+
+
+class TestSSEHub:
+    """SSE 허브 테스트"""
+
+    def test_bounded_queue_drops_oldest(self):
+        """구독자 대기열이 가득 차면 가장 오래된 이벤트를 버리는지 테스트"""
+        hub = SSEHub(max_queue=3, backend_factory=InProcessBroadcastBackend)
+
+        async def run():
+            subscription = await hub.subscribe("project", "PRJ001")
+            for i in range(5):
+                await hub.publish("project", "PRJ001", f'"event {i}"')
+            return subscription, [await subscription.get() for _ in range(3)]
+
+        subscription, frames = asyncio.run(run())
+        assert [parse(frame)["data"] for frame in frames] == ['"event 2"', '"event 3"', '"event 4"']
+        assert subscription.dropped == 2
+
+    def test_coalesce_keeps_latest_snapshot(self):
+        """coalesce 정책에서 밀린 이벤트가 최신 하나로 합쳐지는지 테스트"""
+        hub = SSEHub(backend_factory=InProcessBroadcastBackend)
+
+        async def run():
+            subscription = await hub.subscribe("notification", 1, policy=COALESCE)
+            for i in range(3):
+                await hub.publish("notification", 1, [i])
+            return subscription, await subscription.get(), len(subscription)
+
+        subscription, frame, remaining = asyncio.run(run())
+        assert parse(frame)["data"] == "[2]" and remaining == 0
+        assert subscription.dropped == 2
+
+    def test_event_serialized_once_with_increasing_ids(self):
+        """이벤트가 발행 시 한 번 JSON으로 직렬화되어 모든 구독자가 같은 바이트를 받고, ID가 증가하는지 테스트"""
+        hub = SSEHub(backend_factory=InProcessBroadcastBackend)
+        data = SimpleNamespace(id=1, title="task", updated_at=datetime(2024, 1, 1), _sa_instance_state=object())
+
+        async def run():
+            subscriptions = [await hub.subscribe("project", "PRJ001") for _ in range(3)]
+            ids = [await hub.publish("project", "PRJ001", data) for _ in range(3)]
+            return ids, [[await s.get() for _ in range(3)] for s in subscriptions]
+
+        ids, received = asyncio.run(run())
+        assert ids == sorted(set(ids))
+        first = received[0][0]
+        assert all(frames[0] is first for frames in received)
+        assert parse(first) == {"id": str(ids[0]), "data": '{"id": 1, "title": "task", "updated_at": "2024-01-01T00:00:00"}'}
+
+    def test_last_event_id_replays_only_missed_events(self):
+        """Last-Event-ID로 재연결하면 버퍼에서 놓친 이벤트만 받고, 모르는 ID면 스냅샷이 필요한지 테스트"""
+        hub = SSEHub(replay_overlap=0, backend_factory=InProcessBroadcastBackend)
+
+        async def run():
+            first = await hub.subscribe("project", "PRJ001")
+            ids = [await hub.publish("project", "PRJ001", f'"event {i}"') for i in range(3)]
+            seen = [await first.get() for _ in range(2)]
+            await hub.unsubscribe(first)
+            # 연결이 끊긴 사이 발행된 이벤트도 버퍼에 남음
+            ids.append(await hub.publish("project", "PRJ001", '"event 3"'))
+
+            resumed = await hub.subscribe("project", "PRJ001", last_event_id=parse(seen[-1])["id"])
+            replay = [parse(await resumed.get())["data"] for _ in range(len(resumed))]
+            unknown = await hub.subscribe("project", "PRJ001", last_event_id="1")
+            return ids, resumed, replay, unknown
+
+        ids, resumed, replay, unknown = asyncio.run(run())
+        assert resumed.resumed and replay == ['"event 2"', '"event 3"']
+        assert not unknown.resumed and len(unknown) == 0
+        assert unknown.last_event_id == str(ids[-1])
+
+    def test_snapshot_carries_latest_event_id(self):
+        """스냅샷 프레임에 구독 시점의 마지막 이벤트 ID가 붙는지 테스트"""
+        hub = SSEHub(backend_factory=InProcessBroadcastBackend)
+
+        async def run():
+            empty = await hub.subscribe("project", "PRJ001")
+            event_id = await hub.publish("project", "PRJ001", "{}")
+            subscription = await hub.subscribe("project", "PRJ001")
+            return hub.snapshot(empty, {"a": 1}), hub.snapshot(subscription, {"a": 1}), event_id
+
+        empty_snapshot, snapshot, event_id = asyncio.run(run())
+        assert empty_snapshot == b'data: {"a": 1}\n\n'
+        assert parse(snapshot)["id"] == str(event_id)
+
+    def test_backend_subscription_follows_topic_lifetime(self):
+        """첫 구독자 때 백엔드를 구독하고, 마지막 구독자가 떠난 뒤 retention이 지나면 해제하는지 테스트"""
+        hub = SSEHub(retention=0.01, backend_factory=RecordingBackend)
+
+        async def run():
+            first = await hub.subscribe("project", "PRJ001")
+            second = await hub.subscribe("project", "PRJ001")
+            await hub.unsubscribe(first)
+            await hub.unsubscribe(first)
+            count = hub.subscriber_count("project", "PRJ001")
+            await hub.unsubscribe(second)
+            calls_before_expiry = list(hub.backend.calls)
+            await asyncio.sleep(0.05)
+            return count, calls_before_expiry
+
+        count, calls_before_expiry = asyncio.run(run())
+        assert count == 1
+        assert calls_before_expiry == [("subscribe", "project", "PRJ001")]
+        assert hub.backend.calls == [("subscribe", "project", "PRJ001"), ("unsubscribe", "project", "PRJ001")]
+
+    def test_stream_yields_initial_then_events_and_unsubscribes(self):
+        """stream이 초기 스냅샷 다음 이벤트를 보내고, 종료 시 구독을 해제하는지 테스트"""
+        hub = SSEHub(backend_factory=InProcessBroadcastBackend)
+
+        async def run():
+            subscription = await hub.subscribe("project", "PRJ001")
+            stream = hub.stream(subscription, initial=[hub.snapshot(subscription, [])])
+            chunks = [await stream.__anext__()]
+            await hub.publish("project", "PRJ001", '"update"')
+            chunks.append(await stream.__anext__())
+            await stream.aclose()
+            return chunks
+
+        chunks = asyncio.run(run())
+        assert chunks[0] == b"data: []\n\n"
+        assert parse(chunks[1])["data"] == '"update"'
+        assert hub.subscriber_count("project", "PRJ001") == 0
+
+    def test_events_reach_subscribers_on_other_workers(self):
+        """한 워커에서 발행한 이벤트가 같은 ID로 다른 워커의 구독자에게 전달되는지 테스트"""
+        broker = InMemoryBroker()
+        hubs = [
+            SSEHub(backend_factory=lambda deliver: RedisBroadcastBackend(deliver, client_factory=broker.client, prefix="teamup:sse"))
+            for _ in range(2)
+        ]
+
+        async def run():
+            local = await hubs[0].subscribe("notification", 7, policy=COALESCE)
+            remote = await hubs[1].subscribe("notification", 7, policy=COALESCE)
+            event_id = await hubs[0].publish("notification", 7, [1, 2])
+            frames = await asyncio.wait_for(asyncio.gather(local.get(), remote.get()), timeout=1)
+            for hub in hubs:
+                await hub.close()
+            return event_id, frames, len(local)
+
+        event_id, frames, remaining = asyncio.run(run())
+        assert frames[0] == frames[1] == f"id: {event_id}\ndata: [1, 2]\n\n".encode()
+        assert remaining == 0
+
+    def test_replay_across_workers_uses_event_ids(self):
+        """다른 워커로 재연결하면 버퍼 위치가 아니라 ID로 놓친 이벤트를 받고, 순서를 알 수 없으면 스냅샷이 필요한지 테스트"""
+        broker = InMemoryBroker()
+        hubs = [
+            SSEHub(backend_factory=lambda deliver: RedisBroadcastBackend(deliver, client_factory=broker.client, prefix="teamup:sse"))
+            for _ in range(2)
+        ]
+
+        async def run():
+            watchers = [await hub.subscribe("project", "PRJ001") for hub in hubs]
+            # 워커를 번갈아 가며 발행: 1번 워커는 0번 워커의 이벤트가 도착하기 전에 발행
+            for i in range(2):
+                await hubs[0].publish("project", "PRJ001", f'"event {2 * i}"')
+                await hubs[1].publish("project", "PRJ001", f'"event {2 * i + 1}"')
+            frames = await asyncio.wait_for(
+                asyncio.gather(*(asyncio.gather(*(watcher.get() for _ in range(4))) for watcher in watchers)), timeout=1
+            )
+
+            # 0번 워커에서 받은 순서 기준 두 번째 이벤트까지 받고 끊긴 클라이언트가 1번 워커로 재연결
+            last_id = parse(frames[0][1])["id"]
+            resumed = await hubs[1].subscribe("project", "PRJ001", last_event_id=last_id)
+            replay = [parse(await resumed.get())["data"] for _ in range(len(resumed))]
+
+            # 0번 워커의 시계가 10초 빠르면 그 뒤 1번 워커 이벤트의 ID가 더 작음
+            hubs[0]._last_id = time.time_ns() // 1000 + 10_000_000
+            ahead = await hubs[0].publish("project", "PRJ001", '"event 4"')
+            await asyncio.wait_for(watchers[1].get(), timeout=1)
+            await hubs[1].publish("project", "PRJ001", '"event 5"')
+            ambiguous = await hubs[1].subscribe("project", "PRJ001", last_event_id=str(ahead))
+            for hub in hubs:
+                await hub.close()
+            return frames, replay, resumed, ambiguous
+
+        frames, replay, resumed, ambiguous = asyncio.run(run())
+        orders = [[parse(frame)["data"] for frame in received] for received in frames]
+        assert orders[0] != orders[1]
+        # 버퍼 위치로 자르면 1번 워커에서는 놓친 이벤트가 모두 빠짐 (앞쪽에 도착했으므로)
+        assert orders[1].index(orders[0][1]) == 3
+        assert resumed.resumed
+        assert set(orders[0][2:]) <= set(replay) and orders[0][1] not in replay
+        assert not ambiguous.resumed and len(ambiguous) == 0
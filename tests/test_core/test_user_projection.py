@@ -0,0 +1,29 @@
+"""
+사용자 경량 조회(projection) 테스트
+"""
+from src.api.v1.models.association_tables import user_follows
+from src.api.v1.models.user.user import User
+from src.api.v1.repositories.user.user_repository import UserRepository
+from src.core.utils.user_projection import UserPrincipal, load_principal, load_principals
+
+
+class TestUserProjection:
+    """UserPrincipal 조회 테스트"""
+
+    def test_load_principals(self, db_session):
+        """기본 컬럼만 담은 객체를 세션 밖에서 반환하는지 테스트"""
+        db_session.add_all([
+            User(name="가", email="projection-a@example.com", job="developer"),
+            User(name="나", email="projection-b@example.com"),
+        ])
+        db_session.commit()
+
+        principals = load_principals(db_session, User.email.like("projection-%"))
+        assert sorted(p.name for p in principals) == ["가", "나"]
+        assert all(isinstance(p, UserPrincipal) for p in principals)
+        assert len(db_session.identity_map) == 0
+
+        principal = load_principal(db_session, User.email == "projection-a@example.com")
+        assert principal.job == "developer"
+        assert principal.created_at is not None
+        assert load_principal(db_session, User.email == "missing@example.com") is None
@@ -0,0 +1,164 @@
+"""
+조회수 쓰기 버퍼 테스트
+"""
+from sqlalchemy import event
+
+import src.api.v1.models  # noqa: F401
+from src.api.v1.models.community.post import Post
+from src.api.v1.models.community.post_stat import PostStat
+from src.api.v1.models.project.whiteboard import WhiteBoard, WhiteboardReaction
+from src.api.v1.models.user.user import User
+from src.api.v1.repositories.community.post_stat_repository import PostStatRepository
+from src.api.v1.repositories.project.whiteboard_repository import WhiteBoardRepository
+from src.core.utils.view_counter import ViewCounterBuffer
+
+
+class TestViewCounterBuffer:
+    """ViewCounterBuffer 테스트"""
+
+    def test_add_and_flush(self):
+        """증가분을 모아 종류별로 한 번에 반영하는지 테스트"""
+        applied = []
+        buffer = ViewCounterBuffer(session_factory=lambda: _FakeSession())
+        buffer.register("post", lambda db, deltas: applied.append(deltas))
+
+        for _ in range(100):
+            buffer.add("post", 1)
+        buffer.add("post", 2, 3)
+        assert buffer.pending("post", 1) == 100
+
+        assert buffer.flush() == 2
+        assert applied == [{1: 100, 2: 3}]
+        assert buffer.pending("post", 1) == 0
+        assert buffer.flush() == 0
+
+    def test_failed_flush_is_retried(self):
+        """반영에 실패한 증가분을 다음 반영 때 다시 시도하는지 테스트"""
+        attempts = []
+
+        def flusher(db, deltas):
+            attempts.append(deltas)
+            if len(attempts) == 1:
+                raise RuntimeError("db down")
+
+        buffer = ViewCounterBuffer(session_factory=lambda: _FakeSession())
+        buffer.register("post", flusher)
+        buffer.add("post", 1)
+
+        assert buffer.flush() == 0
+        assert buffer.pending("post", 1) == 1
+        buffer.add("post", 1)
+        assert buffer.flush() == 1
+        assert attempts[-1] == {1: 2}
+
+    def test_overflow_flushes_inline(self):
+        """대상 수가 max_keys에 닿으면 그 자리에서 반영하는지 테스트"""
+        applied = []
+        buffer = ViewCounterBuffer(max_keys=3, session_factory=lambda: _FakeSession())
+        buffer.register("post", lambda db, deltas: applied.append(deltas))
+
+        buffer.add("post", 1)
+        buffer.add("post", 2)
+        assert applied == []
+        buffer.add("post", 3)
+        assert applied == [{1: 1, 2: 1, 3: 1}]
+
+
+class TestViewFlushers:
+    """저장소별 조회수 반영 테스트"""
+
+    def _count_statements(self, db_session, func):
+        statements = []
+        engine = db_session.get_bind()
+
+        def listener(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            func()
+            return statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    def test_post_views_apply_atomically(self, db_session):
+        """게시글 조회수를 한 번의 UPDATE로 더하고 삭제된 게시글은 건너뛰는지 테스트"""
+        user = User(name="작성자", email="views-writer@example.com")
+        db_session.add(user)
+        db_session.flush()
+        posts = [Post(content=f"게시글 {i}", user_id=user.id) for i in range(3)]
+        db_session.add_all(posts)
+        db_session.flush()
+        post_ids = [post.id for post in posts]
+        repository = PostStatRepository(db_session)
+        repository.reconcile(post_ids)
+        db_session.commit()
+
+        deltas = {post_ids[0]: 500, post_ids[1]: 7, max(post_ids) + 100: 1}
+        statements = self._count_statements(db_session, lambda: repository.apply_views(deltas))
+        assert sum(1 for statement in statements if statement.lstrip().upper().startswith("UPDATE")) == 1
+
+        views = dict(db_session.query(PostStat.post_id, PostStat.view_count).filter(PostStat.post_id.in_(post_ids)))
+        assert views == {post_ids[0]: 500, post_ids[1]: 7, post_ids[2]: 0}
+
+    def test_post_views_tolerate_concurrent_row_creation(self, db_session, monkeypatch):
+        """다른 워커가 먼저 카운터 행을 만들어도 조회수 반영이 실패하지 않는지 테스트"""
+        user = User(name="작성자", email="views-race@example.com")
+        db_session.add(user)
+        db_session.flush()
+        post = Post(content="게시글", user_id=user.id)
+        db_session.add(post)
+        db_session.flush()
+        post_id = post.id
+        repository = PostStatRepository(db_session)
+        repository.reconcile([post_id])
+        db_session.commit()
+
+        # 행 존재 확인 뒤 다른 워커가 먼저 행을 만든 상황
+        original_query = db_session.query
+
+        def query(*entities, **kwargs):
+            if entities == (PostStat.post_id,):
+                return original_query(PostStat.post_id).filter(PostStat.post_id.is_(None))
+            return original_query(*entities, **kwargs)
+
+        monkeypatch.setattr(db_session, "query", query)
+        repository.apply_views({post_id: 3})
+        repository.increment(post_id, like_count=1)
+        monkeypatch.undo()
+
+        stat = db_session.get(PostStat, post_id)
+        assert (stat.view_count, stat.like_count) == (3, 1)
+
+    def test_whiteboard_views_apply(self, db_session):
+        """화이트보드 조회수를 기존 반응 행에 더하거나 새로 만드는지 테스트"""
+        user = User(name="작성자", email="views-board@example.com")
+        db_session.add(user)
+        db_session.flush()
+        boards = [
+            WhiteBoard(type="document", project_id="abc123", title=f"문서 {i}", created_by=user.id, updated_by=user.id)
+            for i in range(2)
+        ]
+        db_session.add_all(boards)
+        db_session.flush()
+        db_session.add(WhiteboardReaction(whiteboard_id=boards[0].id, views=10))
+        db_session.commit()
+
+        WhiteBoardRepository(db_session).apply_views({boards[0].id: 5, boards[1].id: 2})
+
+        views = dict(
+            db_session.query(WhiteboardReaction.whiteboard_id, WhiteboardReaction.views)
+            .filter(WhiteboardReaction.whiteboard_id.in_([board.id for board in boards]))
+        )
+        assert views == {boards[0].id: 15, boards[1].id: 2}
+
+
+class _FakeSession:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass